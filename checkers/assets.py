@@ -0,0 +1,25 @@
+# checkers/assets.py
+# Polices et images de l'interface : seul module de checkers/ (avec render.py
+# et game.py) qui importe pygame.
+
+import pygame
+from .constants import resource_path, WIDTH, HEIGHT
+
+pygame.font.init()
+
+# Polices pour le texte
+FONT_MENU = pygame.font.SysFont("comicsans", 70)
+FONT_SIDEBAR_TITLE = pygame.font.SysFont("comicsans", 30)
+FONT_SIDEBAR_BODY = pygame.font.SysFont("comicsans", 20)
+FONT_COORDS = pygame.font.SysFont("sans", 20)
+FONT_COPYRIGHT = pygame.font.SysFont("sans", 14)
+FONT_AI_STATS_LABEL = pygame.font.SysFont("consolas", 20, bold=True)
+FONT_AI_STATS_VALUE = pygame.font.SysFont("consolas", 20)
+# ==================================
+
+CROWN_PATH = resource_path('assets/crown.png')
+CROWN = pygame.transform.scale(pygame.image.load(CROWN_PATH), (44, 25))
+
+# Chargez l'image de fond du menu
+BACKGROUND_PATH = resource_path('assets/background.jpg')
+MENU_BACKGROUND = pygame.transform.scale(pygame.image.load(BACKGROUND_PATH), (WIDTH, HEIGHT))
@@ -1,26 +1,8 @@
-import pygame
-from .constants import BROWN, ROWS, CREAM, SQUARE_SIZE, COLS, BLACK
+from .constants import ROWS, CREAM, COLS, BLACK
 from .piece import Piece
+from .tables import SQUARES, SQUARE_INDEX, RAYS, NEIGHBOURS, JUMPS, UP_DIRECTIONS, DOWN_DIRECTIONS
 from minimax.algorithm import zobrist_table
-from checkers.constants import GREY, CROWN
-
-PIECE_SQUARE_TABLE = [
-    # Rangée 0 (Promotion) - Pas de bonus ici car la promotion est gérée par la création d'un roi
-    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], 
-    # Rangée 1 - Très proche de la promotion, forte valeur
-    [0.5, 0.0, 0.5, 0.0, 0.5, 0.0, 0.5, 0.0], 
-    # Rangée 2 - Bon contrôle et développement
-    [0.0, 0.3, 0.0, 0.4, 0.0, 0.4, 0.0, 0.3], 
-    # Rangée 3 - Cases centrales importantes
-    [0.3, 0.0, 0.2, 0.0, 0.2, 0.0, 0.3, 0.0], 
-    # Rangée 4 - Premières cases de développement
-    [0.0, 0.1, 0.0, 0.1, 0.0, 0.1, 0.0, 0.1], 
-    # Rangée 5 - Ligne de départ, valeur défensive
-    [0.1, 0.0, 0.1, 0.0, 0.1, 0.0, 0.1, 0.0], 
-    # Rangées 6 & 7 - Profond dans votre propre territoire, moins de valeur
-    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-]
+from minimax.evaluation import evaluate
 
 class Board:
      
@@ -30,6 +12,8 @@ class Board:
         self.cream_kings = self.black_kings = 0
         self.create_board()
         self.zobrist_hash = self.calculate_initial_hash()
+        # Accumulateur NNUE (minimax/nnue.py), attaché le temps d'une recherche
+        self.accumulator = None
 
     def __repr__(self) -> str:
         return "\n".join(
@@ -46,27 +30,33 @@ class Board:
                     h ^= zobrist_table[(piece.color, piece.king, r, c)]
         return h
     
-    # --- FONCTIONS D'AIDE POUR LA MISE À JOUR DU HASH ---
+    # --- FONCTIONS D'AIDE POUR LA MISE À JOUR DU HASH (ET DE L'ACCUMULATEUR NNUE) ---
     def update_hash_move(self, piece, old_row, old_col, new_row, new_col):
         """Met à jour le hash pour un simple mouvement."""
         self.zobrist_hash ^= zobrist_table[(piece.color, piece.king, old_row, old_col)] # Retire l'ancienne pos
         self.zobrist_hash ^= zobrist_table[(piece.color, piece.king, new_row, new_col)] # Ajoute la nouvelle pos
+        if self.accumulator is not None:
+            self.accumulator.move(piece.color, piece.king, old_row, old_col, new_row, new_col)
 
     def update_hash_promotion(self, piece):
-        """Met à jour le hash quand une pièce change entre pion et dame."""
+        """
+        Met à jour le hash quand une pièce change entre pion et dame. Appelée
+        avant le changement d'état : l'accumulateur lit piece.king.
+        """
         self.zobrist_hash ^= zobrist_table[(piece.color, False, piece.row, piece.col)] # XOR out l'état pion
         self.zobrist_hash ^= zobrist_table[(piece.color, True, piece.row, piece.col)]  # XOR in l'état dame
+        if self.accumulator is not None:
+            self.accumulator.toggle_king(piece.color, piece.king, piece.row, piece.col)
 
-    def update_hash_piece(self, piece):
-        """Met à jour le hash pour une pièce ajoutée ou retirée."""
+    def update_hash_piece(self, piece, added=False):
+        """Met à jour le hash pour une pièce ajoutée (`added`) ou retirée."""
         self.zobrist_hash ^= zobrist_table[(piece.color, piece.king, piece.row, piece.col)]
+        if self.accumulator is not None:
+            if added:
+                self.accumulator.add(piece.color, piece.king, piece.row, piece.col)
+            else:
+                self.accumulator.remove(piece.color, piece.king, piece.row, piece.col)
     
-    def draw_squares(self, win):
-        win.fill(BROWN)
-        for row in range(ROWS):
-            for col in range(row % 2, COLS, 2):
-                pygame.draw.rect(win, CREAM, (row*SQUARE_SIZE, col *SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-
     def move(self, piece, row, col):
         self.board[piece.row][piece.col], self.board[row][col] = self.board[row][col], self.board[piece.row][piece.col]
         piece.move(row, col)
@@ -96,36 +86,87 @@ class Board:
                         self.board[row].append(0)
                 else:
                     self.board[row].append(0)
-    
-    def draw(self, win, animation_data=None):
-        """
-        La méthode de dessin principale, gère maintenant une liste de pièces à cacher.
-        """
-        self.draw_squares(win)
-        
-        animating_piece = None
-        visually_removed = []
-        if animation_data:
-            animating_piece = animation_data['piece']
-            visually_removed = animation_data.get('visually_removed', [])
 
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    # On ne dessine pas la pièce qui est en cours d'animation
-                    # NI les pièces qui ont été capturées pendant l'animation
-                    if piece == animating_piece or piece in visually_removed:
-                        continue
-                    piece.draw(win)
-
-        # La pièce animée est toujours dessinée séparément par-dessus le reste
-        if animating_piece:
-            # On utilise les coordonnées interpolées de l'animation
-            pygame.draw.circle(win, GREY, (animation_data['current_x'], animation_data['current_y']), SQUARE_SIZE//2 - 15 + 2)
-            pygame.draw.circle(win, animating_piece.color, (animation_data['current_x'], animation_data['current_y']), SQUARE_SIZE//2 - 15)
-            if animating_piece.king:
-                win.blit(CROWN, (animation_data['current_x'] - CROWN.get_width()//2, animation_data['current_y'] - CROWN.get_height()//2))
+    @classmethod
+    def _from_squares(cls, squares):
+        """Plateau construit à partir de (index de case, couleur, dame) sans passer par __init__."""
+        board = cls.__new__(cls)
+        board.board = rows = [[0] * COLS for _ in range(ROWS)]
+        board.cream_left = board.black_left = 0
+        board.cream_kings = board.black_kings = 0
+        h = 0
+        for sq, color, king in squares:
+            row, col = SQUARES[sq]
+            piece = Piece(row, col, color)
+            if king:
+                piece.make_king()
+                if color == BLACK: board.black_kings += 1
+                else: board.cream_kings += 1
+            else:
+                if color == BLACK: board.black_left += 1
+                else: board.cream_left += 1
+            rows[row][col] = piece
+            h ^= zobrist_table[(color, king, row, col)]
+        board.zobrist_hash = h
+        board.accumulator = None
+        return board
+
+    # === Représentation texte compacte (32 cases jouables) ===
+    # Une lettre par case jouable, dans l'ordre de checkers/tables.py :
+    # 'b'/'B' = pion/dame noir, 'w'/'W' = pion/dame crème, '.' = vide.
+    @classmethod
+    def from_string(cls, text):
+        """Construit un plateau à partir de sa représentation sur 32 caractères."""
+        if len(text) != len(SQUARES):
+            raise ValueError(f"Position invalide (32 cases attendues) : {text!r}")
+        squares = []
+        for sq, symbol in enumerate(text):
+            if symbol == '.':
+                continue
+            if symbol not in 'bBwW':
+                raise ValueError(f"Symbole de case inconnu : {symbol!r}")
+            squares.append((sq, BLACK if symbol in 'bB' else CREAM, symbol.isupper()))
+        return cls._from_squares(squares)
+
+    def to_string(self):
+        """Représentation sur 32 caractères (inverse de from_string)."""
+        symbols = []
+        for row, col in SQUARES:
+            piece = self.board[row][col]
+            if piece == 0:
+                symbols.append('.')
+            else:
+                symbol = 'b' if piece.color == BLACK else 'w'
+                symbols.append(symbol.upper() if piece.king else symbol)
+        return "".join(symbols)
+
+    # === Instantané compact : quatre entiers de 32 bits (bit = index de case) ===
+    def snapshot(self):
+        """Retourne (pions noirs, dames noires, pions crème, dames crème)."""
+        black_men = black_kings = cream_men = cream_kings = 0
+        board = self.board
+        for sq, (row, col) in enumerate(SQUARES):
+            piece = board[row][col]
+            if piece:
+                bit = 1 << sq
+                if piece.color == BLACK:
+                    if piece.king: black_kings |= bit
+                    else: black_men |= bit
+                else:
+                    if piece.king: cream_kings |= bit
+                    else: cream_men |= bit
+        return black_men, black_kings, cream_men, cream_kings
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Reconstruit un plateau indépendant à partir de snapshot()."""
+        squares = []
+        for mask, color, king in zip(snapshot, (BLACK, BLACK, CREAM, CREAM), (False, True, False, True)):
+            while mask:
+                low = mask & -mask
+                squares.append((low.bit_length() - 1, color, king))
+                mask ^= low
+        return cls._from_squares(squares)
 
     def remove(self, pieces):
         for piece in pieces:
@@ -169,199 +210,198 @@ class Board:
         return None
     
     def get_valid_moves(self, piece):
-        moves = {}
+        """
+        Coups de `piece` pour l'interface : {case d'arrivée: détails}. Deux
+        prises qui arrivent sur la même case en prenant des pièces différentes
+        n'y gardent que la dernière trouvée ; le moteur passe par
+        get_capture_moves, qui les garde toutes.
+        """
         if piece.king:
             # Pour les rois, on cherche d'abord les sauts possibles.
-            jumps = self._find_king_jumps(piece.row, piece.col, piece.color, [])
+            jumps = {}
+            options = self._king_jump_options(piece.row, piece.col, piece.color, [])
+            if options:
+                self._collect_captures(piece, options, 1, jumps, [], [], [], maximal_only=False)
             
             # Si des sauts existent, ils sont obligatoires et sont les seuls coups valides.
             if jumps:
-                return jumps
+                return {landing: details for (landing, _), details in jumps.items()}
 
             # S'il n'y a pas de sauts, alors on cherche les mouvements simples.
-            moves.update(self._find_king_simple_moves(piece.row, piece.col))
-            return moves
-        else:
-            # La logique pour les pions reste inchangée.
-            left = piece.col - 1
-            right = piece.col + 1
-            row = piece.row
-            if piece.color == CREAM:
-                moves.update(self.traverse_left(row - 1, max(row-3, -1), -1, piece.color, left))
-                moves.update(self.traverse_right(row - 1, max(row-3, -1), -1, piece.color, right))
-            if piece.color == BLACK:
-                moves.update(self.traverse_left(row + 1, min(row+3, ROWS), 1, piece.color, left))
-                moves.update(self.traverse_right(row + 1, min(row+3, ROWS), 1, piece.color, right))
-        
+            return self._find_king_simple_moves(piece.row, piece.col)
+
+        # Pions : pas simples en avant, puis séquences de prise complètes
+        moves = self.get_simple_moves(piece)
+        directions = UP_DIRECTIONS if piece.color == CREAM else DOWN_DIRECTIONS
+        options = self._man_jump_options(piece.row, piece.col, piece.color, directions)
+        if options:
+            jumps = {}
+            self._collect_captures(piece, options, 1, jumps, [], [], [], maximal_only=False)
+            for (landing, _), details in jumps.items():
+                moves[landing] = details
         return moves
 
-    def _find_king_jumps(self, row, col, color, skipped):
+    def get_capture_moves(self, color):
         """
-        Fonction récursive qui trouve les séquences de sauts pour un roi.
-        Retourne maintenant un dictionnaire contenant les pièces sautées ET le chemin.
+        Retourne uniquement les prises de `color` qui respectent la règle de la
+        prise maximale : {pièce: [(case d'arrivée, détails), ...]}. Une même
+        case d'arrivée peut revenir pour des pièces prises différentes.
+        Les séquences plus courtes que la meilleure trouvée ne sont jamais
+        conservées ; les tampons de chemin et de pièces prises sont partagés
+        par toutes les pièces.
         """
-        jumps = {}
-        
-        for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-            opponent_found = None
-            
-            for i in range(1, ROWS):
-                r, c = row + i * dr, col + i * dc
-
-                if not (0 <= r < ROWS and 0 <= c < COLS):
-                    break
-
-                current_piece = self.board[r][c]
+        captures = {}
+        max_length = 1
+        captured, path, frames = [], [], []
+        directions = UP_DIRECTIONS if color == CREAM else DOWN_DIRECTIONS
+        for piece in self.get_all_pieces(color):
+            if piece.king:
+                options = self._king_jump_options(piece.row, piece.col, color, captured)
+            else:
+                options = self._man_jump_options(piece.row, piece.col, color, directions)
+            if not options:
+                continue
+            moves = {}
+            length = self._collect_captures(piece, options, max_length, moves,
+                                            captured, path, frames)
+            if moves:
+                if length > max_length:
+                    captures.clear()
+                    max_length = length
+                captures[piece] = [(landing, details) for (landing, _), details in moves.items()]
+        return captures
+
+    def get_simple_moves(self, piece):
+        """Déplacements sans prise de `piece` : {case d'arrivée: []}."""
+        if piece.king:
+            return self._find_king_simple_moves(piece.row, piece.col)
+        moves = {}
+        board = self.board
+        neighbours = NEIGHBOURS[SQUARE_INDEX[piece.row][piece.col]]
+        for d in (UP_DIRECTIONS if piece.color == CREAM else DOWN_DIRECTIONS):
+            step = neighbours[d]
+            if step is not None and not board[step[0]][step[1]]:
+                moves[step] = []
+        return moves
 
+    def _collect_captures(self, piece, options, min_length, moves, captured, path, frames,
+                          maximal_only=True):
+        """
+        Parcours en profondeur, avec une pile explicite, des séquences de prise
+        de `piece`, à partir de ses sauts possibles `options`. `captured` et
+        `path` sont des tampons réutilisés (pièces prises et cases d'arrivée de
+        la séquence en cours), `frames` la pile des sauts restant à essayer à
+        chaque niveau.
+
+        Chaque séquence terminale est ajoutée à `moves`, sous la clé (arrivée,
+        frozenset des pièces prises) : deux rafles de même longueur qui
+        finissent sur la même case sans prendre les mêmes pièces sont deux
+        coups, alors que deux chemins qui prennent les mêmes pièces donnent la
+        même position et n'en font qu'un. Détails : une liste de pièces pour un
+        pion, un dict {'skipped', 'path'} pour une dame. Avec `maximal_only`, seules les séquences d'au moins `min_length`
+        prises sont gardées et `moves` est vidé dès qu'une plus longue apparaît.
+        Retourne la longueur maximale retenue.
+        """
+        color = piece.color
+        king = piece.king
+        directions = UP_DIRECTIONS if color == CREAM else DOWN_DIRECTIONS
+        best = min_length
+        frames.append([options, 0])
+
+        while frames:
+            frame = frames[-1]
+            options, index = frame
+            if index == len(options):
+                frames.pop()
+                if frames:
+                    captured.pop()
+                    path.pop()
+                continue
+            frame[1] = index + 1
+
+            over, landing = options[index]
+            captured.append(over)
+            path.append(landing)
+            if king:
+                next_options = self._king_jump_options(landing[0], landing[1], color, captured)
+            else:
+                next_options = self._man_jump_options(landing[0], landing[1], color, directions)
+            if next_options:
+                frames.append([next_options, 0])
+                continue
+
+            # Séquence terminale
+            length = len(captured)
+            if not maximal_only or length >= best:
+                if maximal_only and length > best:
+                    moves.clear()
+                    best = length
+                key = (landing, frozenset(captured))
+                if king:
+                    moves[key] = {'skipped': captured[:], 'path': path[:]}
+                else:
+                    moves[key] = captured[:]
+            captured.pop()
+            path.pop()
+        return best
+
+    def _king_jump_options(self, row, col, color, captured):
+        """Sauts possibles d'une dame depuis (row, col) : liste de (pièce sautée, arrivée)."""
+        options = []
+        board = self.board
+        for ray in RAYS[SQUARE_INDEX[row][col]]:
+            opponent_found = None
+            for square in ray:
+                current_piece = board[square[0]][square[1]]
                 if opponent_found:
-                    if current_piece == 0:
-                        new_skipped = skipped + [opponent_found]
-                        # === On transmet le chemin via la récursion ===
-                        continuations = self._find_king_jumps(r, c, color, new_skipped)
-                        
-                        if not continuations:
-                            # Cas de base : c'est la fin de la séquence
-                            jumps[(r, c)] = {
-                                'skipped': new_skipped,
-                                'path': [(r, c)] # Le chemin est juste cette case
-                            }
-                        else:
-                            # Il y a d'autres sauts, on ajoute les chemins des continuations
-                            for landing_pos, data in continuations.items():
-                                # On préfixe le chemin avec notre case d'atterrissage actuelle
-                                data['path'].insert(0, (r, c))
-                                jumps[landing_pos] = data
-                    else:
+                    if current_piece:
                         break
-                elif current_piece != 0:
-                    if current_piece.color == color:
+                    options.append((opponent_found, square))
+                elif current_piece:
+                    # Une pièce déjà prise reste sur le plateau jusqu'à la fin de la rafle
+                    if current_piece.color == color or current_piece in captured:
                         break
-                    else:
-                        if current_piece not in skipped:
-                            opponent_found = current_piece
-                        else:
-                            break
-        return jumps
+                    opponent_found = current_piece
+        return options
+
+    def _man_jump_options(self, row, col, color, directions):
+        """Sauts possibles (vers l'avant) d'un pion depuis (row, col)."""
+        options = []
+        board = self.board
+        jumps = JUMPS[SQUARE_INDEX[row][col]]
+        for d in directions:
+            jump = jumps[d]
+            if jump is None:
+                continue
+            (over_row, over_col), landing = jump
+            over = board[over_row][over_col]
+            if over and over.color != color and not board[landing[0]][landing[1]]:
+                options.append((over, landing))
+        return options
 
     def _find_king_simple_moves(self, row, col):
         """Trouve les mouvements simples (non-capture) pour un roi."""
         moves = {}
-        # Itérer à travers les 4 directions diagonales
-        for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-            # Scanner le long de la diagonale
-            for i in range(1, ROWS):
-                r, c = row + i * dr, col + i * dc
-
-                if not (0 <= r < ROWS and 0 <= c < COLS):
-                    break # Hors du plateau
-
-                current_piece = self.board[r][c]
-                if current_piece == 0:
-                    moves[(r, c)] = [] # Case vide, mouvement valide
-                else:
-                    break 
-        return moves
-
-    def traverse_left(self, start, stop, step, color, left, skipped=[]):
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-            
-            current = self.board[r][left]
-            if current == 0:
-                if skipped and not last:
+        board = self.board
+        # Parcourir les 4 diagonales précalculées
+        for ray in RAYS[SQUARE_INDEX[row][col]]:
+            for r, c in ray:
+                if board[r][c]:
                     break
-                elif skipped:
-                    moves[(r, left)] = skipped + last
-                    new_skipped = skipped + last
-                else:
-                    new_skipped = last
-                    moves[(r, left)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self.traverse_left(r+step, row, step, color, left-1,new_skipped))
-                    moves.update(self.traverse_right(r+step, row, step, color, left+1,new_skipped))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-
-            left -= 1
-        
+                moves[(r, c)] = [] # Case vide, mouvement valide
         return moves
 
-    def traverse_right(self, start, stop, step, color, right, skipped=[]):
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if right >= COLS:
-                break
-            
-            current = self.board[r][right]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r,right)] = skipped + last
-                    new_skipped = skipped + last
-                else:
-                    new_skipped = last
-                    moves[(r, right)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self.traverse_left(r+step, row, step, color, right-1,new_skipped))
-                    moves.update(self.traverse_right(r+step, row, step, color, right+1,new_skipped))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-
-            right += 1
-        
-        return moves
-   
     def evaluate(self, color):
-        king_value = 1.8
-
-        black_score = self.black_left + self.black_kings * king_value
-        cream_score = self.cream_left + self.cream_kings * king_value
-        
-        # Ajout de l'évaluation positionnelle
-        for r in range(ROWS):
-            for c in range(COLS):
-                piece = self.board[r][c]
-                if piece != 0 and not piece.king: # On applique ceci uniquement aux pions
-                    if piece.color == CREAM:
-                        cream_score += PIECE_SQUARE_TABLE[r][c]
-                    else:
-                        # On inverse la table pour les noirs 
-                        black_score += PIECE_SQUARE_TABLE[7 - r][7 - c]
-        
-        if color == BLACK:
-            return black_score - cream_score
-        else:
-            return cream_score - black_score
-        
+        """
+        Évaluation statique, paramétrée par minimax/weights.json, ou réseau
+        NNUE si un accumulateur est attaché (minimax/nnue.py).
+        """
+        if self.accumulator is not None:
+            return self.accumulator.evaluate(color)
+        return evaluate(self, color)
 
     def get_all_pieces(self, color):
-        pieces = []
-        for row in self.board:
-            for piece in row:
-                if piece != 0 and piece.color == color:
-                    pieces.append(piece)
-        return pieces
+        return [piece for row in self.board for piece in row if piece and piece.color == color]
 
     def get_board(self):
         return self.board
@@ -437,7 +477,7 @@ class Board:
     def restore_skipped(self, skipped_pieces):
         """Restaure les pièces capturées sur le plateau."""
         for piece in skipped_pieces:
-            self.update_hash_piece(piece) # === HACHAGE : Un XOR annule un autre XOR ===
+            self.update_hash_piece(piece, added=True) # === HACHAGE : Un XOR annule un autre XOR ===
             self.board[piece.row][piece.col] = piece
             # Mettre à jour les comptes
             if piece.king:
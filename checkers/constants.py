@@ -1,11 +1,10 @@
 # checkers/constants.py
+# Constantes sans dépendance à pygame : le moteur (minimax, engine.py) les
+# importe sans ouvrir de fenêtre. Polices et images : checkers/assets.py.
 
-import pygame
 import os
 import sys
 
-pygame.font.init()
-
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -42,20 +41,4 @@ AI_GREEN = (34, 177, 76)
 AI_BLUE = (112, 146, 190)
 AI_GREY = (180, 180, 180)
 
-# Polices pour le texte
-FONT_MENU = pygame.font.SysFont("comicsans", 70)
-FONT_SIDEBAR_TITLE = pygame.font.SysFont("comicsans", 30)
-FONT_SIDEBAR_BODY = pygame.font.SysFont("comicsans", 20)
-FONT_COORDS = pygame.font.SysFont("sans", 20)
-FONT_COPYRIGHT = pygame.font.SysFont("sans", 14)
-FONT_AI_STATS_LABEL = pygame.font.SysFont("consolas", 20, bold=True)
-FONT_AI_STATS_VALUE = pygame.font.SysFont("consolas", 20)
-# ==================================
-
-CROWN_PATH = resource_path('assets/crown.png')
-CROWN = pygame.transform.scale(pygame.image.load(CROWN_PATH), (44, 25))
-
-# Chargez l'image de fond du menu
-BACKGROUND_PATH = resource_path('assets/background.jpg')
-MENU_BACKGROUND = pygame.transform.scale(pygame.image.load(BACKGROUND_PATH), (WIDTH, HEIGHT))
 # =====================
\ No newline at end of file
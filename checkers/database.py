@@ -0,0 +1,254 @@
+# checkers/database.py
+"""
+Base de positions binaire : enregistrements de taille fixe, lus par mmap.
+
+Fichier .db : un en-tête de 16 octets (MAGIC, version, taille d'un
+enregistrement) puis des enregistrements de 32 octets, petit-boutiste :
+    4 × uint32  bitboards (pions noirs, dames noires, pions crème, dames crème)
+    uint64      clé Zobrist (avec trait, comme l'historique des positions)
+    uint8       trait : 1 si noir, 0 si crème
+    int8        résultat de la partie, vu de crème : 1, 0 (nulle), -1, ou
+                RESULT_UNKNOWN
+    uint16      coup joué (encode_move), NO_MOVE si aucun
+    4 octets    réservés
+
+Le lecteur (PositionDB) ne copie pas le fichier : l'itération décode les
+enregistrements directement dans la projection mémoire. Le fichier .idx
+associé (build_index) contient les couples (clé, numéro d'enregistrement)
+triés par clé ; lookup() y fait une recherche dichotomique, elle aussi sur
+une projection mémoire.
+
+Exemple :
+    with PositionDBWriter("selfplay.db") as writer:
+        writer.append(position, result=1, move=key)
+    db = PositionDB("selfplay.db")
+    for record in db:
+        ...
+    build_index("selfplay.db")
+    db = PositionDB("selfplay.db")
+    records = db.lookup(board_key)
+"""
+import bisect
+import mmap
+import os
+import struct
+from typing import NamedTuple
+
+from .constants import BLACK, CREAM
+from .tables import SQUARES
+from minimax.algorithm import zobrist_table, zobrist_turn_black
+
+MAGIC = b"DAMESDB1"
+INDEX_MAGIC = b"DAMESIX1"
+VERSION = 1
+_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct("<4IQBbH4x")
+_INDEX_ENTRY = struct.Struct("<QI4x")
+
+RESULT_UNKNOWN = -128
+NO_MOVE = 0xFFFF
+FLUSH_SIZE = 1 << 20    # octets accumulés avant écriture
+
+
+class Record(NamedTuple):
+    black_men: int
+    black_kings: int
+    cream_men: int
+    cream_kings: int
+    key: int
+    black_to_move: int
+    result: int
+    move: int
+
+    @property
+    def side(self):
+        return 'b' if self.black_to_move else 'w'
+
+    @property
+    def snapshot(self):
+        return self[:4]
+
+
+# === Clés et coups ===
+# Clé Zobrist de chaque (bitboard, case), dans l'ordre des champs de Record
+_SQUARE_KEYS = [[zobrist_table[(color, king, row, col)] for row, col in SQUARES]
+                for color, king in ((BLACK, False), (BLACK, True), (CREAM, False), (CREAM, True))]
+
+
+def position_key(black_men, black_kings, cream_men, cream_kings, side):
+    """Clé Zobrist calculée sur les bitboards : égale à board.zobrist_hash (^ trait noir)."""
+    key = zobrist_turn_black if side == 'b' else 0
+    for keys, mask in zip(_SQUARE_KEYS, (black_men, black_kings, cream_men, cream_kings)):
+        while mask:
+            low = mask & -mask
+            key ^= keys[low.bit_length() - 1]
+            mask ^= low
+    return key
+
+
+def encode_move(key):
+    """Clé de coup (move_to_key) -> uint16 : départ | arrivée << 5 | prise << 10."""
+    if key is None:
+        return NO_MOVE
+    start_row, start_col, end_row, end_col, skipped = key
+    return (start_row * 4 + start_col // 2) | (end_row * 4 + end_col // 2) << 5 | bool(skipped) << 10
+
+
+def decode_move(code):
+    """uint16 -> (case de départ, case d'arrivée, prise) en index de case, ou None."""
+    if code == NO_MOVE:
+        return None
+    return code & 31, code >> 5 & 31, bool(code >> 10 & 1)
+
+
+def _check_header(data, path, magic):
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} : fichier trop court")
+    found, version, size = _HEADER.unpack_from(data)
+    entry = _RECORD if magic == MAGIC else _INDEX_ENTRY
+    if found != magic or version != VERSION or size != entry.size:
+        raise ValueError(f"{path} : format inconnu ({found!r}, version {version})")
+
+
+# === Écriture ===
+class PositionDBWriter:
+    """Ajout en bloc d'enregistrements à un fichier .db (créé s'il n'existe pas)."""
+
+    def __init__(self, path):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "wb")
+        if exists:
+            _check_header(self.file.read(_HEADER.size), path, MAGIC)
+            self.file.seek(0, os.SEEK_END)
+        else:
+            self.file.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size))
+        self.buffer = bytearray()
+        self.count = 0
+
+    def append(self, position, result=RESULT_UNKNOWN, move=None):
+        """
+        Ajoute `position` (Position ou tout tuple commençant par les quatre
+        bitboards et le trait), le résultat de sa partie vu de crème et le
+        coup joué (clé move_to_key).
+        """
+        black_men, black_kings, cream_men, cream_kings, side = position[:5]
+        self.buffer += _RECORD.pack(black_men, black_kings, cream_men, cream_kings,
+                                    position_key(black_men, black_kings, cream_men,
+                                                 cream_kings, side),
+                                    side == 'b', result, encode_move(move))
+        self.count += 1
+        if len(self.buffer) >= FLUSH_SIZE:
+            self.flush()
+
+    def extend(self, entries):
+        """Ajoute des (position, résultat, coup)."""
+        for position, result, move in entries:
+            self.append(position, result, move)
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# === Lecture ===
+class _IndexKeys:
+    """Séquence des clés du fichier .idx, pour bisect."""
+
+    def __init__(self, data, count):
+        self.data = data
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return _INDEX_ENTRY.unpack_from(self.data, _HEADER.size + i * _INDEX_ENTRY.size)[0]
+
+
+class PositionDB:
+    """Lecture d'un fichier .db par projection mémoire (et de son .idx s'il existe)."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self.data, path, MAGIC)
+        self.count = (len(self.data) - _HEADER.size) // _RECORD.size
+        self.index = None
+        index_path = path + ".idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            _check_header(index, index_path, INDEX_MAGIC)
+            entries = (len(index) - _HEADER.size) // _INDEX_ENTRY.size
+            # Un index plus ancien que la base ne couvre pas les derniers ajouts
+            self.index = _IndexKeys(index, entries) if entries == self.count else None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return Record._make(_RECORD.unpack_from(self.data, _HEADER.size + i * _RECORD.size))
+
+    def __iter__(self):
+        view = memoryview(self.data)[_HEADER.size:_HEADER.size + self.count * _RECORD.size]
+        try:
+            for fields in _RECORD.iter_unpack(view):
+                yield Record._make(fields)
+        finally:
+            view.release()
+
+    def lookup(self, key):
+        """Numéros des enregistrements de clé `key` (nécessite build_index)."""
+        if self.index is None:
+            raise ValueError(f"{self.path} : pas d'index à jour (voir build_index)")
+        keys = self.index
+        found = []
+        i = bisect.bisect_left(keys, key)
+        while i < len(keys) and keys[i] == key:
+            found.append(_INDEX_ENTRY.unpack_from(keys.data, _HEADER.size + i * _INDEX_ENTRY.size)[1])
+            i += 1
+        return found
+
+    def close(self):
+        if self.index is not None:
+            self.index.data.close()
+        self.data.close()
+
+
+def truncate(path, count):
+    """Ramène la base `path` à ses `count` premiers enregistrements (reprise après interruption)."""
+    os.truncate(path, _HEADER.size + count * _RECORD.size)
+
+
+def build_index(path):
+    """Écrit `path`.idx : (clé, numéro d'enregistrement) triés par clé."""
+    db = PositionDB(path)
+    try:
+        view = memoryview(db.data)[_HEADER.size:_HEADER.size + db.count * _RECORD.size]
+        entries = sorted((fields[4], i) for i, fields in enumerate(_RECORD.iter_unpack(view)))
+        view.release()
+    finally:
+        db.close()
+    with open(path + ".idx", "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, VERSION, _INDEX_ENTRY.size))
+        f.write(b"".join(_INDEX_ENTRY.pack(key, i) for key, i in entries))
+    return len(entries)
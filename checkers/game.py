@@ -1,13 +1,14 @@
-import pygame
-from .constants import CREAM, BLACK, BLUE, SQUARE_SIZE, ROWS, COLS
+from .constants import CREAM, BLACK, SQUARE_SIZE, ROWS, COLS
 from checkers.board import Board
-from minimax.algorithm import zobrist_turn_black
-from copy import deepcopy
+from checkers.render import BoardRenderer
+from checkers.position import Position
+from minimax.algorithm import zobrist_turn_black, apply_move, revert_move
 
 class Game:
     def __init__(self, win):
         self._init()
         self.win = win
+        self.renderer = None # Créé au premier dessin (Game(None) sert sans fenêtre)
         self.animation_data = None  # Stockera les infos du coup à animer
         self.animation_speed = 15  # Vitesse de l'animation (plus élevé = plus rapide)
         self.black_wins = 0
@@ -22,10 +23,11 @@ class Game:
         self.last_ai_depth = 0
         self.last_ai_score = 0.0
         self.last_ai_time = 0.0
+        self.last_ai_pv = [] # Variation principale de la dernière recherche
         self.move_counter = 0 # Compteur de demi-coups total
         self.last_ai_plies_to_win = 0 # Nombre de demi-coups calculé par l'IA
         self.calculation_move_counter = -1 # Le moment où le calcul a été fait
-        self.game_state_history = [] # Historique des états du jeu pour l'annulation des coups
+        self.move_log = [] # Journal des coups joués (enregistrements d'annulation)
     
     def is_animating(self):
         """Retourne True si une animation est en cours."""
@@ -34,17 +36,27 @@ class Game:
     def update(self):
         """
         La méthode de mise à jour principale. Gère maintenant la logique d'animation.
+        Retourne les rectangles de la fenêtre redessinés (pour pygame.display.update).
         """
         # S'il y a une animation en cours, on la met à jour.
         if self.is_animating():
             self._update_animation()
         
-        # On dessine le plateau. La méthode draw saura gérer l'animation.
-        self.board.draw(self.win, self.animation_data)
-        
+        if self.renderer is None:
+            self.renderer = BoardRenderer(self.win)
+
         # N'afficher les coups que si c'est au tour du joueur humain
+        markers = ()
         if not self.is_animating() and not self.ai_is_thinking and self.turn == self.player_color:
-            self.draw_valid_moves(self.valid_moves)
+            markers = self.valid_moves
+
+        # On dessine le plateau. Le renderer saura gérer l'animation.
+        return self.renderer.draw(self.board, self.animation_data, markers)
+
+    def invalidate(self):
+        """Force le prochain update() à redessiner tout le plateau."""
+        if self.renderer is not None:
+            self.renderer.invalidate()
 
     # === Pour changer la couleur du joueur ===
     def set_player_color(self, color):
@@ -182,35 +194,27 @@ class Game:
         """Termine l'animation et met à jour l'état du jeu ET l'historique."""
         if not self.animation_data: return
 
-        # === Sauvegarder l'état AVANT d'effectuer le coup ===
-        # On sauvegarde les données essentielles qui définissent l'état actuel.
-        current_state = {
-            'board': deepcopy(self.board),
-            'turn': self.turn,
-            'moves_since_capture': self.moves_since_capture,
-            'position_history': self.position_history.copy(),
-            'move_counter': self.move_counter,
-            # On ne sauvegarde pas les stats de l'IA, elles ne font pas partie de l'état du jeu
-        }
-        self.game_state_history.append(current_state)
-
         piece = self.animation_data['piece']
         final_row = int(self.animation_data['target_y'] // SQUARE_SIZE)
         final_col = int(self.animation_data['current_x'] // SQUARE_SIZE)
         
         # On utilise la liste des pièces visuellement retirées
         removed_pieces = self.animation_data.get('visually_removed', [])
+        self.play_move(piece, final_row, final_col, removed_pieces)
         
-        # 1. Retirer les pièces (cette fonction met à jour le hash)
-        if removed_pieces:
-            self.board.remove_and_get_skipped(removed_pieces)
-            self.moves_since_capture = 0
-        else:
-            self.moves_since_capture += 1
-            
-        # 2. Déplacer la pièce (cette fonction met à jour le hash et gère la promotion)
-        self.board.make_move(piece, final_row, final_col)
-        
+        self.animation_data = None
+
+    def play_move(self, piece, row, col, skipped):
+        """
+        Joue un coup sur le plateau et l'inscrit dans le journal.
+        Chaque entrée ne contient que de quoi le défaire : l'enregistrement
+        d'annulation de apply_move, le compteur de la règle des 40 coups et
+        la clé ajoutée à l'historique des positions.
+        """
+        undo = apply_move(self.board, (piece, (row, col), skipped))
+        previous_moves_since_capture = self.moves_since_capture
+        self.moves_since_capture = 0 if skipped else self.moves_since_capture + 1
+
         self.change_turn()
         self.move_counter += 1  # Incrémenter le compteur de demi-coups
         
@@ -218,10 +222,20 @@ class Game:
         current_hash = self.board.zobrist_hash
         if self.turn == BLACK:
             current_hash ^= zobrist_turn_black
-        
         self.position_history[current_hash] = self.position_history.get(current_hash, 0) + 1
-        
-        self.animation_data = None
+
+        self.move_log.append((undo, previous_moves_since_capture, current_hash))
+
+    def _unplay_move(self):
+        """Défait le dernier coup du journal."""
+        undo, previous_moves_since_capture, position_key = self.move_log.pop()
+        self.position_history[position_key] -= 1
+        if self.position_history[position_key] == 0:
+            del self.position_history[position_key]
+        revert_move(self.board, undo)
+        self.moves_since_capture = previous_moves_since_capture
+        self.move_counter -= 1
+        self.change_turn()
     
     def _init(self):
         self.selected = None
@@ -235,10 +249,11 @@ class Game:
         self.last_ai_depth = 0
         self.last_ai_score = 0.0
         self.last_ai_time = 0.0
+        self.last_ai_pv = []
         self.move_counter = 0
         self.last_ai_plies_to_win = 0
         self.calculation_move_counter = -1
-        self.game_state_history = []
+        self.move_log = []
     
     def update_winner(self):
         """Vérifie s'il y a un gagnant et met à jour l'état du jeu."""
@@ -265,41 +280,13 @@ class Game:
     def _get_all_mandatory_moves_for_turn(self, color):
         """
         Analyse tout le plateau et retourne UNIQUEMENT les coups qui
-        respectent la règle de la capture maximale. (Version finale et corrigée)
+        respectent la règle de la capture maximale.
         """
-        all_capture_moves = []
-        max_skipped_len = 0
-
-        # Étape 1 : Collecter toutes les captures et trouver la VRAIE longueur maximale
-        for piece in self.board.get_all_pieces(color):
-            valid_moves = self.board.get_valid_moves(piece)
-            for move, details in valid_moves.items():
-
-                # --- Extraire la VRAIE liste des pièces sautées ---
-                skipped_list = []
-                if isinstance(details, dict):
-                    skipped_list = details.get('skipped', [])
-                elif isinstance(details, list) and details:
-                    skipped_list = details
-
-                if skipped_list: # Si c'est bien une capture
-                    all_capture_moves.append((piece, move, details))
-                    # On utilise la longueur de la VRAIE liste pour trouver le max
-                    if len(skipped_list) > max_skipped_len:
-                        max_skipped_len = len(skipped_list)
-        
-        if not all_capture_moves:
-            return []
-
-        # Étape 2 : Filtrer pour ne garder que les coups de la VRAIE longueur maximale
-        final_mandatory_moves = []
-        for p, m, details in all_capture_moves:
-            # On extrait à nouveau la VRAIE liste pour la comparaison
-            skipped_list = details.get('skipped', []) if isinstance(details, dict) else details
-            if len(skipped_list) == max_skipped_len:
-                final_mandatory_moves.append((p, m, details))
-        
-        return final_mandatory_moves
+        return [
+            (piece, move, details)
+            for piece, moves in self.board.get_capture_moves(color).items()
+            for move, details in moves
+        ]
 
     def select(self, row, col):
         # Étape 1 : Gérer la tentative de DÉPLACEMENT si une pièce est déjà sélectionnée.
@@ -383,11 +370,6 @@ class Game:
         
         return False # Le clic n'était pas un coup valide
 
-    def draw_valid_moves(self, moves):
-        for move in moves:
-            row, col = move
-            pygame.draw.circle(self.win, BLUE, (col * SQUARE_SIZE + SQUARE_SIZE//2, row * SQUARE_SIZE + SQUARE_SIZE//2), 15)
-
     def change_turn(self):
         self.valid_moves = {}
         if self.turn == CREAM:
@@ -400,6 +382,11 @@ class Game:
     
     def get_configuration(self):
         return self.board.get_board()
+
+    def get_position(self):
+        """Position immuable (plateau, trait, compteurs, répétitions) à transmettre à l'IA."""
+        return Position.from_board(self.board, self.turn, self.moves_since_capture,
+                                   (key for _, _, key in self.move_log))
     
     # === La logique pour annuler un coup ===
     def undo_move(self):
@@ -409,22 +396,14 @@ class Game:
         """
         # Le joueur ne peut cliquer sur "Undo" que lorsque c'est son tour.
         # Cela signifie qu'un coup du joueur et un coup de l'IA ont eu lieu.
-        # Nous avons donc besoin d'au moins 2 états dans l'historique.
-        if len(self.game_state_history) < 2:
+        # Nous avons donc besoin d'au moins 2 coups dans le journal.
+        if len(self.move_log) < 2:
             print("Undo failed: Not enough history to undo a full turn.")
             return
 
-        # 1. Annuler la réponse de l'IA (on retire l'état de la pile, mais on ne l'utilise pas)
-        self.game_state_history.pop()
-        
-        # 2. Annuler le coup du joueur (on retire l'état et on le restaure)
-        state_to_restore = self.game_state_history.pop()
-        
-        self.board = state_to_restore['board']
-        self.turn = state_to_restore['turn']
-        self.moves_since_capture = state_to_restore['moves_since_capture']
-        self.position_history = state_to_restore['position_history']
-        self.move_counter = state_to_restore['move_counter']
+        # 1. Annuler la réponse de l'IA, 2. annuler le coup du joueur
+        self._unplay_move()
+        self._unplay_move()
 
         # Réinitialiser les états d'interaction et de fin de partie
         self.selected = None
@@ -435,4 +414,5 @@ class Game:
         self.last_ai_score = 0.0
         self.last_ai_depth = 0
         self.last_ai_time = 0.0
+        self.last_ai_pv = []
         
@@ -0,0 +1,23 @@
+# checkers/notation.py
+"""
+Notation des coups pour l'affichage : colonnes a-h, rangées 8-1 (la rangée 8
+est celle du haut, camp noir), comme les coordonnées dessinées par
+l'interface. "-" pour un déplacement, "x" pour une prise : "c3-d4", "c3xe5".
+Ce module ne dépend pas de pygame.
+"""
+
+
+def square_name(row, col):
+    return f"{chr(ord('a') + col)}{8 - row}"
+
+
+def format_move_key(key):
+    """Clé de coup (voir minimax.algorithm.move_to_key) -> "c3-d4" ou "c3xe5"."""
+    start_row, start_col, end_row, end_col, skipped = key
+    separator = "x" if skipped else "-"
+    return f"{square_name(start_row, start_col)}{separator}{square_name(end_row, end_col)}"
+
+
+def format_pv(pv):
+    """Variation principale (liste de clés) -> "c3-d4 b6-c5 d4xb6"."""
+    return " ".join(format_move_key(key) for key in pv)
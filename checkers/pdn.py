@@ -0,0 +1,326 @@
+# checkers/pdn.py
+"""
+Notation FEN et parties PDN pour les règles espagnoles du jeu.
+
+Cases : numérotées de 1 à 32 ligne par ligne depuis la rangée du fond noire,
+de gauche à droite (case n = index de case n - 1, voir checkers/tables.py) :
+1 = b8, 4 = h8, 29 = a1, 32 = g1. Blanc (W) désigne le camp crème, qui
+joue en premier ; Noir (B) le camp noir.
+
+FEN (format PDN) : trait, puis les pièces de chaque camp, "K" devant une
+dame ; les plages "1-12" sont acceptées à la lecture :
+    W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12
+    B:WK29,18:B1-4,K12
+
+Coups PDN : case de départ et d'arrivée, "-" pour un déplacement, "x" pour
+une prise ("22-18", "15x22"). Les cases intermédiaires d'une rafle
+("15x22x31") ne servent qu'à choisir entre deux prises de la même case vers
+la même case qui ne prennent pas les mêmes pièces ; sans elles, la première
+trouvée est jouée.
+
+Ce module ne dépend pas de pygame ; parse_fen n'utilise que des opérations
+sur les chaînes et les entiers, pour lire rapidement des millions de
+positions (tools/tune.py, tools/analysis_server.py).
+"""
+import re
+from typing import NamedTuple
+
+from .board import Board
+from .constants import BLACK, CREAM
+from .position import Position
+from .tables import SQUARES, SQUARE_INDEX
+from minimax.algorithm import apply_move, get_possible_moves, move_to_key, zobrist_turn_black
+
+START_FEN = "W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12"
+GAME_TYPE = "24"    # Dames espagnoles (tag [GameType] du PDN)
+
+_BITS = {str(sq + 1): 1 << sq for sq in range(len(SQUARES))}
+_RESULTS = ("1-0", "0-1", "1/2-1/2", "2-0", "0-2", "1-1", "0-0", "*")
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_MOVE = re.compile(r"\d+(?:[-x]\d+)+")
+
+
+def square_number(row, col):
+    return SQUARE_INDEX[row][col] + 1
+
+
+def square_coords(number):
+    return SQUARES[number - 1]
+
+
+# === FEN ===
+def _parse_squares(tokens, masks, offset):
+    for token in tokens.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        king = token[0] in "Kk"
+        if king:
+            token = token[1:]
+        if "-" in token:
+            first, last = token.split("-")
+            bits = 0
+            for number in range(int(first), int(last) + 1):
+                bits |= _BITS[str(number)]
+        else:
+            bits = _BITS[token]
+        masks[offset + king] |= bits
+
+
+def parse_fen(text):
+    """
+    FEN -> (pions noirs, dames noires, pions crème, dames crème, trait 'b'/'w') :
+    les champs de Position. ValueError si la chaîne est invalide.
+    """
+    fields = text.strip().strip('"').split(":")
+    side = fields[0].strip().upper()
+    if side not in ("W", "B"):
+        raise ValueError(f"FEN invalide (trait) : {text!r}")
+    masks = [0, 0, 0, 0]
+    try:
+        for field in fields[1:]:
+            field = field.strip()
+            if not field:
+                continue
+            color = field[0].upper()
+            if color == "W":
+                _parse_squares(field[1:], masks, 2)
+            elif color == "B":
+                _parse_squares(field[1:], masks, 0)
+            else:
+                raise ValueError(field)
+    except (KeyError, ValueError):
+        raise ValueError(f"FEN invalide : {text!r}") from None
+    if (masks[0] | masks[1]) & (masks[2] | masks[3]) or masks[0] & masks[1] or masks[2] & masks[3]:
+        raise ValueError(f"FEN invalide (case occupée deux fois) : {text!r}")
+    return masks[0], masks[1], masks[2], masks[3], side.lower()
+
+
+def _format_squares(men, kings):
+    squares = []
+    for sq in range(len(SQUARES)):
+        bit = 1 << sq
+        if men & bit:
+            squares.append(str(sq + 1))
+        elif kings & bit:
+            squares.append(f"K{sq + 1}")
+    return ",".join(squares)
+
+
+def format_fen(black_men, black_kings, cream_men, cream_kings, side):
+    """Inverse de parse_fen ; `side` : 'b' ou 'w'."""
+    return (f"{side.upper()}:W{_format_squares(cream_men, cream_kings)}"
+            f":B{_format_squares(black_men, black_kings)}")
+
+
+def parse_board_string(text):
+    """"<32 cases> <b|w>" (Board.to_string() et trait) -> mêmes champs que parse_fen."""
+    fields = text.split()
+    if len(fields) != 2 or len(fields[0]) != len(SQUARES) or fields[1] not in ("b", "w"):
+        raise ValueError(f"position invalide : {text!r}")
+    masks = [0, 0, 0, 0]
+    for sq, symbol in enumerate(fields[0]):
+        if symbol != ".":
+            index = "bBwW".find(symbol)
+            if index < 0:
+                raise ValueError(f"position invalide : {text!r}")
+            masks[index] |= 1 << sq
+    return masks[0], masks[1], masks[2], masks[3], fields[1]
+
+
+def parse_position(text):
+    """FEN, ou "<32 cases> <b|w>" -> Position (sans historique)."""
+    if ":" in text:
+        return Position(*parse_fen(text))
+    return Position(*parse_board_string(text))
+
+
+def position_fen(position):
+    return format_fen(*position[:5])
+
+
+# === Coups ===
+def format_pdn_move(key):
+    """Clé de coup (voir minimax.algorithm.move_to_key) -> "22-18" ou "15x22"."""
+    start_row, start_col, end_row, end_col, skipped = key
+    separator = "x" if skipped else "-"
+    return f"{square_number(start_row, start_col)}{separator}{square_number(end_row, end_col)}"
+
+
+def landing_squares(move):
+    """Cases d'arrivée successives d'un coup de get_possible_moves, rafle comprise."""
+    piece, landing, details = move
+    if isinstance(details, dict):
+        return list(details["path"])
+    squares = []
+    row, col = piece.row, piece.col
+    for captured in details:
+        # Un pion saute juste derrière la pièce prise
+        row, col = 2 * captured.row - row, 2 * captured.col - col
+        squares.append((row, col))
+    return squares or [landing]
+
+
+def _follows(squares, path):
+    """True si `squares` apparaît dans `path` dans le même ordre."""
+    remaining = iter(path)
+    return all(square in remaining for square in squares)
+
+
+def find_pdn_move(moves, text):
+    """Coup de `moves` (liste de get_possible_moves) noté `text`, ou None."""
+    numbers = re.split(r"[-x]", text)
+    try:
+        start = square_coords(int(numbers[0]))
+        squares = [square_coords(int(number)) for number in numbers[1:]]
+    except (ValueError, IndexError):
+        return None
+    if not squares:
+        return None
+    end = squares[-1]
+    for move in moves:
+        piece, landing, _ = move
+        if landing == end and (piece.row, piece.col) == start:
+            if len(squares) == 1 or _follows(squares, landing_squares(move)):
+                return move
+    return None
+
+
+# === Parties PDN ===
+class PdnGame(NamedTuple):
+    tags: dict      # {"Event": ..., "FEN": ..., ...}
+    moves: list     # coups de la ligne principale, notation PDN
+    result: str     # "1-0", "0-1", "1/2-1/2", "*"...
+
+    @property
+    def fen(self):
+        return self.tags.get("FEN", START_FEN)
+
+
+def _strip_movetext(text):
+    """Retire commentaires {...} et ;..., variantes (...) et NAG $n du texte des coups."""
+    out = []
+    depth = 0
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == "{":
+            end = text.find("}", i)
+            i = length if end < 0 else end + 1
+            continue
+        if char == ";":
+            end = text.find("\n", i)
+            i = length if end < 0 else end + 1
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _make_game(tags, movetext):
+    tokens = _strip_movetext(movetext).split()
+    moves = []
+    result = tags.get("Result", "*")
+    for token in tokens:
+        if token in _RESULTS:
+            result = token
+            continue
+        match = _MOVE.search(token)  # retire "12." ou "12..." collés au coup
+        if match:
+            moves.append(match.group())
+    return PdnGame(tags, moves, result)
+
+
+def read_pdn(lines):
+    """
+    Lit des parties PDN depuis un itérable de lignes (fichier ouvert, liste...)
+    et les rend une à une (PdnGame). Seule la ligne principale est gardée.
+    """
+    tags = {}
+    movetext = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("["):
+            if movetext and any(part.strip() for part in movetext):
+                yield _make_game(tags, "\n".join(movetext))
+                tags, movetext = {}, []
+            for key, value in _TAG.findall(stripped):
+                tags[key] = value.replace('\\"', '"')
+        elif stripped:
+            movetext.append(stripped)
+            # Un résultat termine la partie, même sans ligne vide derrière
+            if stripped.split()[-1] in _RESULTS:
+                yield _make_game(tags, "\n".join(movetext))
+                tags, movetext = {}, []
+    if tags or any(part.strip() for part in movetext):
+        yield _make_game(tags, "\n".join(movetext))
+
+
+def format_pdn(game, width=80):
+    """PdnGame -> texte PDN (tags puis coups numérotés, lignes d'au plus `width` caractères)."""
+    tags = dict(game.tags)
+    tags.setdefault("GameType", GAME_TYPE)
+    tags["Result"] = game.result
+    lines = [f'[{key} "{str(value).replace(chr(34), chr(92) + chr(34))}"]'
+             for key, value in tags.items()]
+    lines.append("")
+
+    # Numérotation : le premier coup est blanc sauf si la FEN donne le trait à noir
+    black_first = game.fen.strip().upper().startswith("B")
+    tokens = []
+    for ply, move in enumerate(game.moves):
+        index = ply + black_first
+        if index % 2 == 0:
+            tokens.append(f"{index // 2 + 1}.")
+        elif ply == 0:
+            tokens.append(f"{index // 2 + 1}...")
+        tokens.append(move)
+    tokens.append(game.result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > width:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def replay(game):
+    """
+    Rejoue la ligne principale de `game` depuis sa FEN. Rend (position, coup)
+    avant chaque coup, puis (position finale, None) ; les positions portent
+    l'historique et le compteur de la règle des 40 coups, comme
+    Game.get_position(). ValueError si un coup est illégal.
+    """
+    position = parse_position(game.fen)
+    board = Board.from_snapshot(position[:4])
+    color = position.turn
+    moves_since_capture = 0
+    history = []
+    for text in game.moves:
+        position = Position.from_board(board, color, moves_since_capture, history)
+        move = find_pdn_move(get_possible_moves(board, color), text)
+        if move is None:
+            raise ValueError(f"coup illégal : {text} ({position_fen(position)})")
+        yield position, move_to_key(move)
+        capture = bool(apply_move(board, move)[4])
+        moves_since_capture = 0 if capture else moves_since_capture + 1
+        color = BLACK if color == CREAM else CREAM
+        history.append(board.zobrist_hash ^ (zobrist_turn_black if color == BLACK else 0))
+    yield Position.from_board(board, color, moves_since_capture, history), None
+
+
+def write_pdn(games, stream):
+    """Écrit des parties PdnGame dans `stream`, séparées par une ligne vide."""
+    for game in games:
+        stream.write(format_pdn(game))
+        stream.write("\n")
@@ -1,5 +1,4 @@
-from .constants import SQUARE_SIZE, GREY, CROWN
-import pygame
+from .constants import SQUARE_SIZE
 
 class Piece:
     PADDING = 15
@@ -21,13 +20,6 @@ class Piece:
     def make_king(self):
         self.king = True
     
-    def draw(self, win):
-        radius = SQUARE_SIZE//2 - self.PADDING
-        pygame.draw.circle(win, GREY, (self.x, self.y), radius + self.OUTLINE)
-        pygame.draw.circle(win, self.color, (self.x, self.y), radius)
-        if self.king:
-            win.blit(CROWN, (self.x - CROWN.get_width()//2, self.y - CROWN.get_height()//2))
-
     def move(self, row, col):
         self.row = row
         self.col = col
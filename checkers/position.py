@@ -0,0 +1,74 @@
+# checkers/position.py
+"""
+Position immuable et hachable, pour transmettre un état de partie à un
+autre thread ou processus sans copier le plateau.
+
+Une Position tient en quelques entiers : les quatre bitboards de
+Board.snapshot(), le trait, le compteur de la règle des 40 coups et la pile
+des clés Zobrist depuis la dernière prise (les positions antérieures ne
+peuvent plus se répéter). Elle se sérialise (pickle) en quelques dizaines
+d'octets et redonne un Board cherchable avec to_board().
+"""
+import struct
+from typing import NamedTuple
+
+from .board import Board
+from .constants import BLACK, CREAM
+
+_HEADER = struct.Struct("<4IBH")
+
+
+class Position(NamedTuple):
+    black_men: int
+    black_kings: int
+    cream_men: int
+    cream_kings: int
+    side: str                   # 'b' ou 'w' : camp au trait
+    moves_since_capture: int = 0
+    history: tuple = ()         # clés Zobrist (avec trait) depuis la dernière prise
+
+    @classmethod
+    def from_board(cls, board, turn, moves_since_capture=0, history=()):
+        """Instantané de `board` avec `turn` au trait ; `history` : clés dans l'ordre de jeu."""
+        history = tuple(history)
+        # Seules les positions depuis la dernière prise peuvent se répéter
+        if len(history) > moves_since_capture + 1:
+            history = history[-(moves_since_capture + 1):]
+        return cls(*board.snapshot(), 'b' if turn == BLACK else 'w',
+                   moves_since_capture, history)
+
+    @property
+    def turn(self):
+        return BLACK if self.side == 'b' else CREAM
+
+    def to_board(self):
+        """Plateau indépendant, prêt pour la recherche."""
+        return Board.from_snapshot(self[:4])
+
+    def history_counts(self):
+        """Historique au format attendu par NegaMax et Board.winner : {clé: occurrences}."""
+        counts = {}
+        for key in self.history:
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    # === Sérialisation compacte ===
+    def to_bytes(self):
+        return _HEADER.pack(*self[:4], self.side == 'b', self.moves_since_capture) + \
+            struct.pack(f"<{len(self.history)}Q", *self.history)
+
+    @classmethod
+    def from_bytes(cls, data):
+        black_men, black_kings, cream_men, cream_kings, black_to_move, moves_since_capture = \
+            _HEADER.unpack_from(data)
+        count = (len(data) - _HEADER.size) // 8
+        history = struct.unpack_from(f"<{count}Q", data, _HEADER.size)
+        return cls(black_men, black_kings, cream_men, cream_kings,
+                   'b' if black_to_move else 'w', moves_since_capture, history)
+
+    def __reduce__(self):
+        return (_position_from_bytes, (self.to_bytes(),))
+
+
+def _position_from_bytes(data):
+    return Position.from_bytes(data)
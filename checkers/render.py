@@ -0,0 +1,211 @@
+# checkers/render.py
+"""
+Dessin du plateau et des pièces avec pygame.
+
+Séparé de Board et Piece pour que le moteur (minimax, engine.py, tools/)
+puisse importer le plateau sans charger pygame.
+
+draw_board redessine tout le plateau ; BoardRenderer (utilisé par Game) ne
+redessine que les cases qui ont changé depuis l'image précédente et
+retourne leurs rectangles, à passer à pygame.display.update().
+"""
+import pygame
+
+from .assets import CROWN, FONT_COORDS
+from .constants import (
+    BLUE, BOARD_WIDTH, BROWN, CREAM, DARK_GREY, GREY, HEIGHT, ROWS, COLS, SEPARATOR_WIDTH,
+    SQUARE_SIZE,
+)
+from .piece import Piece
+from .tables import SQUARES
+
+MOVE_MARKER_RADIUS = 15
+
+
+def draw_squares(win):
+    win.fill(BROWN)
+    for row in range(ROWS):
+        for col in range(row % 2, COLS, 2):
+            pygame.draw.rect(win, CREAM, (row*SQUARE_SIZE, col *SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+
+def draw_coordinates(win):
+    """Coordonnées (a-h, 1-8) dans les coins des cases du bord."""
+    padding = 5
+    for i in range(ROWS):
+        label = FONT_COORDS.render(str(8 - i), True, DARK_GREY)
+        win.blit(label, (padding, i * SQUARE_SIZE + padding))
+        label = FONT_COORDS.render(chr(ord('a') + i), True, DARK_GREY)
+        win.blit(label, (i * SQUARE_SIZE + padding, HEIGHT - FONT_COORDS.get_height() - padding))
+
+
+# === Sprites des pièces ===
+# Une surface par (couleur, dame), dessinée au premier usage (il faut une
+# fenêtre ouverte pour la convertir) puis seulement copiée : un blit par
+# pièce au lieu de deux cercles et de la couronne. Les cercles n'étant pas
+# lissés, le bord est net : une couleur transparente (colorkey, codée RLE)
+# suffit et se copie plus vite qu'une surface à alpha par pixel.
+def draw_piece_shapes(win, color, king, x, y):
+    """Dessin d'une pièce par ses cercles et sa couronne (sert à construire les sprites)."""
+    radius = SQUARE_SIZE//2 - Piece.PADDING
+    pygame.draw.circle(win, GREY, (x, y), radius + Piece.OUTLINE)
+    pygame.draw.circle(win, color, (x, y), radius)
+    if king:
+        win.blit(CROWN, (x - CROWN.get_width()//2, y - CROWN.get_height()//2))
+
+
+_sprites = {}
+SPRITE_CENTER = SQUARE_SIZE//2 - Piece.PADDING + Piece.OUTLINE + 1
+SPRITE_COLORKEY = (255, 0, 255)
+
+
+def piece_sprite(color, king):
+    sprite = _sprites.get((color, king))
+    if sprite is None:
+        center = SPRITE_CENTER
+        sprite = pygame.Surface((2 * center, 2 * center)).convert()
+        sprite.fill(SPRITE_COLORKEY)
+        draw_piece_shapes(sprite, color, king, center, center)
+        sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        _sprites[(color, king)] = sprite
+    return sprite
+
+
+def draw_piece_at(win, color, king, x, y):
+    win.blit(piece_sprite(color, king), (int(x) - SPRITE_CENTER, int(y) - SPRITE_CENTER))
+
+
+def draw_piece(win, piece):
+    draw_piece_at(win, piece.color, piece.king, piece.x, piece.y)
+
+
+def draw_move_marker(win, row, col):
+    pygame.draw.circle(win, BLUE, (col * SQUARE_SIZE + SQUARE_SIZE//2, row * SQUARE_SIZE + SQUARE_SIZE//2),
+                       MOVE_MARKER_RADIUS)
+
+
+def draw_board(win, board, animation_data=None):
+    """
+    La méthode de dessin principale, gère maintenant une liste de pièces à cacher.
+    """
+    draw_squares(win)
+
+    animating_piece = None
+    visually_removed = []
+    if animation_data:
+        animating_piece = animation_data['piece']
+        visually_removed = animation_data.get('visually_removed', [])
+
+    for row in range(ROWS):
+        for col in range(COLS):
+            piece = board.board[row][col]
+            if piece != 0:
+                # On ne dessine pas la pièce qui est en cours d'animation
+                # NI les pièces qui ont été capturées pendant l'animation
+                if piece == animating_piece or piece in visually_removed:
+                    continue
+                draw_piece(win, piece)
+
+    # La pièce animée est toujours dessinée séparément par-dessus le reste
+    if animating_piece:
+        # On utilise les coordonnées interpolées de l'animation
+        draw_piece_at(win, animating_piece.color, animating_piece.king,
+                      animation_data['current_x'], animation_data['current_y'])
+
+
+# === Rendu par rectangles modifiés ===
+class BoardRenderer:
+    """
+    Rendu incrémental du plateau sur `win`.
+
+    Les cases et les coordonnées sont dessinées une fois dans une surface
+    de fond. Pour chaque case jouable, on retient ce qui y a été dessiné
+    (pièce, couleur, dame, marque de coup possible) ; une image ne
+    redessine que les cases dont cet état a changé, plus les cases
+    recouvertes par la pièce animée à l'image précédente et à celle-ci.
+    Une image sans changement ne dessine rien et ne retourne aucun
+    rectangle.
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.background = pygame.Surface((BOARD_WIDTH - SEPARATOR_WIDTH, HEIGHT)).convert()
+        draw_squares(self.background)
+        draw_coordinates(self.background)
+        self.drawn = {}             # (row, col) -> état dessiné
+        self.animated = set()       # cases recouvertes par la pièce animée
+        self.full = True
+
+    def invalidate(self):
+        """Le prochain appel à draw() redessine tout le plateau (après un menu, par exemple)."""
+        self.full = True
+
+    def _state(self, board, hidden, markers):
+        grid = board.board
+        states = {}
+        for row, col in SQUARES:
+            piece = grid[row][col]
+            if piece and piece not in hidden:
+                states[(row, col)] = (piece.color, piece.king, (row, col) in markers)
+            else:
+                states[(row, col)] = (None, False, (row, col) in markers)
+        return states
+
+    def _covered(self, x, y):
+        """Cases recouvertes par le sprite d'une pièce dessinée au centre (x, y)."""
+        left, top = int(x) - SPRITE_CENTER, int(y) - SPRITE_CENTER
+        first_col, last_col = left // SQUARE_SIZE, (left + 2 * SPRITE_CENTER - 1) // SQUARE_SIZE
+        first_row, last_row = top // SQUARE_SIZE, (top + 2 * SPRITE_CENTER - 1) // SQUARE_SIZE
+        return {(row, col)
+                for row in range(max(first_row, 0), min(last_row, ROWS - 1) + 1)
+                for col in range(max(first_col, 0), min(last_col, COLS - 1) + 1)}
+
+    def _draw_square(self, row, col, state):
+        rect = pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+        self.win.blit(self.background, rect, rect)
+        if state is not None:
+            color, king, marker = state
+            if color is not None:
+                draw_piece_at(self.win, color, king, rect.centerx, rect.centery)
+            if marker:
+                draw_move_marker(self.win, row, col)
+        return rect
+
+    def draw(self, board, animation_data=None, markers=()):
+        """
+        Met à jour l'image du plateau ; `markers` : cases (row, col) des coups
+        possibles à signaler. Retourne la liste des rectangles modifiés.
+        """
+        animating_piece = None
+        hidden = ()
+        if animation_data:
+            animating_piece = animation_data['piece']
+            hidden = [animating_piece] + animation_data.get('visually_removed', [])
+        states = self._state(board, hidden, markers)
+
+        full = self.full
+        if full:
+            self.win.blit(self.background, (0, 0))
+            dirty = set(states)
+            self.full = False
+        else:
+            dirty = {square for square, state in states.items() if self.drawn.get(square) != state}
+            dirty |= self.animated
+
+        animated = set()
+        if animating_piece:
+            x, y = animation_data['current_x'], animation_data['current_y']
+            animated = self._covered(x, y)
+            dirty |= animated
+
+        dirty_rects = [self._draw_square(row, col, states.get((row, col))) for row, col in dirty]
+        if full:
+            dirty_rects = [self.background.get_rect()]
+
+        # La pièce animée est toujours dessinée par-dessus le reste
+        if animating_piece:
+            draw_piece_at(self.win, animating_piece.color, animating_piece.king, x, y)
+
+        self.drawn = states
+        self.animated = animated
+        return dirty_rects
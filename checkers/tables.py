@@ -0,0 +1,122 @@
+# checkers/tables.py
+"""
+Tables géométriques précalculées une seule fois à l'import.
+
+Les 32 cases jouables (foncées) sont numérotées de 0 à 31, ligne par ligne,
+de haut en bas : la case d'index `sq` est en (sq // 4, colonne foncée).
+Un ensemble de cases se représente par un entier de 32 bits (bit `sq`).
+Ce module ne dépend pas de pygame.
+"""
+
+ROWS, COLS = 8, 8
+NUM_SQUARES = 32
+FULL_MASK = (1 << NUM_SQUARES) - 1
+
+# Les 4 directions diagonales (d_row, d_col)
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def is_dark(row, col):
+    """True si (row, col) est une case jouable."""
+    return col % 2 == (row + 1) % 2
+
+
+# --- Correspondance index <-> coordonnées ---
+SQUARES = []  # index -> (row, col)
+SQUARE_INDEX = [[-1] * COLS for _ in range(ROWS)]  # (row, col) -> index, -1 si case claire
+for _row in range(ROWS):
+    for _col in range(COLS):
+        if is_dark(_row, _col):
+            SQUARE_INDEX[_row][_col] = len(SQUARES)
+            SQUARES.append((_row, _col))
+SQUARES = tuple(SQUARES)
+
+# Symétrie centrale du plateau (vue de l'autre camp) : (r, c) -> (7-r, 7-c)
+MIRROR = tuple(NUM_SQUARES - 1 - sq for sq in range(NUM_SQUARES))
+
+
+def _index(row, col):
+    if 0 <= row < ROWS and 0 <= col < COLS:
+        return SQUARE_INDEX[row][col]
+    return -1
+
+
+# --- Voisins immédiats ---
+# UP = vers la ligne 0 (sens de marche des pions crème),
+# DOWN = vers la ligne 7 (sens de marche des pions noirs).
+NEIGHBOUR_MASK = [0] * NUM_SQUARES
+UP_MASK = [0] * NUM_SQUARES
+DOWN_MASK = [0] * NUM_SQUARES
+for _sq, (_row, _col) in enumerate(SQUARES):
+    for _dr, _dc in DIRECTIONS:
+        _n = _index(_row + _dr, _col + _dc)
+        if _n < 0:
+            continue
+        NEIGHBOUR_MASK[_sq] |= 1 << _n
+        if _dr < 0:
+            UP_MASK[_sq] |= 1 << _n
+        else:
+            DOWN_MASK[_sq] |= 1 << _n
+
+# --- Cônes de promotion ---
+# Toutes les cases devant la pièce qu'un adversaire pourrait occuper pour
+# l'empêcher d'aller à dame (triangle qui s'élargit d'une colonne par rangée).
+UP_CONE = [0] * NUM_SQUARES
+DOWN_CONE = [0] * NUM_SQUARES
+for _sq, (_row, _col) in enumerate(SQUARES):
+    for _other, (_r, _c) in enumerate(SQUARES):
+        _dist = abs(_r - _row)
+        if _dist == 0 or abs(_c - _col) > _dist:
+            continue
+        if _r < _row:
+            UP_CONE[_sq] |= 1 << _other
+        else:
+            DOWN_CONE[_sq] |= 1 << _other
+
+# Nombre de rangées restant avant la promotion
+ROWS_TO_TOP = tuple(row for row, _ in SQUARES)
+ROWS_TO_BOTTOM = tuple(ROWS - 1 - row for row, _ in SQUARES)
+
+# Distance (en anneaux) au bord du plateau : 0 sur le bord, 3 au centre
+EDGE_DISTANCE = tuple(
+    min(row, col, ROWS - 1 - row, COLS - 1 - col) for row, col in SQUARES
+)
+
+# Rangées du fond : cases 0..3 (camp noir) et 28..31 (camp crème)
+TOP_ROW = tuple(range(0, 4))
+BOTTOM_ROW = tuple(range(28, 32))
+
+NEIGHBOUR_MASK = tuple(NEIGHBOUR_MASK)
+UP_MASK = tuple(UP_MASK)
+DOWN_MASK = tuple(DOWN_MASK)
+UP_CONE = tuple(UP_CONE)
+DOWN_CONE = tuple(DOWN_CONE)
+
+# --- Tables de génération de coups (coordonnées (row, col), ordre de DIRECTIONS) ---
+# RAYS[sq][d]      : cases de la diagonale partant de sq dans la direction d
+# NEIGHBOURS[sq][d]: case voisine dans la direction d, ou None
+# JUMPS[sq][d]     : (case sautée, case d'arrivée) d'un saut de pion, ou None
+RAYS = []
+NEIGHBOURS = []
+JUMPS = []
+for _row, _col in SQUARES:
+    _rays, _neighbours, _jumps = [], [], []
+    for _dr, _dc in DIRECTIONS:
+        _ray = []
+        _r, _c = _row + _dr, _col + _dc
+        while 0 <= _r < ROWS and 0 <= _c < COLS:
+            _ray.append((_r, _c))
+            _r, _c = _r + _dr, _c + _dc
+        _rays.append(tuple(_ray))
+        _neighbours.append(_ray[0] if _ray else None)
+        _jumps.append((_ray[0], _ray[1]) if len(_ray) > 1 else None)
+    RAYS.append(tuple(_rays))
+    NEIGHBOURS.append(tuple(_neighbours))
+    JUMPS.append(tuple(_jumps))
+RAYS = tuple(RAYS)
+NEIGHBOURS = tuple(NEIGHBOURS)
+JUMPS = tuple(JUMPS)
+
+# Directions de marche des pions (gauche puis droite)
+UP_DIRECTIONS = (0, 1)    # pions crème
+DOWN_DIRECTIONS = (2, 3)  # pions noirs
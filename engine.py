@@ -0,0 +1,309 @@
+# engine.py
+"""
+Moteur en ligne de commande : protocole texte ligne par ligne sur
+stdin/stdout, dans l'esprit d'UCI, pour les gestionnaires de tournoi et nos
+outils de traitement par lots. Aucun import de pygame : le moteur démarre en
+quelques dizaines de millisecondes.
+
+Les coups sont notés comme dans l'interface (checkers/notation.py) :
+"c3-d4" pour un déplacement, "c3xe5" pour une prise (case de départ et
+d'arrivée, même pour une rafle).
+
+Commandes :
+    uci                         identification, répond "uciok"
+    isready                     répond "readyok"
+    ucinewgame                  oublie la partie en cours
+    position startpos [moves m1 m2 ...]
+    position board <32 cases> <b|w> [moves m1 m2 ...]
+                                cases "b/B/w/W/." (voir Board.from_string), trait
+    position fen <FEN> [moves m1 m2 ...]
+                                FEN de checkers/pdn.py
+    go [depth N] [movetime MS] [nodes N] [wtime MS btime MS winc MS binc MS]
+       [infinite] [ponder]
+    stop                        arrête la recherche, répond "bestmove"
+    ponderhit                   le coup anticipé a été joué : la recherche
+                                lancée par "go ponder" continue avec son budget
+    quit
+
+"ucinewgame" et "position" laissent finir une recherche limitée (depth,
+movetime, nodes, pendule) en cours, qui répond "bestmove" ; seule une
+recherche "go infinite" ou "go ponder" est arrêtée aussitôt.
+
+Réponses :
+    info depth D score cp X|mate N nodes N nps N time MS pv m1 m2 ...
+    bestmove m [ponder m2]      "bestmove (none)" s'il n'y a aucun coup légal
+
+Usage :
+    python engine.py
+"""
+import sys
+import threading
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM, WIN_SCORE
+from checkers.notation import format_move_key
+from checkers.pdn import START_FEN, parse_position
+from minimax.algorithm import (
+    apply_move,
+    get_possible_moves,
+    move_to_key,
+    run_ai_calculation,
+    zobrist_turn_black,
+)
+from minimax.profiler import AIProfiler
+
+ENGINE_NAME = "DamesAI"
+INFINITE_DEPTH = 64     # profondeur maximale de "go infinite" / "go ponder"
+MOVES_TO_GO = 30        # nombre de coups restants supposé avec wtime/btime
+
+
+def format_score(score):
+    """Score du moteur (1.0 = un pion) -> "cp N" ou "mate N" (N < 0 : mat subi)."""
+    if abs(score) > WIN_SCORE / 2:
+        plies = WIN_SCORE - abs(score)
+        moves = (int(plies) + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {round(score * 100)}"
+
+
+def parse_go(tokens):
+    """Arguments de "go" -> dictionnaire de limites (temps en millisecondes)."""
+    limits = {}
+    flags = ("infinite", "ponder")
+    i = 0
+    while i < len(tokens):
+        name = tokens[i]
+        if name in flags:
+            limits[name] = True
+            i += 1
+        elif i + 1 < len(tokens):
+            try:
+                limits[name] = int(tokens[i + 1])
+            except ValueError:
+                pass
+            i += 2
+        else:
+            i += 1
+    return limits
+
+
+class Engine:
+    def __init__(self, out=sys.stdout):
+        self.out = out
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stop_event = None
+        self.release = None     # levé quand "bestmove" peut être envoyé (infinite / ponder)
+        self.timer = None
+        self.ponder_time = None
+        self.new_game()
+
+    def send(self, line):
+        with self.lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    # === Position ===
+    def new_game(self):
+        self.set_position(START_FEN, [])
+
+    def set_position(self, text, moves):
+        """
+        `text` : FEN ou "<32 cases> <b|w>" (voir checkers.pdn.parse_position).
+
+        La FEN ne porte ni l'historique des positions ni le compteur de la
+        règle des 40 coups : ils partent de la position donnée, comptée une
+        fois, puis suivent les coups de `moves` comme dans une partie. Pour
+        que le moteur voie les répétitions et les coups sans prise, le
+        gestionnaire envoie la position de départ suivie de tous les coups
+        joués, pas la seule position courante.
+        """
+        position = parse_position(text)
+        self.board = position.to_board()
+        self.turn = position.turn
+        key = self.board.zobrist_hash
+        if self.turn == BLACK:
+            key ^= zobrist_turn_black
+        self.position_history = {key: 1}
+        self.moves_since_capture = 0
+        for text in moves:
+            if not self.play(text):
+                self.send(f"info string illegal move: {text}")
+                break
+
+    def legal_moves(self):
+        return {format_move_key(move_to_key(move)): move
+                for move in get_possible_moves(self.board, self.turn)}
+
+    def play(self, text):
+        """Joue le coup noté `text` ; comme Game.play_move pour l'historique."""
+        move = self.legal_moves().get(text)
+        if move is None:
+            return False
+        apply_move(self.board, move)
+        details = move[2]
+        skipped = details["skipped"] if isinstance(details, dict) else details
+        self.moves_since_capture = 0 if skipped else self.moves_since_capture + 1
+        self.turn = BLACK if self.turn == CREAM else CREAM
+        key = self.board.zobrist_hash
+        if self.turn == BLACK:
+            key ^= zobrist_turn_black
+        self.position_history[key] = self.position_history.get(key, 0) + 1
+        return True
+
+    def cmd_position(self, tokens):
+        if "moves" in tokens:
+            split = tokens.index("moves")
+            tokens, moves = tokens[:split], tokens[split + 1:]
+        else:
+            moves = []
+        try:
+            if tokens[:1] == ["startpos"]:
+                self.set_position(START_FEN, moves)
+            elif tokens[:1] == ["board"] and len(tokens) == 3:
+                self.set_position(" ".join(tokens[1:]), moves)
+            elif tokens[:1] == ["fen"] and len(tokens) == 2:
+                self.set_position(tokens[1], moves)
+            else:
+                raise ValueError
+        except ValueError:
+            self.send("info string invalid position: " + " ".join(tokens))
+
+    # === Recherche ===
+    def budget(self, limits):
+        """Temps alloué au coup en secondes (None : pas de limite de temps)."""
+        if "movetime" in limits:
+            return limits["movetime"] / 1000
+        clock, increment = ("btime", "binc") if self.turn == BLACK else ("wtime", "winc")
+        if clock in limits:
+            remaining = limits[clock] / 1000
+            return min(remaining / MOVES_TO_GO + limits.get(increment, 0) / 1000 * 0.8,
+                       remaining / 2)
+        return None
+
+    def cmd_go(self, tokens):
+        self.stop_search()
+        limits = parse_go(tokens)
+        time_limit = self.budget(limits)
+        hold = limits.get("infinite") or limits.get("ponder")
+        depth = limits.get("depth") or (INFINITE_DEPTH if hold or time_limit or "nodes" in limits
+                                        else None)
+        self.stop_event = threading.Event()
+        self.release = threading.Event()
+        self.ponder_time = time_limit if limits.get("ponder") else None
+        if hold:
+            time_limit = None
+        else:
+            self.release.set()
+        self.thread = threading.Thread(
+            target=self.search,
+            args=(Board.from_snapshot(self.board.snapshot()), self.turn,
+                  dict(self.position_history), self.moves_since_capture,
+                  time_limit, depth, limits.get("nodes"), self.stop_event, self.release),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def search(self, board, color, history, moves_since_capture, time_limit, depth,
+               nodes, stop_event, release):
+        profiler = AIProfiler()
+        profiler.start_timer()
+        result = []
+        run_ai_calculation(board, color, profiler, result, history, moves_since_capture,
+                           time_limit, depth, self.on_info, stop_event, nodes)
+        _, move, _, pv = result[0]
+        if move is None:
+            moves = get_possible_moves(board, color)
+            move = moves[0] if moves else None
+        # En mode infinite / ponder, "bestmove" attend "stop" ou "ponderhit"
+        release.wait()
+        if move is None:
+            self.send("bestmove (none)")
+        elif len(pv) > 1:
+            self.send(f"bestmove {format_move_key(pv[0])} ponder {format_move_key(pv[1])}")
+        else:
+            self.send(f"bestmove {format_move_key(move_to_key(move))}")
+
+    def on_info(self, info):
+        elapsed = int(info["time"] * 1000)
+        if info["event"] == "iteration":
+            pv = " ".join(format_move_key(key) for key in info["pv"])
+            self.send(f"info depth {info['depth']} score {format_score(info['score'])} "
+                      f"nodes {info['nodes']} nps {info['nps']} time {elapsed} pv {pv}")
+        elif info["event"] == "progress":
+            self.send(f"info depth {info['depth']} nodes {info['nodes']} "
+                      f"nps {info['nps']} time {elapsed}")
+
+    def cmd_ponderhit(self):
+        if self.release is None or self.release.is_set():
+            return
+        # Le budget de temps court à partir de ponderhit ; sans budget, la recherche
+        # continue jusqu'à "stop" ou à sa limite de profondeur / nœuds
+        if self.ponder_time is not None:
+            self.timer = threading.Timer(self.ponder_time, self.stop_event.set)
+            self.timer.daemon = True
+            self.timer.start()
+        self.release.set()
+
+    def wait_search(self):
+        """Laisse finir une recherche limitée, arrête une recherche infinite / ponder."""
+        if self.thread is not None and self.release.is_set():
+            self.thread.join()
+        self.stop_search()
+
+    def stop_search(self):
+        if self.thread is None:
+            return
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.stop_event.set()
+        self.release.set()
+        self.thread.join()
+        self.thread = None
+
+    # === Boucle de commandes ===
+    def handle(self, line):
+        """Traite une ligne ; retourne False après "quit"."""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send("id author DamesAI")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "ucinewgame":
+            self.wait_search()
+            self.new_game()
+        elif command == "position":
+            self.wait_search()
+            self.cmd_position(args)
+        elif command == "go":
+            self.cmd_go(args)
+        elif command == "stop":
+            self.stop_search()
+        elif command == "ponderhit":
+            self.cmd_ponderhit()
+        elif command == "quit":
+            self.stop_search()
+            return False
+        else:
+            self.send(f"info string unknown command: {command}")
+        return True
+
+
+def main():
+    engine = Engine()
+    for line in sys.stdin:
+        if not engine.handle(line):
+            break
+    else:
+        engine.wait_search()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
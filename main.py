@@ -2,18 +2,18 @@
 
 import pygame
 from checkers.constants import *
+from checkers.assets import *
 from checkers.game import Game
+from checkers.notation import format_move_key
 from minimax.algorithm import (
-    NegaMax,
     transposition_table,
     SEARCH_DEPTH,
-    SearchTimeout,
+    run_ai_calculation,
 )
 from minimax.profiler import AIProfiler
+import queue
 import sys
 import threading
-from copy import deepcopy
-import time
 
 # --- Configuration de la fenêtre et des polices ---
 pygame.display.set_caption('DamesAI')
@@ -108,6 +108,18 @@ def draw_sidebar(surface, game):
     time_s = float(game.last_ai_time)
     draw_text(surface, f"{time_s:.2f}s", FONT_AI_STATS_VALUE, AI_GREY, value_x,
               y_time)
+
+    # 4. Variation principale (autant de coups que la place le permet)
+    y_pv = y_time + 20
+    draw_text(surface, "PV", FONT_AI_STATS_LABEL, AI_GREY, label_x, y_pv)
+    pygame.draw.rect(surface, AI_GREY, (bar_x, y_pv, bar_size[0], bar_size[1]))
+    pv_text = ""
+    for move_key in game.last_ai_pv:
+        candidate = f"{pv_text} {format_move_key(move_key)}".strip()
+        if FONT_AI_STATS_VALUE.size(candidate)[0] > SIDEBAR_WIDTH - (value_x - BOARD_WIDTH) - 10:
+            break
+        pv_text = candidate
+    draw_text(surface, pv_text, FONT_AI_STATS_VALUE, AI_GREY, value_x, y_pv)
     # =======================================================================
 
     # Scores (maintenant dynamiques en fonction du choix du joueur)
@@ -137,7 +149,7 @@ def draw_sidebar(surface, game):
     is_undo_possible = (game.turn == game.player_color and
                         not game.game_over and
                         not game.is_animating() and
-                        len(game.game_state_history) > 1)
+                        len(game.move_log) > 1)
 
     undo_bg_color = GREEN if is_undo_possible else GREY
     draw_button(surface, undo_btn_rect, "Undo Move", FONT_SIDEBAR_BODY,
@@ -184,78 +196,34 @@ def draw_sidebar(surface, game):
     return restart_btn_rect, menu_btn_rect, cream_choice_rect, black_choice_rect, undo_btn_rect
 
 
-def draw_board_coordinates(surface):
-    """
-    Dessine les coordonnées (a-h, 1-8) autour du plateau.
-    Version mise à jour pour un alignement dans les coins.
-    """
-    padding = 5
-    for i in range(8):
-        y_coord = (i * SQUARE_SIZE) + padding
-        draw_text(surface, str(8 - i), FONT_COORDS, DARK_GREY, padding, y_coord,
-                  center=False)
-
-        x_coord = (i * SQUARE_SIZE) + padding
-        y_coord_bottom = HEIGHT - FONT_COORDS.get_height() - padding
-        draw_text(surface, chr(ord('a') + i), FONT_COORDS, DARK_GREY, x_coord,
-                  y_coord_bottom, center=False)
-
-
-# --- Fonction wrapper pour le calcul de l'IA ---
-def run_ai_calculation(board_to_search, ai_color, profiler,
-                       result_container, position_history, moves_since_capture,
-                       time_limit=None, max_depth=None):
-    """
-    Cette fonction est exécutée dans un thread séparé sur une COPIE du plateau.
-    Implémente iterative deepening: profondeur 1..max_depth, arrêt si timeout.
-    Retourne dans result_container un tuple (best_score, best_move_data, best_depth)
-    où best_depth est la profondeur à laquelle le meilleur coup renvoyé a été
-    trouvé (None si aucun coup complet n'a été obtenu).
-    """
-    transposition_table.clear()
-
-    if max_depth is None:
-        max_depth = SEARCH_DEPTH
-
-    best_score = None
-    best_move_data = None
-    best_depth = None
-
-    try:
-        for depth in range(1, max_depth + 1):
-            # Quick pre-check du temps avant de lancer une profondeur supérieure
-            if time_limit is not None and profiler.start_time:
-                if time.perf_counter() - profiler.start_time > time_limit:
-                    raise SearchTimeout()
-
-            value, move = NegaMax(
-                board_to_search,
-                depth,
-                ai_color,
-                float("-inf"),
-                float("inf"),
-                profiler,
-                position_history,
-                moves_since_capture,
-                time_limit,
-            )
-
-            # Conserver le meilleur coup complet obtenu à une profondeur terminée
-            if move is not None:
-                best_score = value
-                best_move_data = move
-                best_depth = depth
-
-            # Arrêt anticipé si score décisif trouvé
-            if best_score is not None and abs(best_score) > WIN_SCORE / 2:
-                break
-
-    except SearchTimeout:
-        # Temps écoulé : on retourne le dernier coup complet
-        pass
-
-    # On retourne aussi la profondeur à laquelle le meilleur coup a été trouvé
-    result_container.append((best_score, best_move_data, best_depth))
+# Zone de la barre latérale (séparateur compris), redessinée seulement si son contenu change
+SIDEBAR_RECT = pygame.Rect(BOARD_WIDTH - SEPARATOR_WIDTH, 0, SIDEBAR_WIDTH + SEPARATOR_WIDTH,
+                           HEIGHT)
+
+
+def sidebar_state(game):
+    """Tout ce que draw_sidebar affiche : la barre n'est redessinée que si cet état change."""
+    return (game.last_ai_depth, game.last_ai_score, game.last_ai_time, tuple(game.last_ai_pv),
+            game.move_counter, game.calculation_move_counter, game.last_ai_plies_to_win,
+            game.player_color, game.cream_wins, game.black_wins, game.draws, game.turn,
+            game.game_over, game.winner_message, game.ai_is_thinking, game.is_animating(),
+            len(game.move_log))
+
+
+def record_ai_info(game, depth, value, pv, elapsed):
+    """Reporte dans le jeu l'analyse de l'IA (itération terminée ou résultat final)."""
+    game.last_ai_depth = depth
+    game.last_ai_score = value  # On garde le score brut
+    game.last_ai_time = elapsed
+    game.last_ai_pv = pv
+
+    # Si c'est un score de victoire, on stocke les plies et le moment
+    if value is not None and value > WIN_SCORE / 2:
+        game.last_ai_plies_to_win = WIN_SCORE - value
+        game.calculation_move_counter = game.move_counter
+    elif value is not None and value < LOSS_SCORE / 2:
+        game.last_ai_plies_to_win = value - LOSS_SCORE
+        game.calculation_move_counter = game.move_counter
 
 
 # --- Boucle Principale ---
@@ -271,6 +239,7 @@ def main():
     # === Variables pour gérer le thread de l'IA ===
     ai_thread = None
     ai_result = []
+    ai_info = queue.Queue()  # Flux d'informations du thread de recherche
 
     # Définition des rectangles des boutons du menu
     start_btn = pygame.Rect(WIDTH // 2 - 150, 250, 300, 70)
@@ -283,6 +252,10 @@ def main():
     # Paramètre : budget temps pour l'IA (en secondes)
     AI_TIME_LIMIT = 3.0
 
+    # En partie, seules les zones modifiées de la fenêtre sont mises à jour
+    drawn_state = None      # état affiché à l'image précédente (None : tout redessiner)
+    drawn_sidebar = None
+
     while run:
         clock.tick(FPS)
         mouse_pos = pygame.mouse.get_pos()
@@ -292,6 +265,9 @@ def main():
             if event.type == pygame.QUIT:
                 run = False
 
+            if event.type == pygame.WINDOWEXPOSED:
+                drawn_state = None
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if game_state == "MAIN_MENU":
                     if start_btn.collidepoint(mouse_pos):
@@ -319,7 +295,7 @@ def main():
                         if (game.turn == game.player_color and
                                 not game.game_over and
                                 not game.is_animating() and
-                                len(game.game_state_history) > 0):
+                                len(game.move_log) > 0):
                             game.undo_move()
                     elif not game.is_animating() and not game.game_over:
                         row = mouse_pos[1] // SQUARE_SIZE
@@ -336,7 +312,9 @@ def main():
             if ai_thread is None:
                 game.ai_is_thinking = True
                 ai_result = []
-                board_copy = deepcopy(game.get_board())
+                ai_info = queue.Queue()
+                # Position immuable : le thread reconstruit son propre plateau
+                position = game.get_position()
 
                 profiler.reset()
                 profiler.start_timer()
@@ -344,19 +322,31 @@ def main():
                 ai_thread = threading.Thread(
                     target=run_ai_calculation,
                     args=(
-                        board_copy,
+                        position.to_board(),
                         ai_color,
                         profiler,
                         ai_result,
-                        game.position_history.copy(),
-                        game.moves_since_capture,
+                        position.history_counts(),
+                        position.moves_since_capture,
                         AI_TIME_LIMIT,    # time_limit
                         SEARCH_DEPTH,     # max_depth
                     ),
+                    kwargs={"on_info": ai_info.put},
                 )
                 ai_thread.start()
 
-            elif not ai_thread.is_alive():
+            # Affichage en direct : profondeur, score et PV de chaque itération
+            while True:
+                try:
+                    info = ai_info.get_nowait()
+                except queue.Empty:
+                    break
+                if info["event"] == "iteration":
+                    record_ai_info(game, info["depth"], info["score"], info["pv"], info["time"])
+                else:
+                    game.last_ai_time = info["time"]
+
+            if not ai_thread.is_alive():
                 game.ai_is_thinking = False
 
                 # === Arrêter le profiler et stocker les résultats ===
@@ -365,22 +355,12 @@ def main():
 
                 if ai_result:
                     # On récupère le score, le coup et la profondeur trouvée
-                    value, best_move_data, found_depth = ai_result[0]
+                    value, best_move_data, found_depth, pv = ai_result[0]
 
                     # On stocke la profondeur réelle où le coup a été trouvé.
                     # Si aucun best_depth n'a été renvoyé on conserve SEARCH_DEPTH.
-                    game.last_ai_depth = found_depth if found_depth else SEARCH_DEPTH
-
-                    game.last_ai_score = value  # On garde le score brut
-                    game.last_ai_time = profiler.total_time
-
-                    # Si c'est un score de victoire, on stocke les plies et le moment
-                    if value is not None and value > WIN_SCORE / 2:
-                        game.last_ai_plies_to_win = WIN_SCORE - value
-                        game.calculation_move_counter = game.move_counter
-                    elif value is not None and value < LOSS_SCORE / 2:
-                        game.last_ai_plies_to_win = value - LOSS_SCORE
-                        game.calculation_move_counter = game.move_counter
+                    record_ai_info(game, found_depth if found_depth else SEARCH_DEPTH,
+                                   value, pv, profiler.total_time)
 
                     game.ai_move(best_move_data)
                     #profiler.display_results(game.last_ai_depth, value ,best_move_data)
@@ -413,19 +393,29 @@ def main():
             draw_button(WIN, back_btn, "Back to Menu", FONT_SIDEBAR_BODY, GREY,
                         BLACK)
         elif game_state == "PLAYING":
-            WIN.fill(BROWN)
-            game.update()
+            if drawn_state != "PLAYING":
+                # On arrive d'un menu (ou la fenêtre a été recouverte) : tout redessiner
+                game.invalidate()
+                drawn_sidebar = None
 
             ## Dessiner le plateau et les pièces
-            restart_btn, menu_btn, cream_choice_btn, black_choice_btn, undo_btn = \
-                draw_sidebar(WIN, game)
-            draw_board_coordinates(WIN)
+            dirty = game.update()
+            state = sidebar_state(game)
+            if state != drawn_sidebar:
+                restart_btn, menu_btn, cream_choice_btn, black_choice_btn, undo_btn = \
+                    draw_sidebar(WIN, game)
+                drawn_sidebar = state
+                dirty.append(SIDEBAR_RECT)
 
             # Vérifier la condition de victoire
             if not game.game_over and not game.is_animating():
                 game.update_winner()
 
-        pygame.display.update()
+        if game_state == "PLAYING" and drawn_state == "PLAYING":
+            pygame.display.update(dirty)
+        else:
+            pygame.display.update()
+        drawn_state = game_state
 
     pygame.quit()
     sys.exit()
@@ -1,24 +1,55 @@
-from checkers.constants import BLACK, CREAM, ROWS, COLS, LOSS_SCORE, DRAW_SCORE
+from checkers.constants import BLACK, CREAM, ROWS, COLS, WIN_SCORE, LOSS_SCORE, DRAW_SCORE
+from checkers.tables import SQUARES, SQUARE_INDEX
+from collections import OrderedDict
 import random
 import time
 
+from minimax import nnue
+
 SEARCH_DEPTH = 10
 
 # --- 1. INITIALISATION DU HACHAGE ZOBRIST ET DES STRUCTURES D'OPTIMISATION ---
+# Graine fixe : les clés sont identiques dans tous les processus, ce qui permet
+# d'échanger des historiques de positions (checkers/position.py).
+_zobrist_rng = random.Random(0x5EED_DA3E5)
 zobrist_table = {}
 for row in range(ROWS):
     for col in range(COLS):
         for piece_color in [BLACK, CREAM]:
             # Clé pour un pion (man)
-            zobrist_table[(piece_color, False, row, col)] = random.getrandbits(64)
+            zobrist_table[(piece_color, False, row, col)] = _zobrist_rng.getrandbits(64)
             # Clé pour une dame (king)
-            zobrist_table[(piece_color, True, row, col)] = random.getrandbits(64)
+            zobrist_table[(piece_color, True, row, col)] = _zobrist_rng.getrandbits(64)
 
 # Clé unique pour indiquer que c'est au tour du joueur NOIR (BLACK) de jouer
-zobrist_turn_black = random.getrandbits(64)
+zobrist_turn_black = _zobrist_rng.getrandbits(64)
 
 # La Table de Transposition (TT) qui stockera les résultats
 transposition_table = {}
+# Accès à la TT par méthodes liées (la table n'est jamais remplacée, seulement
+# vidée) : aussi rapide qu'un accès direct, et minimax/trace.py peut les
+# chronométrer sans rien ajouter au chemin normal.
+tt_get = transposition_table.get
+tt_set = transposition_table.__setitem__
+
+# Table de variation principale triangulaire : pv_table[ply] est la meilleure
+# suite de coups (clés move_to_key) trouvée depuis le nœud en cours à ce ply.
+MAX_PLY = 128
+pv_table = [[] for _ in range(MAX_PLY)]
+
+# Variation principale de l'itération précédente : ses coups sont essayés en
+# premier tant que la recherche suit cette variation.
+pv_seed = []
+
+# Cache d'évaluation à correspondance directe, distinct de la TT : la case
+# zobrist_hash & masque garde la clé complète et l'évaluation vue du camp
+# noir (l'évaluation de crème en est l'opposé). Taille fixe, une puissance
+# de 2 (set_eval_cache_size, 0 le désactive) ; vidé à chaque recherche,
+# comme la TT, puisque les poids ou le réseau peuvent avoir changé.
+EVAL_CACHE_SIZE = 1 << 16
+_eval_cache_keys = [None] * EVAL_CACHE_SIZE
+_eval_cache_scores = [0.0] * EVAL_CACHE_SIZE
+_eval_cache_mask = EVAL_CACHE_SIZE - 1
 
 
 class SearchTimeout(Exception):
@@ -26,12 +57,123 @@ class SearchTimeout(Exception):
     pass
 
 
+# --- Flux d'informations de recherche (voir run_ai_calculation) ---
+INFO_INTERVAL = 0.5  # secondes entre deux événements "progress"
+
+
+class SearchInfoStream:
+    """
+    Transmet à un callback l'état d'une recherche en cours, sous forme de
+    dictionnaires : "iteration" après chaque profondeur terminée, "progress"
+    périodiquement pendant une longue itération, "done" à la fin. Le
+    callback est appelé depuis le thread de recherche : `queue.Queue().put`
+    convient pour le consommer ailleurs.
+    """
+
+    def __init__(self, callback, profiler, interval=INFO_INTERVAL):
+        self.callback = callback
+        self.profiler = profiler
+        self.interval = interval
+        self.next_report = time.perf_counter() + interval
+        self.depth = 0          # profondeur en cours
+        self.best = (None, [])  # (score, pv) de la dernière profondeur terminée
+
+    def emit(self, event, **fields):
+        profiler = self.profiler
+        elapsed = time.perf_counter() - profiler.start_time if profiler.start_time else 0.0
+        score, pv = self.best
+        info = {
+            "event": event,
+            "depth": self.depth,
+            "score": score,
+            "pv": pv,
+            "nodes": profiler.nodes_visited,
+            "nps": int(profiler.nodes_visited / elapsed) if elapsed > 0 else 0,
+            "time": elapsed,
+        }
+        info.update(fields)
+        self.callback(info)
+
+    def tick(self):
+        """Appelé à chaque nœud : un événement "progress" au plus toutes les `interval` secondes."""
+        if self.profiler.nodes_visited & 255 == 0:
+            now = time.perf_counter()
+            if now >= self.next_report:
+                self.next_report = now + self.interval
+                self.emit("progress")
+
+
+# Flux actif pendant un run_ai_calculation écouté (None sinon)
+_info_stream = None
+# Demande d'arrêt externe (threading.Event) et budget de nœuds du
+# run_ai_calculation en cours (None sinon)
+_stop_event = None
+_node_limit = None
+
+
 def _check_time(profiler, time_limit):
-    """Lève SearchTimeout si le budget de temps est dépassé."""
+    """Lève SearchTimeout si le budget de temps ou de nœuds est dépassé, ou si l'arrêt est demandé."""
     if time_limit is not None and profiler.start_time:
         if time.perf_counter() - profiler.start_time > time_limit:
             raise SearchTimeout()
+    if _stop_event is not None and _stop_event.is_set():
+        raise SearchTimeout()
+    if _node_limit is not None and profiler.nodes_visited >= _node_limit:
+        raise SearchTimeout()
+    if _info_stream is not None:
+        _info_stream.tick()
         
+def set_eval_cache_size(entries):
+    """Redimensionne le cache d'évaluation (arrondi à la puissance de 2 inférieure ; 0 = désactivé)."""
+    global _eval_cache_keys, _eval_cache_scores, _eval_cache_mask
+    size = 1 << (entries.bit_length() - 1) if entries > 0 else 0
+    _eval_cache_keys = [None] * size
+    _eval_cache_scores = [0.0] * size
+    _eval_cache_mask = size - 1
+
+
+def clear_eval_cache():
+    _eval_cache_keys[:] = [None] * len(_eval_cache_keys)
+
+
+def cached_evaluate(board, color, profiler):
+    """board.evaluate(color), lu dans le cache d'évaluation quand c'est possible."""
+    if _eval_cache_mask < 0:
+        return board.evaluate(color)
+    key = board.zobrist_hash
+    index = key & _eval_cache_mask
+    if _eval_cache_keys[index] == key:
+        profiler.eval_cache_hits += 1
+        score = _eval_cache_scores[index]
+    else:
+        profiler.eval_cache_misses += 1
+        score = board.evaluate(BLACK)
+        _eval_cache_keys[index] = key
+        _eval_cache_scores[index] = score
+    return score if color == BLACK else -score
+
+
+def score_to_tt(score, ply):
+    """
+    Score de victoire/défaite rendu relatif au nœud avant stockage dans la TT :
+    la distance au mat est comptée depuis ce nœud, pas depuis la racine.
+    """
+    if score > WIN_SCORE / 2:
+        return score + ply
+    if score < LOSS_SCORE / 2:
+        return score - ply
+    return score
+
+
+def score_from_tt(score, ply):
+    """Inverse de score_to_tt : score relatif au nœud -> score relatif à la racine."""
+    if score > WIN_SCORE / 2:
+        return score - ply
+    if score < LOSS_SCORE / 2:
+        return score + ply
+    return score
+
+
 def move_to_key(move_data):
     """
     Retourne une clé immuable décrivant un coup :
@@ -61,6 +203,26 @@ def is_capture_move(move_data):
     return bool(skipped)
 
 
+def apply_move(board, move_data):
+    """
+    Joue un coup (piece, (end_row, end_col), details) sur `board` et retourne
+    de quoi l'annuler avec revert_move.
+    """
+    piece, (end_row, end_col), details = move_data
+    skipped = details.get("skipped", []) if isinstance(details, dict) else details
+    start_row, start_col = piece.row, piece.col
+    removed = board.remove_and_get_skipped(skipped)
+    was_promoted = board.make_move(piece, end_row, end_col)
+    return piece, start_row, start_col, was_promoted, removed
+
+
+def revert_move(board, undo):
+    """Annule un coup joué par apply_move."""
+    piece, start_row, start_col, was_promoted, removed = undo
+    board.undo_move(piece, start_row, start_col, was_promoted)
+    board.restore_skipped(removed)
+
+
 #------------- FONCTION QUIESCENCE SEARCH -------------------#
 def quiescenceSearch(board, alpha, beta, color_player, profiler,
                      time_limit=None):
@@ -68,10 +230,10 @@ def quiescenceSearch(board, alpha, beta, color_player, profiler,
     Recherche de quiétude qui n'explore que les coups de capture.
     Pattern make/undo utilisé ; propagation du time_limit.
     """
-    profiler.increment_nodes()
+    profiler.nodes_visited += 1
     _check_time(profiler, time_limit)
 
-    stand_pat_eval = board.evaluate(color_player)
+    stand_pat_eval = cached_evaluate(board, color_player, profiler)
 
     if stand_pat_eval >= beta:
         return beta
@@ -83,7 +245,7 @@ def quiescenceSearch(board, alpha, beta, color_player, profiler,
 
     capture_moves_list = []
     for piece, moves in capture_moves_dict.items():
-        for move, details in moves.items():
+        for move, details in moves:
             capture_moves_list.append((piece, move, details))
 
     for move_data in capture_moves_list:
@@ -136,10 +298,16 @@ def NegaMax(
     position_history,
     moves_since_capture,
     time_limit=None,
+    ply=0,
+    follow_pv=False,
 ):
     """
     NegaMax avec alpha-beta, table de transposition et ordering coups.
+    `ply` est la distance à la racine ; la variation principale du nœud est
+    laissée dans pv_table[ply]. Avec `follow_pv`, le coup pv_seed[ply] est
+    essayé en premier.
     """
+    pv_table[ply] = []
     _check_time(profiler, time_limit)
 
     # Règles de nullité
@@ -154,8 +322,18 @@ def NegaMax(
             has_moves = True
             break
 
+    # Défaite à `ply` demi-coups de la racine : plus le mat est proche, plus le
+    # score est extrême, quelle que soit la profondeur de l'itération.
     if not has_moves:
-        return LOSS_SCORE + (SEARCH_DEPTH - depth), None
+        return LOSS_SCORE + ply, None
+
+    # Élagage par distance au mat : même un mat au prochain coup ne ferait pas
+    # mieux qu'un mat déjà trouvé plus près de la racine.
+    if ply > 0:
+        alpha = max(alpha, LOSS_SCORE + ply)
+        beta = min(beta, WIN_SCORE - ply - 1)
+        if alpha >= beta:
+            return alpha, None
 
     if depth == 0:
         q_eval = quiescenceSearch(
@@ -168,32 +346,39 @@ def NegaMax(
     if color_player == BLACK:
         current_hash ^= zobrist_turn_black
 
-    tt_entry = transposition_table.get(current_hash)
+    tt_entry = tt_get(current_hash)
+    tt_raised_alpha = False
     if (
         tt_entry
         and tt_entry["depth"] >= depth
         and tt_entry["position_repr"] == position.__repr__()
     ):
-        profiler.increment_tt_hits()
+        profiler.tt_hits += 1
+        tt_score = score_from_tt(tt_entry["score"], ply)
         if tt_entry["flag"] == "EXACT":
-            return tt_entry["score"], tt_entry["best_move"]
+            if tt_entry["best_move"] is not None:
+                pv_table[ply] = [move_to_key(tt_entry["best_move"])]
+            return tt_score, tt_entry["best_move"]
         elif tt_entry["flag"] == "LOWERBOUND":
-            alpha = max(alpha, tt_entry["score"])
+            if tt_score > alpha:
+                # La borne vient du coup mémorisé : il reste le meilleur connu
+                alpha = tt_score
+                tt_raised_alpha = True
         elif tt_entry["flag"] == "UPPERBOUND":
-            beta = min(beta, tt_entry["score"])
+            beta = min(beta, tt_score)
         if alpha >= beta:
-            return tt_entry["score"], tt_entry["best_move"]
+            return tt_score, tt_entry["best_move"]
 
-    profiler.increment_nodes()
-
-    # Vérifier victoire/défaite via winner
-    if position.winner(color_player, position_history, moves_since_capture) \
-       is not None:
-        return position.evaluate(color_player), None
+    profiler.nodes_visited += 1
 
     best_move_data = None
+    if tt_raised_alpha:
+        best_move_data = tt_entry["best_move"]
+        pv_table[ply] = [move_to_key(best_move_data)]
     possible_moves = get_possible_moves(position, color_player)
 
+    pv_move_key = pv_seed[ply] if follow_pv and ply < len(pv_seed) else None
+
     # --- Ordonnancement des coups (TT best, captures, autres) ---
     tt_best_key = None
     if tt_entry and tt_entry.get("best_move") is not None:
@@ -210,9 +395,11 @@ def NegaMax(
             mkey = None
         cap = is_capture_move(md)
 
-        # Ranking: 0=TT best, 1=capture, 2=other
+        # Ranking: -1=coup de la PV précédente, 0=TT best, 1=capture, 2=other
         rank = 2
-        if tt_best_key is not None and mkey == tt_best_key:
+        if pv_move_key is not None and mkey == pv_move_key:
+            rank = -1
+        elif tt_best_key is not None and mkey == tt_best_key:
             rank = 0
         elif cap:
             rank = 1
@@ -222,7 +409,7 @@ def NegaMax(
     moves_meta.sort(key=lambda x: x[0])
 
     # --- Boucle principale de recherche ---
-    for _, move_data, move_key, _is_capture in moves_meta:
+    for move_index, (_, move_data, move_key, _is_capture) in enumerate(moves_meta):
         _check_time(profiler, time_limit)
 
         piece, (end_row, end_col), skipped_pieces = move_data
@@ -237,17 +424,18 @@ def NegaMax(
         new_moves_since_capture = 0 if final_skipped_list else \
                                  moves_since_capture + 1
 
-        # Mise à jour simulée de l'historique (hash)
+        # Faire le coup (make)
+        removed = position.remove_and_get_skipped(final_skipped_list)
+        was_promoted = position.make_move(piece, end_row, end_col)
+
+        # Historique : position atteinte avec son camp au trait, la même clé
+        # que Game.play_move (une répétition de la partie se voit dans l'arbre)
         next_hash = position.zobrist_hash
         if next_color == BLACK:
             next_hash ^= zobrist_turn_black
 
         position_history[next_hash] = position_history.get(next_hash, 0) + 1
 
-        # Faire le coup (make)
-        removed = position.remove_and_get_skipped(final_skipped_list)
-        was_promoted = position.make_move(piece, end_row, end_col)
-
         try:
             evaluation = -NegaMax(
                 position,
@@ -259,6 +447,8 @@ def NegaMax(
                 position_history,
                 new_moves_since_capture,
                 time_limit,
+                ply + 1,
+                pv_move_key is not None and move_key == pv_move_key,
             )[0]
         finally:
             # Défaire le coup (undo)
@@ -273,9 +463,12 @@ def NegaMax(
         if evaluation > alpha:
             alpha = evaluation
             best_move_data = move_data
+            pv_table[ply] = [move_key] + pv_table[ply + 1]
 
             if alpha >= beta:
-                profiler.increment_cutoffs()
+                profiler.cutoffs += 1
+                if move_index == 0:
+                    profiler.first_move_cutoffs += 1
                 break
 
     # --- Sauvegarde dans la table de transposition (TT) ---
@@ -286,35 +479,149 @@ def NegaMax(
     else:
         flag = "EXACT"
 
-    transposition_table[current_hash] = {
-        "score": alpha,
+    tt_set(current_hash, {
+        "score": score_to_tt(alpha, ply),
         "depth": depth,
         "flag": flag,
         "best_move": best_move_data,
         "position_repr": position.__repr__(),
-    }
+    })
 
     return alpha, best_move_data
 
 
+# --- Cache des listes de coups ---
+class MoveCache:
+    """
+    Cache LRU borné des coups générés, indexé par hash Zobrist et trait (la
+    clé de l'historique des positions). Les coups sont stockés sous forme
+    compacte (voir _encode_move), sans référence aux pièces : une entrée
+    sert pour tout plateau de même position. Désactivé par défaut (taille
+    0) ; n'est pas protégé pour un usage simultané depuis plusieurs threads.
+    """
+
+    def __init__(self, size=0):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups * 100 if lookups > 0 else 0
+
+    def stats(self):
+        return {"size": self.size, "entries": len(self.entries), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hit_rate()}
+
+
+move_cache = MoveCache()
+
+
+def set_move_cache_size(entries):
+    """Active le cache de coups avec `entries` positions au plus (0 le désactive et le vide)."""
+    move_cache.size = max(entries, 0)
+    move_cache.clear()
+
+
+def _encode_move(move_data):
+    """
+    (pièce, arrivée, détails) -> bytes : case de départ, case d'arrivée,
+    nombre de prises, cases prises puis, pour une prise de dame, cases du
+    chemin.
+    """
+    piece, (end_row, end_col), details = move_data
+    start = SQUARE_INDEX[piece.row][piece.col]
+    end = SQUARE_INDEX[end_row][end_col]
+    if not details:
+        return bytes((start, end, 0))
+    if isinstance(details, dict):
+        skipped, path = details["skipped"], details["path"]
+    else:
+        skipped, path = details, ()
+    return bytes([start, end, len(skipped)]
+                 + [SQUARE_INDEX[p.row][p.col] for p in skipped]
+                 + [SQUARE_INDEX[r][c] for r, c in path])
+
+
+def _decode_moves(board, color, encoded):
+    """Coups de `board` à partir de leur forme compacte ; None si elle ne correspond pas (collision)."""
+    grid = board.board
+    squares = SQUARES
+    moves = []
+    last_start = None
+    piece = None
+    for code in encoded:
+        start = code[0]
+        if start != last_start:
+            row, col = squares[start]
+            piece = grid[row][col]
+            if not piece or piece.color != color:
+                return None
+            last_start = start
+        count = code[2]
+        if not count:
+            moves.append((piece, squares[code[1]], []))
+            continue
+        skipped = []
+        for sq in code[3:3 + count]:
+            row, col = squares[sq]
+            if not grid[row][col]:
+                return None
+            skipped.append(grid[row][col])
+        if piece.king:
+            details = {'skipped': skipped, 'path': [squares[sq] for sq in code[3 + count:]]}
+        else:
+            details = skipped
+        moves.append((piece, squares[code[1]], details))
+    return moves
+
+
 def get_possible_moves(board, color):
     """
     Génère une liste de tous les coups possibles. Gère la nouvelle structure
-    de données pour les sauts du roi.
+    de données pour les sauts du roi. Passe par le cache de coups s'il est
+    activé (set_move_cache_size).
     """
+    cache = move_cache
+    if not cache.size:
+        return _generate_moves(board, color)
+    key = board.zobrist_hash ^ (zobrist_turn_black if color == BLACK else 0)
+    entries = cache.entries
+    encoded = entries.get(key)
+    if encoded is not None:
+        moves = _decode_moves(board, color, encoded)
+        if moves is not None:
+            entries.move_to_end(key)
+            cache.hits += 1
+            return moves
+    cache.misses += 1
+    moves = _generate_moves(board, color)
+    entries[key] = tuple(_encode_move(move) for move in moves)
+    if len(entries) > cache.size:
+        entries.popitem(last=False)
+        cache.evictions += 1
+    return moves
+
+
+def _generate_moves(board, color):
     moves_data = []
     capture_moves = get_capture_moves(board, color)
 
     if capture_moves:
         for piece, moves in capture_moves.items():
-            for move, details in moves.items():
+            for move, details in moves:
                 moves_data.append((piece, move, details))
         return moves_data
 
+    # Aucune prise possible : seuls les déplacements simples restent
     for piece in board.get_all_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        for move, skipped in valid_moves.items():
-            moves_data.append((piece, move, skipped))  # 'skipped' est une liste
+        for move, skipped in board.get_simple_moves(piece).items():
+            moves_data.append((piece, move, skipped))  # 'skipped' est une liste vide
     return moves_data
 
 
@@ -323,42 +630,195 @@ def get_capture_moves(board, color):
     Retourne uniquement les coups de capture possibles, en respectant la
     capture maximale. Gère les sauts de pion (liste) et de roi (dict).
     """
-    capture_moves = {}
-    max_skipped_len = 0
+    return board.get_capture_moves(color)
 
-    # Étape 1 : Collecter toutes les captures possibles
-    for piece in board.get_all_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        piece_captures = {}
-        for move, details in valid_moves.items():
-            skipped_list = []
-            if isinstance(details, dict):
-                skipped_list = details.get('skipped', [])
-            else:
-                skipped_list = details
-
-            if skipped_list:
-                piece_captures[move] = details
-                if len(skipped_list) > max_skipped_len:
-                    max_skipped_len = len(skipped_list)
-
-        if piece_captures:
-            capture_moves[piece] = piece_captures
-
-    if not capture_moves:
-        return {}
-
-    # Étape 2 : Filtrer pour ne garder que les captures de longueur maximale
-    final_captures = {}
-    for piece, moves in capture_moves.items():
-        max_len_moves = {}
-        for move, details in moves.items():
-            skipped_list = details['skipped'] if isinstance(details, dict) else details
-            if len(skipped_list) == max_skipped_len:
-                max_len_moves[move] = details
-
-        if max_len_moves:
-            final_captures[piece] = max_len_moves
-
-    return final_captures
 
+#------------- APPROFONDISSEMENT ITÉRATIF -------------------#
+def search_iteration(board, depth, color, profiler, position_history,
+                     moves_since_capture, time_limit=None):
+    """
+    Une itération complète à `depth` depuis la racine, guidée par la variation
+    principale de l'itération précédente (pv_seed), qui est ensuite remplacée
+    par la nouvelle. Retourne (score, coup, pv) ; pv est une liste de clés.
+    """
+    value, move = NegaMax(
+        board,
+        depth,
+        color,
+        float("-inf"),
+        float("inf"),
+        profiler,
+        position_history,
+        moves_since_capture,
+        time_limit,
+        0,
+        True,
+    )
+    pv = list(pv_table[0])
+    if move is not None:
+        pv_seed[:] = pv
+    return value, move, pv
+
+
+def _attach_network(board):
+    """Attache au plateau un accumulateur NNUE si un réseau est installé (minimax/nnue.py)."""
+    network = nnue.get_network()
+    board.accumulator = network.accumulator(board) if network is not None else None
+
+
+def run_ai_calculation(board_to_search, ai_color, profiler,
+                       result_container, position_history, moves_since_capture,
+                       time_limit=None, max_depth=None, on_info=None,
+                       stop_event=None, max_nodes=None):
+    """
+    Cette fonction est exécutée dans un thread séparé sur une COPIE du plateau.
+    Implémente iterative deepening: profondeur 1..max_depth, arrêt si timeout.
+    Retourne dans result_container un tuple (best_score, best_move_data,
+    best_depth, best_pv) où best_depth est la profondeur à laquelle le meilleur
+    coup renvoyé a été trouvé (None si aucun coup complet n'a été obtenu) et
+    best_pv la variation principale correspondante (clés move_to_key).
+    Si `on_info` est fourni, il reçoit le flux d'informations de la recherche
+    (voir SearchInfoStream). La recherche s'arrête aussi dès que `stop_event`
+    (threading.Event) est levé ou que `max_nodes` nœuds ont été visités ; le
+    résultat est alors celui de la dernière profondeur terminée.
+    """
+    global _info_stream, _stop_event, _node_limit
+    transposition_table.clear()
+    clear_eval_cache()
+    pv_seed.clear()
+    stream = SearchInfoStream(on_info, profiler) if on_info is not None else None
+    _info_stream = stream
+    _stop_event = stop_event
+    _node_limit = max_nodes
+
+    if max_depth is None:
+        max_depth = SEARCH_DEPTH
+    _attach_network(board_to_search)
+
+    best_score = None
+    best_move_data = None
+    best_depth = None
+    best_pv = []
+
+    try:
+        for depth in range(1, max_depth + 1):
+            # Quick pre-check du temps (et des autres limites) avant de lancer une profondeur supérieure
+            _check_time(profiler, time_limit)
+
+            if stream is not None:
+                stream.depth = depth
+            value, move, pv = search_iteration(
+                board_to_search,
+                depth,
+                ai_color,
+                profiler,
+                position_history,
+                moves_since_capture,
+                time_limit,
+            )
+
+            # Conserver le meilleur coup complet obtenu à une profondeur terminée
+            if move is not None:
+                best_score = value
+                best_move_data = move
+                best_depth = depth
+                best_pv = pv
+                if stream is not None:
+                    stream.best = (value, pv)
+                    stream.emit("iteration")
+
+            # Arrêt anticipé si score décisif trouvé
+            if best_score is not None and abs(best_score) > WIN_SCORE / 2:
+                break
+
+    except SearchTimeout:
+        # Temps écoulé : on retourne le dernier coup complet
+        pass
+    finally:
+        _info_stream = _stop_event = _node_limit = None
+        board_to_search.accumulator = None
+
+    if stream is not None:
+        stream.depth = best_depth or 0
+        stream.emit("done")
+
+    # On retourne aussi la profondeur à laquelle le meilleur coup a été trouvé
+    result_container.append((best_score, best_move_data, best_depth, best_pv))
+
+
+#------------- ANALYSE MULTI-PV -------------------#
+def multipv_search(board, color, num_pv, profiler, position_history,
+                   moves_since_capture, time_limit=None, max_depth=None):
+    """
+    Approfondissement itératif qui retourne les `num_pv` meilleurs coups racine
+    avec leur score exact et leur variation principale.
+
+    À chaque profondeur, l'emplacement k cherche le meilleur coup parmi ceux
+    que les emplacements précédents n'ont pas retenus, en fenêtre complète,
+    en suivant d'abord la variation obtenue par ce coup à la profondeur
+    précédente. Tous les emplacements partagent la même table de
+    transposition. Le profiler reçoit les nœuds de chaque emplacement
+    (add_pv_nodes) : le premier correspond à la recherche à une seule
+    variation, les suivants au surcoût du multi-PV.
+
+    Retourne (lignes, profondeur) où lignes = [(score, coup, pv), ...] trié
+    du meilleur au moins bon, issu de la dernière profondeur terminée.
+    """
+    transposition_table.clear()
+    clear_eval_cache()
+    if max_depth is None:
+        max_depth = SEARCH_DEPTH
+
+    root_moves = get_possible_moves(board, color)
+    _attach_network(board)
+    next_color = CREAM if color == BLACK else BLACK
+    lines, completed_depth = [], None
+    previous_pvs = {}  # clé du coup racine -> variation à la profondeur précédente
+
+    try:
+        for depth in range(1, max_depth + 1):
+            # Coups classés à la profondeur précédente d'abord
+            remaining = list(root_moves)
+            depth_lines = []
+            for _ in range(min(num_pv, len(root_moves))):
+                nodes_before = profiler.nodes_visited
+                best_score, best_move, best_pv = float("-inf"), None, []
+                alpha = float("-inf")
+                for move_data in remaining:
+                    _check_time(profiler, time_limit)
+                    move_key = move_to_key(move_data)
+                    pv_seed[:] = previous_pvs.get(move_key, ())
+                    skipped = move_data[2]["skipped"] if isinstance(move_data[2], dict) else move_data[2]
+                    undo = apply_move(board, move_data)
+                    next_hash = board.zobrist_hash ^ (zobrist_turn_black if next_color == BLACK else 0)
+                    position_history[next_hash] = position_history.get(next_hash, 0) + 1
+                    try:
+                        score = -NegaMax(board, depth - 1, next_color, float("-inf"), -alpha,
+                                         profiler, position_history,
+                                         0 if skipped else moves_since_capture + 1, time_limit,
+                                         1, bool(pv_seed))[0]
+                    finally:
+                        revert_move(board, undo)
+                        position_history[next_hash] -= 1
+                        if position_history[next_hash] == 0:
+                            del position_history[next_hash]
+                    if score > best_score:
+                        best_score, best_move = score, move_data
+                        best_pv = [move_key] + pv_table[1]
+                        alpha = score
+                profiler.add_pv_nodes(len(depth_lines), profiler.nodes_visited - nodes_before)
+                remaining.remove(best_move)
+                depth_lines.append((best_score, best_move, best_pv))
+
+            lines, completed_depth = depth_lines, depth
+            previous_pvs = {pv[0]: pv for _, _, pv in depth_lines}
+            root_moves = [move for _, move, _ in depth_lines] + remaining
+
+    except SearchTimeout:
+        # Temps écoulé : on garde la dernière profondeur terminée
+        pass
+    finally:
+        board.accumulator = None
+
+    pv_seed.clear()
+    return lines, completed_depth
@@ -0,0 +1,168 @@
+# minimax/async_engine.py
+"""
+API asyncio du moteur : `await engine.search(position, limits)`.
+
+Les recherches tournent dans un groupe de processus ; une seule boucle
+d'événements peut ainsi mener plusieurs parties ou analyses en parallèle
+(une interface et un évaluateur de fond, un serveur d'analyse...) sans
+thread dédié ni scrutation de is_alive().
+
+Annuler la tâche qui attend search() arrête la recherche : si elle n'a pas
+encore commencé, elle est retirée de la file ; sinon un drapeau partagé
+avec le processus de travail est levé et run_ai_calculation s'arrête au
+prochain nœud (voir son paramètre stop_event).
+
+Exemple :
+    async with AsyncEngine(workers=4) as engine:
+        result = await engine.search(game.get_position(), SearchLimits(depth=8))
+        task = asyncio.create_task(engine.search(position, SearchLimits(time=30)))
+        ...
+        task.cancel()
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from minimax.algorithm import move_to_key, run_ai_calculation
+from minimax.profiler import AIProfiler
+
+LIMITED_MAX_DEPTH = 64  # profondeur maximale quand seuls le temps ou les nœuds limitent
+
+
+class SearchLimits(NamedTuple):
+    depth: int = None       # profondeur maximale (défaut : SEARCH_DEPTH si rien d'autre)
+    time: float = None      # budget en secondes
+    nodes: int = None       # budget de nœuds
+
+
+class SearchResult(NamedTuple):
+    score: float            # None si aucune profondeur n'a été terminée
+    move: tuple             # clé move_to_key du meilleur coup, ou None
+    pv: list                # variation principale (clés move_to_key)
+    depth: int
+    nodes: int
+    time: float
+
+
+# === Côté processus de travail ===
+_stop_flags = None
+
+
+def _init_worker(flags):
+    global _stop_flags
+    _stop_flags = flags
+
+
+class _SlotStop:
+    """Interface threading.Event minimale sur une case du tableau de drapeaux partagé."""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def is_set(self):
+        return _stop_flags[self.slot] != 0
+
+
+def _search_worker(position, limits, slot):
+    depth = limits.depth
+    if depth is None and (limits.time is not None or limits.nodes is not None):
+        depth = LIMITED_MAX_DEPTH
+    profiler = AIProfiler()
+    profiler.start_timer()
+    result = []
+    run_ai_calculation(position.to_board(), position.turn, profiler, result,
+                       position.history_counts(), position.moves_since_capture,
+                       limits.time, depth, None, _SlotStop(slot), limits.nodes)
+    profiler.stop_timer()
+    score, move, completed_depth, pv = result[0]
+    return SearchResult(score, move_to_key(move) if move is not None else None, pv,
+                        completed_depth, profiler.nodes_visited, profiler.total_time)
+
+
+# === Côté boucle d'événements ===
+def _release_slot(loop, free_slots, slot):
+    """
+    Rappel de fin d'une recherche, dans un thread de l'exécuteur : rend la
+    case à la file de la boucle. Si la boucle est déjà fermée (asyncio.run
+    terminé avant close()), plus personne n'attend de case.
+    """
+    if loop.is_closed():
+        return
+    try:
+        loop.call_soon_threadsafe(free_slots.put_nowait, slot)
+    except RuntimeError:
+        # Boucle fermée entre le test et l'appel
+        pass
+
+
+class AsyncEngine:
+    def __init__(self, workers=None, max_pending=None):
+        """
+        `workers` : processus de recherche (défaut : nombre de cœurs).
+        `max_pending` : recherches soumises en même temps, en cours ou en
+        attente d'un processus (défaut : 4 par processus) ; au-delà,
+        search() attend qu'une place se libère.
+        """
+        workers = workers or multiprocessing.cpu_count()
+        slots = max_pending or 4 * workers
+        self._flags = multiprocessing.Array("b", slots, lock=False)
+        self._pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                         initargs=(self._flags,))
+        self._free_slots = None
+        self._slots = slots
+
+    def start(self):
+        """Lance les processus de travail tout de suite plutôt qu'au premier search()."""
+        self._pool.submit(int).result()
+
+    async def search(self, position, limits=None):
+        """
+        Cherche le meilleur coup de `position` (checkers.position.Position)
+        dans les limites `limits` (SearchLimits ou dict). Retourne un
+        SearchResult ; lève CancelledError si la tâche est annulée.
+        """
+        if limits is None:
+            limits = SearchLimits()
+        elif isinstance(limits, dict):
+            limits = SearchLimits(**limits)
+        loop = asyncio.get_running_loop()
+        if self._free_slots is None:
+            self._free_slots = asyncio.Queue()
+            for slot in range(self._slots):
+                self._free_slots.put_nowait(slot)
+
+        free_slots = self._free_slots
+        slot = await free_slots.get()
+        self._flags[slot] = 0
+        try:
+            future = self._pool.submit(_search_worker, position, limits, slot)
+        except RuntimeError:
+            # Moteur fermé (close) : la case revient à la file pour les suivants
+            free_slots.put_nowait(slot)
+            raise
+        # La case n'est rendue qu'une fois le processus de travail sorti de la
+        # recherche, même si l'appelant a été annulé avant
+        future.add_done_callback(lambda _: _release_slot(loop, free_slots, slot))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            self._flags[slot] = 1
+            raise
+
+    def close(self):
+        """
+        Arrête les recherches en cours, retire celles en attente et ferme les
+        processus. Chaque case est rendue par le rappel de sa recherche ; un
+        search() lancé ensuite lève RuntimeError.
+        """
+        for slot in range(self._slots):
+            self._flags[slot] = 1
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+        return False
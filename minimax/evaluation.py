@@ -0,0 +1,338 @@
+# minimax/evaluation.py
+"""
+Fonction d'évaluation paramétrable.
+
+Les poids sont lus au démarrage dans `weights.json` (à côté de ce module) et
+complétés par DEFAULT_WEIGHTS pour les clés absentes. À chaque changement de
+poids, les termes sont "repliés" dans des tables indexées par case ou par
+masque de cases (voir checkers/tables.py), si bien que l'évaluation se réduit
+à un passage sur les 32 cases puis un passage sur les pièces trouvées.
+
+Termes évalués (du point de vue noir, puis signe selon `color`) :
+    - matériel et table positionnelle des pions (man, king, man_pst)
+    - tempo : avancement des pions, pondéré par la phase de jeu
+    - mobilité : cases vides adjacentes accessibles
+    - garde de la rangée du fond (back_rank, une valeur par case)
+    - centralisation des dames (king_center)
+    - pions "échappés" : aucun adversaire dans le cône de promotion (runaway)
+    - dames piégées : aucune case voisine libre (trapped_king)
+"""
+import json
+import os
+
+from checkers.constants import BLACK, ROWS
+from checkers.tables import (
+    SQUARES, MIRROR, NUM_SQUARES, FULL_MASK, NEIGHBOUR_MASK, UP_MASK,
+    DOWN_MASK, UP_CONE, DOWN_CONE, ROWS_TO_TOP, ROWS_TO_BOTTOM,
+    EDGE_DISTANCE, BOTTOM_ROW,
+)
+
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weights.json")
+
+# Nombre de pièces au départ, pour estimer la phase de jeu
+INITIAL_PIECES = 24
+
+DEFAULT_WEIGHTS = {
+    "man": 1.0,
+    "king": 2.8,
+    # Table positionnelle des pions, vue du camp crème (rangée 0 = promotion)
+    "man_pst": [
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.5, 0.0, 0.5, 0.0, 0.5, 0.0, 0.5, 0.0],
+        [0.0, 0.3, 0.0, 0.4, 0.0, 0.4, 0.0, 0.3],
+        [0.3, 0.0, 0.2, 0.0, 0.2, 0.0, 0.3, 0.0],
+        [0.0, 0.1, 0.0, 0.1, 0.0, 0.1, 0.0, 0.1],
+        [0.1, 0.0, 0.1, 0.0, 0.1, 0.0, 0.1, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    ],
+    "tempo": 0.05,
+    "mobility": 0.02,
+    # Garde de la rangée du fond, de la colonne a à la colonne h (camp crème)
+    "back_rank": [0.05, 0.1, 0.1, 0.05],
+    "king_center": 0.05,
+    "runaway": 0.5,
+    "trapped_king": -0.4,
+}
+
+_weights = {}
+
+# Tables repliées (reconstruites par set_weights)
+_BLACK_MAN = [0.0] * NUM_SQUARES
+_CREAM_MAN = [0.0] * NUM_SQUARES
+_KING = [0.0] * NUM_SQUARES
+_BLACK_RUNAWAY = [0.0] * NUM_SQUARES
+_CREAM_RUNAWAY = [0.0] * NUM_SQUARES
+_BLACK_BACK_RANK = [0.0] * 16  # indexé par les 4 bits des cases 0..3
+_CREAM_BACK_RANK = [0.0] * 16  # indexé par les 4 bits des cases 28..31
+_TEMPO = 0.0
+_MOBILITY = 0.0
+_TRAPPED_KING = 0.0
+
+# (index, row, col) des 32 cases jouables, pour la boucle d'évaluation
+_SCAN = tuple((sq, row, col) for sq, (row, col) in enumerate(SQUARES))
+
+
+def _mask_value(weights, index_of_bit, mask):
+    return sum(weights[index_of_bit[b]] for b in range(4) if mask >> b & 1)
+
+
+def set_weights(weights):
+    """Installe un jeu de poids (complété par les valeurs par défaut) et reconstruit les tables."""
+    global _TEMPO, _MOBILITY, _TRAPPED_KING
+
+    merged = dict(DEFAULT_WEIGHTS)
+    merged.update(weights)
+    pst = merged["man_pst"]
+    back_rank = merged["back_rank"]
+    if len(pst) != ROWS or any(len(row) != ROWS for row in pst):
+        raise ValueError("man_pst doit être une table 8x8")
+    if len(back_rank) != 4:
+        raise ValueError("back_rank doit contenir 4 valeurs")
+
+    man, king = merged["man"], merged["king"]
+    for sq, (row, col) in enumerate(SQUARES):
+        _CREAM_MAN[sq] = man + pst[row][col]
+        mirror_row, mirror_col = SQUARES[MIRROR[sq]]
+        _BLACK_MAN[sq] = man + pst[mirror_row][mirror_col]
+        _KING[sq] = king + merged["king_center"] * EDGE_DISTANCE[sq]
+        # Bonus d'autant plus fort que le pion est proche de la promotion
+        _BLACK_RUNAWAY[sq] = merged["runaway"] * (ROWS - ROWS_TO_BOTTOM[sq]) / ROWS
+        _CREAM_RUNAWAY[sq] = merged["runaway"] * (ROWS - ROWS_TO_TOP[sq]) / ROWS
+
+    # Bit b du masque crème = case 28+b ; bit b du masque noir = case b,
+    # symétrique de la case crème 31-b.
+    cream_bits = tuple(sq - BOTTOM_ROW[0] for sq in BOTTOM_ROW)
+    black_bits = tuple(MIRROR[sq] - BOTTOM_ROW[0] for sq in range(4))
+    for mask in range(16):
+        _CREAM_BACK_RANK[mask] = _mask_value(back_rank, cream_bits, mask)
+        _BLACK_BACK_RANK[mask] = _mask_value(back_rank, black_bits, mask)
+
+    _TEMPO = merged["tempo"]
+    _MOBILITY = merged["mobility"]
+    _TRAPPED_KING = merged["trapped_king"]
+
+    _weights.clear()
+    _weights.update(merged)
+
+
+def get_weights():
+    """Retourne une copie des poids actuellement utilisés."""
+    return json.loads(json.dumps(_weights))
+
+
+def load_weights(path=WEIGHTS_PATH):
+    """Charge un fichier de poids JSON ; les valeurs par défaut sont utilisées s'il est absent."""
+    weights = {}
+    if path and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            weights = json.load(f)
+    set_weights(weights)
+    return get_weights()
+
+
+def save_weights(weights, path=WEIGHTS_PATH):
+    """Écrit un jeu de poids complet au format JSON."""
+    merged = dict(DEFAULT_WEIGHTS)
+    merged.update(weights)
+    lines = []
+    for key, value in merged.items():
+        if key == "man_pst":
+            rows = ",\n".join("    " + json.dumps([round(v, 4) for v in row]) for row in value)
+            text = "[\n" + rows + "\n  ]"
+        elif isinstance(value, list):
+            text = json.dumps([round(v, 4) for v in value])
+        else:
+            text = json.dumps(round(value, 4))
+        lines.append(f"  {json.dumps(key)}: {text}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+def evaluate(board, color):
+    """Évalue `board` du point de vue de `color` (positif = avantage)."""
+    grid = board.board
+    black_men = black_kings = cream_men = cream_kings = 0
+    black_adv = cream_adv = 0
+    score = 0.0
+
+    # --- Passage 1 : matériel, tables positionnelles, masques d'occupation ---
+    for sq, row, col in _SCAN:
+        piece = grid[row][col]
+        if not piece:
+            continue
+        if piece.color == BLACK:
+            if piece.king:
+                black_kings |= 1 << sq
+                score += _KING[sq]
+            else:
+                black_men |= 1 << sq
+                score += _BLACK_MAN[sq]
+                black_adv += row
+        else:
+            if piece.king:
+                cream_kings |= 1 << sq
+                score -= _KING[sq]
+            else:
+                cream_men |= 1 << sq
+                score -= _CREAM_MAN[sq]
+                cream_adv += ROWS - 1 - row
+
+    black = black_men | black_kings
+    cream = cream_men | cream_kings
+    empty = ~(black | cream) & FULL_MASK
+
+    # --- Passage 2 : termes qui dépendent de l'occupation ---
+    mobility = 0
+    trapped = 0
+    pieces = black_men
+    while pieces:
+        bit = pieces & -pieces
+        sq = bit.bit_length() - 1
+        pieces ^= bit
+        mobility += (DOWN_MASK[sq] & empty).bit_count()
+        if not DOWN_CONE[sq] & cream:
+            score += _BLACK_RUNAWAY[sq]
+    pieces = cream_men
+    while pieces:
+        bit = pieces & -pieces
+        sq = bit.bit_length() - 1
+        pieces ^= bit
+        mobility -= (UP_MASK[sq] & empty).bit_count()
+        if not UP_CONE[sq] & black:
+            score -= _CREAM_RUNAWAY[sq]
+    pieces = black_kings
+    while pieces:
+        bit = pieces & -pieces
+        sq = bit.bit_length() - 1
+        pieces ^= bit
+        free = (NEIGHBOUR_MASK[sq] & empty).bit_count()
+        mobility += free
+        if not free:
+            trapped += 1
+    pieces = cream_kings
+    while pieces:
+        bit = pieces & -pieces
+        sq = bit.bit_length() - 1
+        pieces ^= bit
+        free = (NEIGHBOUR_MASK[sq] & empty).bit_count()
+        mobility -= free
+        if not free:
+            trapped -= 1
+
+    score += _BLACK_BACK_RANK[black_men & 0xF] - _CREAM_BACK_RANK[cream_men >> 28]
+    score += _MOBILITY * mobility + _TRAPPED_KING * trapped
+
+    # Le tempo compte surtout en finale : pondéré par le matériel disparu
+    total = (black | cream).bit_count()
+    if total < INITIAL_PIECES:
+        score += _TEMPO * (black_adv - cream_adv) * (INITIAL_PIECES - total) / INITIAL_PIECES
+
+    return score if color == BLACK else -score
+
+
+# === Forme linéaire de l'évaluation (réglage des poids) ===
+# evaluate(board, BLACK) == sum(v * f for v, f in zip(weights_to_vector(w), extract_features(board)))
+# Les 32 paramètres "pst" suivent l'ordre des cases de checkers/tables.py.
+PARAMETER_NAMES = (
+    ["man", "king"]
+    + [f"pst_{sq}" for sq in range(NUM_SQUARES)]
+    + ["tempo", "mobility"]
+    + [f"back_rank_{i}" for i in range(4)]
+    + ["king_center", "runaway", "trapped_king"]
+)
+_PST_OFFSET = 2
+_TEMPO_INDEX = _PST_OFFSET + NUM_SQUARES
+_BACK_RANK_OFFSET = _TEMPO_INDEX + 2
+_KING_CENTER_INDEX = _BACK_RANK_OFFSET + 4
+
+
+def weights_to_vector(weights):
+    """Aplati un jeu de poids dans l'ordre de PARAMETER_NAMES."""
+    merged = dict(DEFAULT_WEIGHTS)
+    merged.update(weights)
+    pst = merged["man_pst"]
+    return (
+        [merged["man"], merged["king"]]
+        + [pst[row][col] for row, col in SQUARES]
+        + [merged["tempo"], merged["mobility"]]
+        + list(merged["back_rank"])
+        + [merged["king_center"], merged["runaway"], merged["trapped_king"]]
+    )
+
+
+def vector_to_weights(vector):
+    """Inverse de weights_to_vector (les cases claires de man_pst restent à 0)."""
+    pst = [[0.0] * ROWS for _ in range(ROWS)]
+    for sq, (row, col) in enumerate(SQUARES):
+        pst[row][col] = vector[_PST_OFFSET + sq]
+    return {
+        "man": vector[0],
+        "king": vector[1],
+        "man_pst": pst,
+        "tempo": vector[_TEMPO_INDEX],
+        "mobility": vector[_TEMPO_INDEX + 1],
+        "back_rank": list(vector[_BACK_RANK_OFFSET:_BACK_RANK_OFFSET + 4]),
+        "king_center": vector[_KING_CENTER_INDEX],
+        "runaway": vector[_KING_CENTER_INDEX + 1],
+        "trapped_king": vector[_KING_CENTER_INDEX + 2],
+    }
+
+
+def extract_features(board):
+    """
+    Vecteur de caractéristiques (noir - crème) de `board`, dans l'ordre de
+    PARAMETER_NAMES. Plus lent que evaluate() ; réservé au réglage hors ligne.
+    """
+    features = [0.0] * len(PARAMETER_NAMES)
+    grid = board.board
+    black = cream = 0
+    men = []
+    kings = []
+    black_adv = cream_adv = 0
+    for sq, row, col in _SCAN:
+        piece = grid[row][col]
+        if not piece:
+            continue
+        is_black = piece.color == BLACK
+        if is_black:
+            black |= 1 << sq
+        else:
+            cream |= 1 << sq
+        (kings if piece.king else men).append((sq, is_black))
+
+    empty = ~(black | cream) & FULL_MASK
+    for sq, is_black in men:
+        sign = 1 if is_black else -1
+        features[0] += sign
+        features[_PST_OFFSET + (MIRROR[sq] if is_black else sq)] += sign
+        if is_black:
+            black_adv += ROWS_TO_TOP[sq]
+            features[_TEMPO_INDEX + 1] += (DOWN_MASK[sq] & empty).bit_count()
+            if sq < 4:
+                features[_BACK_RANK_OFFSET + MIRROR[sq] - BOTTOM_ROW[0]] += 1
+            if not DOWN_CONE[sq] & cream:
+                features[_KING_CENTER_INDEX + 1] += (ROWS - ROWS_TO_BOTTOM[sq]) / ROWS
+        else:
+            cream_adv += ROWS_TO_BOTTOM[sq]
+            features[_TEMPO_INDEX + 1] -= (UP_MASK[sq] & empty).bit_count()
+            if sq >= BOTTOM_ROW[0]:
+                features[_BACK_RANK_OFFSET + sq - BOTTOM_ROW[0]] -= 1
+            if not UP_CONE[sq] & black:
+                features[_KING_CENTER_INDEX + 1] -= (ROWS - ROWS_TO_TOP[sq]) / ROWS
+    for sq, is_black in kings:
+        sign = 1 if is_black else -1
+        free = (NEIGHBOUR_MASK[sq] & empty).bit_count()
+        features[1] += sign
+        features[_TEMPO_INDEX + 1] += sign * free
+        features[_KING_CENTER_INDEX] += sign * EDGE_DISTANCE[sq]
+        if not free:
+            features[_KING_CENTER_INDEX + 2] += sign
+
+    total = (black | cream).bit_count()
+    if total < INITIAL_PIECES:
+        features[_TEMPO_INDEX] = (black_adv - cream_adv) * (INITIAL_PIECES - total) / INITIAL_PIECES
+    return features
+
+
+load_weights()
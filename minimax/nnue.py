@@ -0,0 +1,167 @@
+# minimax/nnue.py
+"""
+Évaluation par petit réseau de neurones à accumulateur incrémental (NNUE),
+sur CPU avec NumPy. Optionnelle : sans NumPy ou sans réseau chargé,
+Board.evaluate reste l'évaluation paramétrée de minimax/evaluation.py.
+
+Réseau : 128 entrées binaires (4 plans de 32 cases : pions noirs, dames
+noires, pions crème, dames crème, dans l'ordre de Board.snapshot()), une
+couche cachée de HIDDEN neurones à ReLU bornée, une sortie. Comme
+evaluate(), la sortie est vue du camp noir, en pions, et change de signe
+pour crème.
+
+Poids quantifiés en int16 : première couche × QA, seconde × QB. La
+première couche ne dépend que des pièces présentes ; sa somme
+(l'accumulateur, en int32 pour ne jamais déborder) est tenue à jour par les mêmes fonctions de Board que le
+hash Zobrist (update_hash_move, update_hash_promotion, update_hash_piece),
+soit une ou deux additions de vecteurs par pièce déplacée, prise ou
+promue. L'évaluation ne calcule alors que la ReLU bornée et un produit
+scalaire.
+
+run_ai_calculation attache un accumulateur au plateau cherché quand un
+réseau est installé (set_network) ; le réseau s'entraîne avec
+tools/train_nnue.py sur les positions de tools/selfplay.py.
+
+Exemple :
+    from minimax import nnue
+    nnue.set_network(nnue.load_network())     # minimax/nnue.npz
+    ...
+    nnue.set_network(None)                    # retour à l'évaluation classique
+"""
+import os
+
+try:
+    import numpy as np
+except ImportError:     # NumPy absent : le réseau est indisponible, le reste fonctionne
+    np = None
+
+from checkers.constants import BLACK, CREAM
+from checkers.tables import SQUARES, NUM_SQUARES
+
+NETWORK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nnue.npz")
+
+INPUTS = 4 * NUM_SQUARES
+HIDDEN = 32
+QA = 127                # échelle de la première couche (et borne de la ReLU)
+QB = 64                 # échelle de la couche de sortie
+
+# Index d'entrée de chaque (couleur, dame, ligne, colonne), clés de zobrist_table
+FEATURES = {}
+for _sq, (_row, _col) in enumerate(SQUARES):
+    for _plane, (_color, _king) in enumerate(((BLACK, False), (BLACK, True),
+                                              (CREAM, False), (CREAM, True))):
+        FEATURES[(_color, _king, _row, _col)] = _plane * NUM_SQUARES + _sq
+
+_network = None
+
+
+def available():
+    return np is not None
+
+
+def snapshot_features(snapshot):
+    """Index des entrées actives de Board.snapshot() (ou des 4 bitboards d'un Record)."""
+    indices = []
+    for plane, mask in enumerate(snapshot):
+        while mask:
+            low = mask & -mask
+            indices.append(plane * NUM_SQUARES + low.bit_length() - 1)
+            mask ^= low
+    return indices
+
+
+class Network:
+    """Poids quantifiés : w1 (INPUTS × hidden), b1, w2 en int16 (calcul en int32), b2."""
+
+    def __init__(self, w1, b1, w2, b2):
+        for name, weights in (("w1", w1), ("b1", b1), ("w2", w2)):
+            weights = np.asarray(weights)
+            if weights.size and (weights.min() < -32768 or weights.max() > 32767):
+                raise ValueError(f"réseau NNUE : {name} hors de l'intervalle int16")
+        self.w1 = np.ascontiguousarray(w1, dtype=np.int16)
+        self.b1 = np.ascontiguousarray(b1, dtype=np.int16)
+        self.w2 = np.asarray(w2, dtype=np.int16).astype(np.int32)
+        self.b2 = int(b2)
+        self.hidden = self.w1.shape[1]
+        if self.w1.shape[0] != INPUTS or self.b1.shape != (self.hidden,) \
+                or self.w2.shape != (self.hidden,):
+            raise ValueError(f"réseau NNUE de dimensions incohérentes : {self.w1.shape}")
+        self._scale = 1.0 / (QA * QB)
+
+    @classmethod
+    def from_float(cls, w1, b1, w2, b2):
+        """Quantifie un réseau entraîné en flottants (sortie en pions)."""
+        return cls(np.clip(np.rint(np.asarray(w1) * QA), -32767, 32767),
+                   np.clip(np.rint(np.asarray(b1) * QA), -32767, 32767),
+                   np.clip(np.rint(np.asarray(w2) * QB), -32767, 32767),
+                   round(float(b2) * QA * QB))
+
+    def accumulator(self, board):
+        return Accumulator(self, board)
+
+    def output(self, values, color):
+        hidden = np.clip(values, 0, QA).astype(np.int32)
+        score = (int(hidden @ self.w2) + self.b2) * self._scale
+        return score if color == BLACK else -score
+
+    def evaluate_snapshot(self, snapshot, color):
+        """Évaluation sans accumulateur (outils hors ligne)."""
+        values = self.b1 + self.w1[snapshot_features(snapshot)].sum(axis=0, dtype=np.int32)
+        return self.output(values, color)
+
+
+class Accumulator:
+    """Première couche du réseau pour un plateau, mise à jour coup par coup."""
+    __slots__ = ("network", "weights", "values")
+
+    def __init__(self, network, board):
+        self.network = network
+        self.weights = network.w1
+        indices = [FEATURES[(piece.color, piece.king, row, col)]
+                   for row, col in SQUARES
+                   for piece in (board.board[row][col],) if piece]
+        self.values = network.b1 + self.weights[indices].sum(axis=0, dtype=np.int32)
+
+    def move(self, color, king, old_row, old_col, new_row, new_col):
+        weights = self.weights
+        self.values += weights[FEATURES[(color, king, new_row, new_col)]]
+        self.values -= weights[FEATURES[(color, king, old_row, old_col)]]
+
+    def toggle_king(self, color, was_king, row, col):
+        """La pièce en (row, col) passe de pion à dame (ou l'inverse si `was_king`)."""
+        weights = self.weights
+        self.values += weights[FEATURES[(color, not was_king, row, col)]]
+        self.values -= weights[FEATURES[(color, was_king, row, col)]]
+
+    def add(self, color, king, row, col):
+        self.values += self.weights[FEATURES[(color, king, row, col)]]
+
+    def remove(self, color, king, row, col):
+        self.values -= self.weights[FEATURES[(color, king, row, col)]]
+
+    def evaluate(self, color):
+        return self.network.output(self.values, color)
+
+
+# === Réseau installé ===
+def load_network(path=NETWORK_PATH):
+    """Lit un réseau écrit par save_network. RuntimeError sans NumPy."""
+    if np is None:
+        raise RuntimeError("l'évaluation NNUE nécessite NumPy")
+    with np.load(path) as data:
+        return Network(data["w1"], data["b1"], data["w2"], data["b2"])
+
+
+def save_network(network, path=NETWORK_PATH):
+    np.savez(path, w1=network.w1, b1=network.b1, w2=network.w2.astype(np.int16),
+             b2=np.int32(network.b2))
+
+
+def set_network(network):
+    """Installe `network` pour les recherches suivantes ; None revient à evaluate()."""
+    global _network
+    _network = network
+
+
+def get_network():
+    return _network
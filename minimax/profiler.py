@@ -5,19 +5,27 @@ class AIProfiler:
     def __init__(self):
         self.nodes_visited = 0
         self.cutoffs = 0
+        self.first_move_cutoffs = 0
         self.tt_hits = 0  
         self.tt_size = 0
+        self.eval_cache_hits = 0
+        self.eval_cache_misses = 0
         self.start_time = 0
         self.total_time = 0
+        self.pv_nodes = []  # Nœuds par emplacement en recherche multi-PV
 
     def reset(self):
         """Réinitialise les compteurs pour un nouveau tour de recherche."""
         self.nodes_visited = 0
         self.cutoffs = 0
+        self.first_move_cutoffs = 0
         self.tt_hits = 0
         self.tt_size = 0
+        self.eval_cache_hits = 0
+        self.eval_cache_misses = 0
         self.start_time = 0
         self.total_time = 0
+        self.pv_nodes = []
 
     def start_timer(self):
         """Démarre le chronomètre."""
@@ -34,20 +42,55 @@ class AIProfiler:
     def increment_cutoffs(self):
         """Incrémente le nombre de coupures alpha-bêta."""
         self.cutoffs += 1
-    
+
     def increment_tt_hits(self):
         """Incrémente le compteur de succès dans la table de transposition."""
         self.tt_hits += 1
 
+    def add_pv_nodes(self, slot, nodes):
+        """Ajoute les nœuds consacrés à l'emplacement `slot` d'une recherche multi-PV."""
+        while len(self.pv_nodes) <= slot:
+            self.pv_nodes.append(0)
+        self.pv_nodes[slot] += nodes
+
+    def multipv_overhead(self):
+        """Surcoût (en %) des variations supplémentaires par rapport à la première seule."""
+        if len(self.pv_nodes) < 2 or self.pv_nodes[0] == 0:
+            return 0
+        return sum(self.pv_nodes[1:]) / self.pv_nodes[0] * 100
+
+    def eval_cache_hit_rate(self):
+        """Part (en %) des évaluations lues dans le cache d'évaluation."""
+        lookups = self.eval_cache_hits + self.eval_cache_misses
+        return self.eval_cache_hits / lookups * 100 if lookups > 0 else 0
+
     def set_tt_size(self, size):
         """Enregistre la taille finale de la table de transposition."""
         self.tt_size = size
 
+    def as_dict(self):
+        """Retourne les statistiques de la recherche sous forme de dictionnaire (export JSON)."""
+        return {
+            "nodes": self.nodes_visited,
+            "time": self.total_time,
+            "nps": int(self.nodes_visited / self.total_time) if self.total_time > 0 else 0,
+            "cutoffs": self.cutoffs,
+            "cutoff_rate": (self.cutoffs / self.nodes_visited * 100) if self.nodes_visited > 0 else 0,
+            "first_move_cutoff_rate": (self.first_move_cutoffs / self.cutoffs * 100) if self.cutoffs > 0 else 0,
+            "tt_hits": self.tt_hits,
+            "tt_size": self.tt_size,
+            "eval_cache_hits": self.eval_cache_hits,
+            "eval_cache_hit_rate": self.eval_cache_hit_rate(),
+            "pv_nodes": list(self.pv_nodes),
+            "multipv_overhead": self.multipv_overhead(),
+        }
+
     def display_results(self, depth, best_score, best_move_data): 
         """Affiche les résultats de la recherche dans un tableau bien structuré."""
         
         nodes_per_second = int(self.nodes_visited / self.total_time) if self.total_time > 0 else 0
         cutoff_rate = (self.cutoffs / self.nodes_visited * 100) if self.nodes_visited > 0 else 0
+        first_move_rate = (self.first_move_cutoffs / self.cutoffs * 100) if self.cutoffs > 0 else 0
 
         # Formatter la description du meilleur coup pour l'affichage
         move_str = "N/A"
@@ -68,8 +111,13 @@ class AIProfiler:
         print(f"{'Nodes per Second':<30} | {nodes_per_second:,}")
         print(f"{'Alpha-Beta Cutoffs':<30} | {self.cutoffs:,}")
         print(f"{'Cutoff Rate':<30} | {cutoff_rate:.2f}%")
+        print(f"{'First-Move Cutoffs':<30} | {first_move_rate:.2f}%")
         print(f"{'Transposition Hits':<30} | {self.tt_hits:,}")
         print(f"{'Transposition Table Size':<30} | {self.tt_size:,}")
+        print(f"{'Eval Cache Hit Rate':<30} | {self.eval_cache_hit_rate():.2f}%")
+        if len(self.pv_nodes) > 1:
+            print(f"{'Multi-PV Lines':<30} | {len(self.pv_nodes)}")
+            print(f"{'Multi-PV Extra Cost':<30} | {self.multipv_overhead():.1f}% nodes")
         print(f"{'Best Score Found':<30} | {best_score:.2f}")
         print(f"{'Best Move Found':<30} | {move_str}")
         print("="*70 + "\n")
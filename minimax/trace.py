@@ -0,0 +1,199 @@
+# minimax/trace.py
+"""
+Traçage détaillé de la recherche : nœuds par ply, nœuds de quiétude,
+répartition du temps par phase et facteur de branchement effectif de chaque
+itération.
+
+Le traçage ne coûte rien quand il est désactivé : aucune instruction de
+mesure n'est écrite dans NegaMax. SearchTracer.install() remplace
+temporairement les fonctions concernées (génération de coups, évaluation,
+accès à la TT, jouer/défaire un coup, NegaMax, quiescenceSearch,
+search_iteration) par des versions chronométrées, et uninstall() remet les
+originales. Les modules qui ont importé ces fonctions par leur nom gardent
+les originales : passer par `algorithm.search_iteration` ou
+`algorithm.run_ai_calculation` pour être tracé.
+
+Exemple :
+    with SearchTracer() as tracer:
+        algorithm.run_ai_calculation(board, color, profiler, result, {}, 0, None, 8)
+    tracer.display()
+    tracer.write_json("trace.json")
+    tracer.write_folded("trace.folded")  # flamegraph.pl / speedscope
+"""
+import json
+import time
+
+from checkers.board import Board
+from minimax import algorithm
+
+# Phases chronométrées : nom -> [(objet, attribut), ...]
+PHASES = {
+    "movegen": [(algorithm, "get_possible_moves"), (algorithm, "get_capture_moves"),
+                (Board, "get_valid_moves"), (Board, "get_all_pieces")],
+    "eval": [(Board, "evaluate")],
+    "tt": [(algorithm, "tt_get"), (algorithm, "tt_set"), (Board, "__repr__")],
+    "make_undo": [(Board, "make_move"), (Board, "undo_move"),
+                  (Board, "remove_and_get_skipped"), (Board, "restore_skipped")],
+}
+
+
+class SearchTracer:
+    def __init__(self):
+        self.reset()
+        self._originals = []
+
+    def reset(self):
+        self.ply_nodes = {}      # ply -> appels de NegaMax
+        self.qsearch_nodes = 0   # appels de quiescenceSearch
+        self.phase_time = {}     # (région, phase) -> secondes
+        self.iterations = []
+        self.total_time = 0.0
+        self._phase = None       # phase en cours (les appels imbriqués n'y ajoutent rien)
+        self._qsearch_depth = 0
+        self._start = None
+
+    # === Installation des sondes ===
+    def install(self):
+        if self._originals:
+            return self
+        for phase, targets in PHASES.items():
+            for owner, name in targets:
+                self._patch(owner, name, self._timed(phase, getattr(owner, name)))
+        self._patch(algorithm, "NegaMax", self._count_negamax(algorithm.NegaMax))
+        self._patch(algorithm, "quiescenceSearch", self._count_qsearch(algorithm.quiescenceSearch))
+        self._patch(algorithm, "search_iteration", self._log_iteration(algorithm.search_iteration))
+        self._start = time.perf_counter()
+        return self
+
+    def uninstall(self):
+        if self._start is not None:
+            self.total_time += time.perf_counter() - self._start
+            self._start = None
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
+
+    def _patch(self, owner, name, wrapper):
+        # vars() : l'attribut tel qu'il est défini (une fonction, pas une méthode liée)
+        self._originals.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, wrapper)
+
+    def _timed(self, phase, function):
+        tracer = self
+
+        def wrapper(*args, **kwargs):
+            if tracer._phase is not None:
+                return function(*args, **kwargs)
+            tracer._phase = phase
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                key = ("qsearch" if tracer._qsearch_depth else "negamax", phase)
+                tracer.phase_time[key] = tracer.phase_time.get(key, 0.0) + \
+                    time.perf_counter() - start
+                tracer._phase = None
+        return wrapper
+
+    def _count_negamax(self, function):
+        tracer = self
+
+        def wrapper(*args, **kwargs):
+            ply = args[9] if len(args) > 9 else kwargs.get("ply", 0)
+            tracer.ply_nodes[ply] = tracer.ply_nodes.get(ply, 0) + 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def _count_qsearch(self, function):
+        tracer = self
+
+        def wrapper(*args, **kwargs):
+            tracer.qsearch_nodes += 1
+            tracer._qsearch_depth += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer._qsearch_depth -= 1
+        return wrapper
+
+    def _log_iteration(self, function):
+        tracer = self
+
+        def wrapper(board, depth, color, profiler, *args, **kwargs):
+            nodes_before = profiler.nodes_visited
+            qnodes_before = tracer.qsearch_nodes
+            start = time.perf_counter()
+            result = function(board, depth, color, profiler, *args, **kwargs)
+            nodes = profiler.nodes_visited - nodes_before
+            previous = tracer.iterations[-1]["nodes"] if tracer.iterations else 0
+            tracer.iterations.append({
+                "depth": depth,
+                "nodes": nodes,
+                "qsearch_nodes": tracer.qsearch_nodes - qnodes_before,
+                "time": time.perf_counter() - start,
+                # Facteur de branchement effectif : nœuds(d) / nœuds(d-1)
+                "ebf": nodes / previous if previous else None,
+                "score": result[0],
+                "pv_length": len(result[2]),
+            })
+            return result
+        return wrapper
+
+    # === Résultats ===
+    def phase_totals(self):
+        """Temps par phase (toutes régions confondues), plus "other" : le reste de la recherche."""
+        totals = {}
+        for (_, phase), seconds in self.phase_time.items():
+            totals[phase] = totals.get(phase, 0.0) + seconds
+        totals["other"] = max(self.total_time - sum(totals.values()), 0.0)
+        return totals
+
+    def as_dict(self):
+        return {
+            "total_time": self.total_time,
+            "ply_nodes": {str(ply): count for ply, count in sorted(self.ply_nodes.items())},
+            "qsearch_nodes": self.qsearch_nodes,
+            "phases": self.phase_totals(),
+            "phases_by_region": {f"{region}.{phase}": seconds
+                                 for (region, phase), seconds in sorted(self.phase_time.items())},
+            "iterations": self.iterations,
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write("\n")
+
+    def folded_stacks(self):
+        """Piles repliées (format de flamegraph.pl / speedscope), poids en microsecondes."""
+        lines = [f"search;{region};{phase} {int(seconds * 1e6)}"
+                 for (region, phase), seconds in sorted(self.phase_time.items())]
+        lines.append(f"search;other {int(self.phase_totals()['other'] * 1e6)}")
+        return lines
+
+    def write_folded(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.folded_stacks()) + "\n")
+
+    def display(self):
+        print(f"{'Iteration':<10} {'Nodes':>10} {'QNodes':>10} {'Time (s)':>9} {'EBF':>6}  Score")
+        for it in self.iterations:
+            ebf = f"{it['ebf']:.2f}" if it["ebf"] else "-"
+            score = f"{it['score']:.2f}" if it["score"] is not None else "-"
+            print(f"{it['depth']:<10} {it['nodes']:>10,} {it['qsearch_nodes']:>10,} "
+                  f"{it['time']:>9.3f} {ebf:>6}  {score}")
+        print("\nNodes per ply: " + ", ".join(f"{ply}:{count:,}"
+                                               for ply, count in sorted(self.ply_nodes.items())))
+        print(f"Quiescence nodes: {self.qsearch_nodes:,}")
+        totals = self.phase_totals()
+        print("\nTime per phase:")
+        for phase, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            share = seconds / self.total_time * 100 if self.total_time else 0
+            print(f"  {phase:<10} {seconds:8.3f}s  {share:5.1f}%")
@@ -0,0 +1,38 @@
+# tests/conftest.py
+"""
+Configuration commune des tests (`python -m pytest` depuis la racine du
+dépôt) : la racine est ajoutée au chemin d'import et quelques positions
+de parties jouées au hasard servent aux tests de propriétés.
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax.algorithm import apply_move, get_possible_moves
+
+
+def random_game(seed, plies=80):
+    """Positions (chaîne de 32 cases, trait) d'une partie jouée au hasard depuis le départ."""
+    rng = random.Random(seed)
+    board = Board()
+    turn = CREAM
+    positions = []
+    for _ in range(plies):
+        moves = get_possible_moves(board, turn)
+        if not moves:
+            break
+        positions.append((board.to_string(), turn))
+        apply_move(board, rng.choice(moves))
+        turn = BLACK if turn == CREAM else CREAM
+    return positions
+
+
+@pytest.fixture(scope="session")
+def random_positions():
+    return [position for seed in range(6) for position in random_game(seed)]
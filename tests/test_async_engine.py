@@ -0,0 +1,57 @@
+# tests/test_async_engine.py
+import asyncio
+import logging
+import time
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import CREAM
+from checkers.position import Position
+from minimax.async_engine import AsyncEngine, SearchLimits
+
+
+def start_position():
+    return Position.from_board(Board(), CREAM)
+
+
+def test_search_and_close():
+    async def main():
+        async with AsyncEngine(workers=1, max_pending=2) as engine:
+            result = await engine.search(start_position(), SearchLimits(depth=3))
+            free = engine._free_slots.qsize()
+        return result, free
+
+    result, free = asyncio.run(main())
+    assert result.depth == 3
+    assert result.move is not None
+    assert free == 2
+
+
+def test_search_after_close_gives_slot_back():
+    async def main():
+        engine = AsyncEngine(workers=1, max_pending=1)
+        await engine.search(start_position(), SearchLimits(depth=1))
+        engine.close()
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await engine.search(start_position(), SearchLimits(depth=1))
+        return engine._free_slots.qsize()
+
+    assert asyncio.run(main()) == 1
+
+
+def test_search_finishing_after_loop_closed(caplog):
+    engine = AsyncEngine(workers=1, max_pending=2)
+
+    async def main():
+        # Le seul processus est occupé : la recherche, annulée à la sortie
+        # d'asyncio.run, ne se termine qu'après la fermeture de la boucle
+        engine._pool.submit(time.sleep, 0.5)
+        asyncio.create_task(engine.search(start_position(), SearchLimits(depth=6)))
+        await asyncio.sleep(0.1)
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(main())
+        engine.close()
+    assert not caplog.records
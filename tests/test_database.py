@@ -0,0 +1,100 @@
+# tests/test_database.py
+import random
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK
+from checkers.database import (
+    NO_MOVE, RESULT_UNKNOWN, PositionDB, PositionDBWriter, build_index, decode_move, encode_move,
+    position_key, truncate,
+)
+from checkers.position import Position
+from checkers.tables import SQUARE_INDEX
+from minimax.algorithm import get_possible_moves, move_to_key, zobrist_turn_black
+
+
+def entries(random_positions):
+    rng = random.Random(5)
+    found = []
+    for text, turn in random_positions:
+        board = Board.from_string(text)
+        moves = get_possible_moves(board, turn)
+        move = move_to_key(rng.choice(moves)) if moves else None
+        found.append((Position.from_board(board, turn), rng.choice((1, 0, -1, RESULT_UNKNOWN)), move))
+    return found
+
+
+def test_records_round_trip(tmp_path, random_positions):
+    path = str(tmp_path / "test.db")
+    written = entries(random_positions)
+    with PositionDBWriter(path) as writer:
+        writer.extend(written)
+    db = PositionDB(path)
+    try:
+        assert len(db) == len(written)
+        assert list(db) == [db[i] for i in range(len(db))]
+        for record, (position, result, move) in zip(db, written):
+            assert record.snapshot == position[:4]
+            assert record.side == position.side
+            assert record.result == result
+            board = position.to_board()
+            assert record.key == board.zobrist_hash ^ (zobrist_turn_black if position.turn == BLACK else 0)
+            assert record.key == position_key(*position[:5])
+            assert record.move == encode_move(move)
+    finally:
+        db.close()
+
+
+def test_move_encoding(random_positions):
+    assert encode_move(None) == NO_MOVE
+    assert decode_move(NO_MOVE) is None
+    for _, _, move in entries(random_positions):
+        if move is None:
+            continue
+        start_row, start_col, end_row, end_col, skipped = move
+        assert decode_move(encode_move(move)) == (
+            SQUARE_INDEX[start_row][start_col], SQUARE_INDEX[end_row][end_col], bool(skipped))
+
+
+def test_append_index_and_truncate(tmp_path, random_positions):
+    path = str(tmp_path / "test.db")
+    written = entries(random_positions)
+    half = len(written) // 2
+    with PositionDBWriter(path) as writer:
+        writer.extend(written[:half])
+    assert build_index(path) == half
+    with PositionDBWriter(path) as writer:
+        writer.extend(written[half:])
+
+    db = PositionDB(path)
+    assert len(db) == len(written)
+    assert db.index is None             # index plus ancien que la base : ignoré
+    with pytest.raises(ValueError):
+        db.lookup(0)
+    db.close()
+
+    build_index(path)
+    db = PositionDB(path)
+    try:
+        for i, record in enumerate(db):
+            found = db.lookup(record.key)
+            assert i in found
+            assert all(db[j].key == record.key for j in found)
+        assert db.lookup(12345) == []
+    finally:
+        db.close()
+
+    truncate(path, 3)
+    db = PositionDB(path)
+    assert len(db) == 3
+    db.close()
+
+
+def test_bad_header(tmp_path):
+    path = tmp_path / "bad.db"
+    path.write_bytes(b"PASUNEDB" + bytes(24))
+    with pytest.raises(ValueError):
+        PositionDB(str(path))
+    with pytest.raises(ValueError):
+        PositionDBWriter(str(path))
@@ -0,0 +1,50 @@
+# tests/test_engine.py
+import io
+
+from checkers.constants import BLACK
+from engine import Engine
+from minimax.algorithm import zobrist_turn_black
+
+# Une dame de chaque côté, loin l'une de l'autre ; crème au trait
+KINGS = "board B" + "." * 30 + "W w"
+SHUFFLE = ["g1-h2", "b8-a7", "h2-g1", "a7-b8"]
+
+
+def run(engine, *lines):
+    for line in lines:
+        assert engine.handle(line)
+    engine.wait_search()
+    return engine.out.getvalue().splitlines()
+
+
+def key(engine):
+    return engine.board.zobrist_hash ^ (zobrist_turn_black if engine.turn == BLACK else 0)
+
+
+def test_position_counts_start_and_moves():
+    engine = Engine(io.StringIO())
+    run(engine, "position " + KINGS)
+    start = key(engine)
+    assert engine.position_history == {start: 1}
+    run(engine, "position " + KINGS + " moves " + " ".join(SHUFFLE * 2))
+    assert engine.position_history[start] == 3
+    assert engine.moves_since_capture == 8
+    assert "illegal" not in engine.out.getvalue()
+
+
+def test_position_waits_for_fixed_depth_search():
+    engine = Engine(io.StringIO())
+    lines = run(engine, "position startpos", "go depth 5", "position startpos moves c3-d4")
+    depths = [int(line.split()[2]) for line in lines if line.startswith("info depth") and " pv " in line]
+    assert depths[-1] == 5
+    assert lines[-1].startswith("bestmove ")
+    assert engine.board.to_string() != Engine(io.StringIO()).board.to_string()
+
+
+def test_position_stops_infinite_search():
+    engine = Engine(io.StringIO())
+    engine.handle("position startpos")
+    engine.handle("go infinite")
+    engine.handle("ucinewgame")
+    assert engine.thread is None
+    assert engine.out.getvalue().splitlines()[-1].startswith("bestmove ")
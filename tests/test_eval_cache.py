@@ -0,0 +1,64 @@
+# tests/test_eval_cache.py
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax import algorithm
+from minimax.algorithm import (
+    EVAL_CACHE_SIZE, cached_evaluate, clear_eval_cache, move_to_key, run_ai_calculation,
+    set_eval_cache_size,
+)
+from minimax.profiler import AIProfiler
+
+
+@pytest.fixture
+def restore_cache():
+    yield
+    set_eval_cache_size(EVAL_CACHE_SIZE)
+
+
+def best_line(text, color, depth=4):
+    profiler = AIProfiler()
+    profiler.start_timer()
+    result = []
+    run_ai_calculation(Board.from_string(text), color, profiler, result, {}, 0, None, depth)
+    score, move, _, pv = result[0]
+    return score, move_to_key(move), pv, profiler.nodes_visited
+
+
+def test_eval_cache_negates_for_cream(random_positions, restore_cache):
+    clear_eval_cache()
+    profiler = AIProfiler()
+    for text, _ in random_positions:
+        board = Board.from_string(text)
+        black = cached_evaluate(board, BLACK, profiler)
+        assert black == board.evaluate(BLACK)
+        assert cached_evaluate(board, CREAM, profiler) == -black
+    assert profiler.eval_cache_hits >= len(random_positions)
+
+
+def test_eval_cache_size(restore_cache):
+    set_eval_cache_size(1000)
+    assert len(algorithm._eval_cache_keys) == 512
+    set_eval_cache_size(0)
+    profiler = AIProfiler()
+    board = Board()
+    assert cached_evaluate(board, CREAM, profiler) == board.evaluate(CREAM)
+    assert profiler.eval_cache_hits == profiler.eval_cache_misses == 0
+
+
+def test_eval_cache_collisions(random_positions, restore_cache):
+    # Une seule case : chaque nouvelle position remplace la précédente
+    set_eval_cache_size(1)
+    profiler = AIProfiler()
+    for text, _ in random_positions[:40]:
+        board = Board.from_string(text)
+        assert cached_evaluate(board, CREAM, profiler) == board.evaluate(CREAM)
+
+
+def test_search_same_with_and_without_eval_cache(random_positions, restore_cache):
+    for text, turn in random_positions[::40]:
+        with_cache = best_line(text, turn)
+        set_eval_cache_size(0)
+        assert best_line(text, turn) == with_cache
+        set_eval_cache_size(EVAL_CACHE_SIZE)
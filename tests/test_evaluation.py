@@ -0,0 +1,72 @@
+# tests/test_evaluation.py
+import random
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax import evaluation
+from minimax.evaluation import (
+    PARAMETER_NAMES, evaluate, extract_features, get_weights, load_weights, set_weights,
+    vector_to_weights, weights_to_vector,
+)
+
+
+@pytest.fixture
+def restore_weights():
+    yield
+    load_weights()
+
+
+def mirrored(text):
+    """Même position vue de l'autre camp : cases symétriques, couleurs échangées."""
+    return text[::-1].translate(str.maketrans("bBwW", "wWbB"))
+
+
+def linear_score(weights, board):
+    return sum(v * f for v, f in zip(weights_to_vector(weights), extract_features(board)))
+
+
+def test_features_match_evaluate(random_positions):
+    weights = get_weights()
+    for text, _ in random_positions:
+        board = Board.from_string(text)
+        assert len(extract_features(board)) == len(PARAMETER_NAMES)
+        assert linear_score(weights, board) == pytest.approx(evaluate(board, BLACK), abs=1e-9)
+
+
+def test_features_match_evaluate_with_other_weights(random_positions, restore_weights):
+    rng = random.Random(1)
+    vector = [rng.uniform(-1.0, 1.0) for _ in PARAMETER_NAMES]
+    weights = vector_to_weights(vector)
+    set_weights(weights)
+    for text, _ in random_positions:
+        board = Board.from_string(text)
+        assert linear_score(weights, board) == pytest.approx(evaluate(board, BLACK), abs=1e-9)
+
+
+def test_vector_round_trip():
+    vector = weights_to_vector(get_weights())
+    assert len(vector) == len(PARAMETER_NAMES)
+    assert weights_to_vector(vector_to_weights(vector)) == vector
+
+
+def test_evaluation_is_symmetric(random_positions):
+    for text, _ in random_positions:
+        board = Board.from_string(text)
+        other = Board.from_string(mirrored(text))
+        assert evaluate(other, BLACK) == pytest.approx(-evaluate(board, BLACK), abs=1e-9)
+        assert evaluate(board, CREAM) == -evaluate(board, BLACK)
+
+
+def test_missing_keys_use_defaults(restore_weights):
+    set_weights({"man": 1.5})
+    weights = get_weights()
+    assert weights["man"] == 1.5
+    assert weights["king"] == evaluation.DEFAULT_WEIGHTS["king"]
+
+
+@pytest.mark.parametrize("weights", [{"man_pst": [[0.0] * 8] * 7}, {"back_rank": [0.1] * 3}])
+def test_invalid_weights(weights, restore_weights):
+    with pytest.raises(ValueError):
+        set_weights(weights)
@@ -0,0 +1,62 @@
+# tests/test_game_history.py
+import random
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from checkers.board import Board
+from checkers.game import Game
+from minimax.algorithm import get_possible_moves
+
+
+def state(game):
+    return (game.board.to_string(), game.turn, game.moves_since_capture, dict(game.position_history),
+            game.board.zobrist_hash, game.move_counter, game.board.black_left, game.board.cream_left,
+            game.board.black_kings, game.board.cream_kings)
+
+
+def play_random(game, rng):
+    moves = get_possible_moves(game.board, game.turn)
+    if not moves:
+        return False
+    piece, (row, col), details = rng.choice(moves)
+    skipped = details["skipped"] if isinstance(details, dict) else details
+    game.play_move(piece, row, col, skipped)
+    return True
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_undo_restores_every_turn(seed):
+    rng = random.Random(seed)
+    game = Game(None)
+    states = [state(game)]
+    for _ in range(60):
+        if not play_random(game, rng):
+            break
+        if not play_random(game, rng):
+            game._unplay_move()
+            break
+        states.append(state(game))
+    for expected in reversed(states[:-1]):
+        game.undo_move()
+        assert state(game) == expected
+    assert game.move_log == []
+    assert game.position_history == {}
+
+
+def test_undo_needs_a_full_turn():
+    game = Game(None)
+    play_random(game, random.Random(0))
+    before = state(game)
+    game.undo_move()
+    assert state(game) == before
+
+
+def test_snapshot_round_trip(random_positions):
+    for text, _ in random_positions:
+        board = Board.from_string(text)
+        copy = Board.from_snapshot(board.snapshot())
+        assert copy.to_string() == text
+        assert copy.zobrist_hash == board.zobrist_hash
+        assert copy.board is not board.board
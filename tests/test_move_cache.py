@@ -0,0 +1,65 @@
+# tests/test_move_cache.py
+import pytest
+
+from checkers.board import Board
+from checkers.constants import CREAM
+from minimax.algorithm import (
+    _generate_moves, get_possible_moves, move_cache, move_to_key, run_ai_calculation,
+    set_move_cache_size,
+)
+from minimax.profiler import AIProfiler
+
+
+@pytest.fixture
+def restore_cache():
+    yield
+    set_move_cache_size(0)
+
+
+def best_line(text, color, depth=4):
+    profiler = AIProfiler()
+    profiler.start_timer()
+    result = []
+    run_ai_calculation(Board.from_string(text), color, profiler, result, {}, 0, None, depth)
+    score, move, _, pv = result[0]
+    return score, move_to_key(move), pv, profiler.nodes_visited
+
+
+def keys(moves):
+    return [move_to_key(move) for move in moves]
+
+
+def test_move_cache_matches_generator(random_positions, restore_cache):
+    set_move_cache_size(10000)
+    for text, turn in random_positions:
+        board = Board.from_string(text)
+        expected = keys(_generate_moves(board, turn))
+        assert keys(get_possible_moves(board, turn)) == expected
+        # Autre plateau, même position : les coups décodés désignent ses propres pièces
+        other = Board.from_string(text)
+        moves = get_possible_moves(other, turn)
+        assert keys(moves) == expected
+        assert all(other.get_piece(piece.row, piece.col) is piece for piece, _, _ in moves)
+    assert move_cache.hits >= len(random_positions)
+
+
+def test_move_cache_lru_eviction(random_positions, restore_cache):
+    set_move_cache_size(2)
+    texts = list(dict.fromkeys(text for text, _ in random_positions))[:3]
+    boards = [Board.from_string(text) for text in texts]
+    for board in boards:
+        get_possible_moves(board, CREAM)
+    assert move_cache.evictions == 1
+    assert len(move_cache.entries) == 2
+    get_possible_moves(boards[0], CREAM)     # la plus ancienne a été évincée
+    assert move_cache.hits == 0
+    get_possible_moves(boards[2], CREAM)
+    assert move_cache.hits == 1
+
+
+def test_search_same_with_and_without_move_cache(random_positions, restore_cache):
+    for text, turn in random_positions[::40]:
+        without = best_line(text, turn)
+        set_move_cache_size(100000)
+        assert best_line(text, turn) == without
+        set_move_cache_size(0)
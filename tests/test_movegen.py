@@ -0,0 +1,145 @@
+# tests/test_movegen.py
+"""
+Générateur de coups de référence, écrit d'après les règles sur un simple
+dict (case -> symbole), sans les tables ni les tampons de checkers/board.py.
+Il sert de source indépendante pour les comptes de tools/perft.py.
+
+Comme le générateur du moteur, il laisse la dame sur sa case de départ
+pendant la rafle et les pièces prises sur le plateau jusqu'à la fin, et la
+prise maximale ne compte que le nombre de pièces prises.
+"""
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.tables import SQUARE_INDEX, SQUARES
+from minimax.algorithm import get_possible_moves
+from tools import perft
+
+DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def parse(text):
+    return {square: symbol for square, symbol in zip(SQUARES, text) if symbol != "."}
+
+
+def to_text(grid):
+    return "".join(grid.get(square, ".") for square in SQUARES)
+
+
+def on_board(row, col):
+    return 0 <= row < 8 and 0 <= col < 8
+
+
+def jumps(grid, start, square, king, forward, captured):
+    """(pièce prise, arrivée) possibles depuis `square` pour la pièce partie de `start`."""
+    own = grid[start].lower()
+    options = []
+    for dr, dc in DIAGONALS:
+        if not king and dr != forward:
+            continue
+        row, col = square[0] + dr, square[1] + dc
+        if king:
+            while on_board(row, col) and (row, col) not in grid:
+                row, col = row + dr, col + dc
+        if not on_board(row, col):
+            continue
+        over = (row, col)
+        if over not in grid or grid[over].lower() == own or over in captured:
+            continue
+        row, col = row + dr, col + dc
+        while on_board(row, col) and (row, col) not in grid:
+            options.append((over, (row, col)))
+            if not king:
+                break
+            row, col = row + dr, col + dc
+    return options
+
+
+def sequences(grid, start, square, king, forward, captured):
+    """Rafles terminales : liste de (arrivée, pièces prises)."""
+    found = []
+    for over, landing in jumps(grid, start, square, king, forward, captured):
+        taken = captured | {over}
+        found.extend(sequences(grid, start, landing, king, forward, taken) or [(landing, taken)])
+    return found
+
+
+def reference_moves(grid, turn):
+    """Ensemble de (départ, arrivée, frozenset des cases prises)."""
+    own = "w" if turn == CREAM else "b"
+    forward = -1 if turn == CREAM else 1
+    captures, simple = set(), set()
+    for start, symbol in grid.items():
+        if symbol.lower() != own:
+            continue
+        king = symbol.isupper()
+        for landing, taken in sequences(grid, start, start, king, forward, frozenset()):
+            captures.add((start, landing, frozenset(taken)))
+        for dr, dc in DIAGONALS:
+            if not king and dr != forward:
+                continue
+            row, col = start[0] + dr, start[1] + dc
+            while on_board(row, col) and (row, col) not in grid:
+                simple.add((start, (row, col), frozenset()))
+                if not king:
+                    break
+                row, col = row + dr, col + dc
+    if captures:
+        longest = max(len(taken) for _, _, taken in captures)
+        return {move for move in captures if len(move[2]) == longest}
+    return simple
+
+
+def play(grid, move):
+    start, landing, taken = move
+    grid = {square: symbol for square, symbol in grid.items() if square not in taken}
+    symbol = grid.pop(start)
+    if landing[0] in (0, 7):
+        symbol = symbol.upper()
+    grid[landing] = symbol
+    return grid
+
+
+def reference_perft(grid, turn, depth):
+    moves = reference_moves(grid, turn)
+    if depth == 1:
+        return len(moves)
+    other = BLACK if turn == CREAM else CREAM
+    return sum(reference_perft(play(grid, move), other, depth - 1) for move in moves)
+
+
+def engine_moves(board, turn):
+    moves = []
+    for piece, landing, details in get_possible_moves(board, turn):
+        skipped = details["skipped"] if isinstance(details, dict) else details
+        moves.append(((piece.row, piece.col), landing, frozenset((p.row, p.col) for p in skipped)))
+    return moves
+
+
+def test_same_moves_as_engine(random_positions):
+    for text, turn in random_positions:
+        moves = engine_moves(Board.from_string(text), turn)
+        assert len(moves) == len(set(moves)), text
+        assert set(moves) == reference_moves(parse(text), turn), text
+
+
+@pytest.mark.parametrize("name, position, side, counts", perft.REFERENCE, ids=[r[0] for r in perft.REFERENCE])
+def test_perft_reference_counts(name, position, side, counts):
+    turn = BLACK if side == "b" else CREAM
+    grid = parse(position)
+    for depth, expected in enumerate(counts[:5], 1):
+        assert reference_perft(grid, turn, depth) == expected
+
+
+def test_equal_captures_ending_on_same_square():
+    # Pion crème en (6, 3) : par la gauche ou par la droite, deux prises de
+    # deux pièces différentes qui finissent toutes deux en (2, 3).
+    grid = {(6, 3): "w", (5, 2): "b", (3, 2): "b", (5, 4): "b", (3, 4): "b"}
+    board = Board.from_string(to_text(grid))
+    moves = engine_moves(board, CREAM)
+    assert sorted(moves) == sorted([
+        ((6, 3), (2, 3), frozenset({(5, 2), (3, 2)})),
+        ((6, 3), (2, 3), frozenset({(5, 4), (3, 4)})),
+    ])
+    assert set(moves) == reference_moves(grid, CREAM)
@@ -0,0 +1,68 @@
+# tests/test_nnue.py
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax import nnue
+from minimax.algorithm import apply_move, get_possible_moves, revert_move
+
+
+def large_network(seed):
+    """Poids de première couche aux bornes de int16 : une somme en int16 déborderait."""
+    rng = np.random.default_rng(seed)
+    w1 = rng.choice([-32767, 32767], size=(nnue.INPUTS, nnue.HIDDEN))
+    b1 = rng.choice([-32767, 32767], size=nnue.HIDDEN)
+    w2 = rng.integers(-32767, 32768, size=nnue.HIDDEN)
+    return nnue.Network(w1, b1, w2, 12345)
+
+
+def exact_values(network, board):
+    """Première couche recalculée en int64 depuis le plateau."""
+    indices = nnue.snapshot_features(board.snapshot())
+    return network.b1.astype(np.int64) + network.w1[indices].astype(np.int64).sum(axis=0)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_accumulator_never_overflows(seed):
+    network = large_network(seed)
+    rng = random.Random(seed)
+    board = Board()
+    board.accumulator = network.accumulator(board)
+    color = CREAM
+    undo_stack = []
+    for _ in range(120):
+        moves = get_possible_moves(board, color)
+        if not moves or (undo_stack and rng.random() < 0.2):
+            if not undo_stack:
+                break
+            revert_move(board, undo_stack.pop())
+            color = BLACK if color == CREAM else CREAM
+        else:
+            undo_stack.append(apply_move(board, rng.choice(moves)))
+            color = BLACK if color == CREAM else CREAM
+        values = board.accumulator.values
+        assert values.dtype == np.int32
+        assert np.array_equal(values.astype(np.int64), exact_values(network, board))
+        snapshot = board.snapshot()
+        for side in (BLACK, CREAM):
+            assert board.evaluate(side) == network.evaluate_snapshot(snapshot, side)
+
+
+def test_weights_outside_int16_are_rejected():
+    w1 = np.zeros((nnue.INPUTS, nnue.HIDDEN), dtype=np.int32)
+    w1[0, 0] = 40000
+    with pytest.raises(ValueError):
+        nnue.Network(w1, np.zeros(nnue.HIDDEN), np.zeros(nnue.HIDDEN), 0)
+
+
+def test_save_and_load(tmp_path):
+    network = large_network(7)
+    path = str(tmp_path / "nnue.npz")
+    nnue.save_network(network, path)
+    loaded = nnue.load_network(path)
+    snapshot = Board().snapshot()
+    assert loaded.evaluate_snapshot(snapshot, BLACK) == network.evaluate_snapshot(snapshot, BLACK)
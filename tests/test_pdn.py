@@ -0,0 +1,107 @@
+# tests/test_pdn.py
+import io
+import random
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.pdn import (
+    START_FEN, PdnGame, find_pdn_move, format_fen, format_pdn, landing_squares, parse_fen,
+    parse_position, read_pdn, replay, square_number, write_pdn,
+)
+from minimax.algorithm import apply_move, get_possible_moves, move_to_key
+
+
+def pdn_move(move):
+    """Notation complète d'un coup : toutes les cases d'arrivée d'une rafle."""
+    piece, _, details = move
+    skipped = details["skipped"] if isinstance(details, dict) else details
+    squares = [(piece.row, piece.col)] + landing_squares(move)
+    return ("x" if skipped else "-").join(str(square_number(*square)) for square in squares)
+
+
+def test_start_fen():
+    assert parse_fen(START_FEN) == (*Board().snapshot(), "w")
+    assert parse_position(START_FEN).to_board().to_string() == Board().to_string()
+
+
+def test_fen_round_trip(random_positions):
+    for text, turn in random_positions:
+        board = Board.from_string(text)
+        side = "b" if turn == BLACK else "w"
+        fen = format_fen(*board.snapshot(), side)
+        assert parse_fen(fen) == (*board.snapshot(), side)
+        position = parse_position(fen)
+        assert position.to_board().to_string() == text
+        assert position.turn == turn
+        assert parse_position(f"{text} {side}") == position
+
+
+def test_fen_ranges_and_kings():
+    black_men, black_kings, cream_men, cream_kings, side = parse_fen("B:WK29,18:B1-4,K12")
+    assert side == "b"
+    assert black_men == 0b1111
+    assert black_kings == 1 << 11
+    assert cream_men == 1 << 17
+    assert cream_kings == 1 << 28
+
+
+@pytest.mark.parametrize("text", ["X:W1:B2", "W:W1,2:B2", "W:W33:B1", "W:W1:Z2", "W:WK:B1"])
+def test_invalid_fen(text):
+    with pytest.raises(ValueError):
+        parse_fen(text)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_pdn_round_trip_and_replay(seed):
+    rng = random.Random(seed)
+    board = Board()
+    color = CREAM
+    moves, keys = [], []
+    for _ in range(80):
+        legal = get_possible_moves(board, color)
+        if not legal:
+            break
+        move = rng.choice(legal)
+        moves.append(pdn_move(move))
+        keys.append(move_to_key(move))
+        apply_move(board, move)
+        color = BLACK if color == CREAM else CREAM
+
+    game = PdnGame({"Event": 'Partie "test"', "Round": str(seed)}, moves, "*")
+    stream = io.StringIO()
+    write_pdn([game, game], stream)
+    games = list(read_pdn(stream.getvalue().splitlines()))
+    assert len(games) == 2
+    assert games[0].moves == moves
+    assert games[0].tags["Event"] == 'Partie "test"'
+
+    replayed = list(replay(games[0]))
+    assert [key for _, key in replayed[:-1]] == keys
+    final, last = replayed[-1]
+    assert last is None
+    assert final.to_board().to_string() == board.to_string()
+    assert final.turn == color
+
+
+def test_comments_and_variations_are_skipped():
+    text = """[Event "x"]
+1. 22-18 {commentaire} 11-15 (1... 10-14 2. 24-20) 2. 18x11 $1 8x15 ; fin
+1/2-1/2"""
+    game = next(read_pdn(text.splitlines()))
+    assert game.moves == ["22-18", "11-15", "18x11", "8x15"]
+    assert game.result == "1/2-1/2"
+    assert len(list(replay(game))) == 5
+
+
+def test_intermediate_squares_choose_between_equal_captures():
+    # Deux prises du pion crème de la case 27 vers la case 11 (voir tests/test_movegen.py)
+    board = Board.from_string("b......bb....bb......bb..w.ww..w")
+    moves = get_possible_moves(board, CREAM)
+    assert len(moves) == 2
+    texts = sorted(pdn_move(move) for move in moves)
+    assert texts[0] != texts[1]
+    for text in texts:
+        assert pdn_move(find_pdn_move(moves, text)) == text
+    assert find_pdn_move(moves, texts[0].split("x")[0] + "x" + texts[0].split("x")[-1]) is not None
@@ -0,0 +1,21 @@
+# tests/test_perft.py
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from tools import perft
+
+
+def test_check_small_depth(capsys):
+    assert perft.main(["--check", "--max-depth", "4"]) == 0
+    assert "ERREUR" not in capsys.readouterr().out
+
+
+def test_check_with_hash(capsys):
+    assert perft.main(["--check", "--hash", "--max-depth", "4"]) == 0
+
+
+def test_divide_sums_to_perft():
+    for _, position, side, counts in perft.REFERENCE:
+        board = Board.from_string(position)
+        results = perft.divide(board, BLACK if side == "b" else CREAM, 3)
+        assert sum(count for _, count in results) == counts[2]
+        assert board.to_string() == position
@@ -0,0 +1,57 @@
+# tests/test_position.py
+import pickle
+import random
+
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.position import Position
+from minimax.algorithm import get_possible_moves
+
+
+def test_pickle_round_trip(random_positions):
+    for index, (text, turn) in enumerate(random_positions):
+        history = tuple(random.Random(index).getrandbits(64) for _ in range(index % 5))
+        position = Position.from_board(Board.from_string(text), turn, 7, history)
+        copy = pickle.loads(pickle.dumps(position))
+        assert copy == position
+        assert hash(copy) == hash(position)
+        assert copy.turn == turn
+        board = copy.to_board()
+        assert board.to_string() == text
+        assert board.zobrist_hash == Board.from_string(text).zobrist_hash
+
+
+def test_history_is_cut_at_last_capture():
+    position = Position.from_board(Board(), CREAM, 2, (1, 2, 3, 4, 5))
+    assert position.history == (3, 4, 5)
+    assert Position.from_board(Board(), BLACK, 0, (1, 2)).history == (2,)
+
+
+def test_history_counts():
+    position = Position.from_board(Board(), BLACK, 10, (7, 8, 7, 9, 7))
+    assert position.history_counts() == {7: 3, 8: 1, 9: 1}
+    assert Position.from_bytes(position.to_bytes()) == position
+
+
+def test_game_position_matches_game_state():
+    pytest.importorskip("pygame")
+    from checkers.game import Game
+
+    rng = random.Random(3)
+    game = Game(None)
+    for _ in range(40):
+        moves = get_possible_moves(game.board, game.turn)
+        if not moves:
+            break
+        piece, (row, col), details = rng.choice(moves)
+        game.play_move(piece, row, col, details["skipped"] if isinstance(details, dict) else details)
+        position = pickle.loads(pickle.dumps(game.get_position()))
+        assert position.to_board().to_string() == game.board.to_string()
+        assert position.turn == game.turn
+        assert position.moves_since_capture == game.moves_since_capture
+        # Les positions d'avant la dernière prise ne peuvent plus se répéter
+        counts = position.history_counts()
+        assert all(game.position_history[key] >= count for key, count in counts.items())
+        assert len(position.history) == min(len(game.move_log), game.moves_since_capture + 1)
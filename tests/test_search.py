@@ -0,0 +1,96 @@
+# tests/test_search.py
+import pytest
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM, DRAW_SCORE, LOSS_SCORE, WIN_SCORE
+from checkers.tables import SQUARES
+from minimax.algorithm import (
+    MAX_PLY, NegaMax, apply_move, get_possible_moves, revert_move, run_ai_calculation, score_from_tt,
+    score_to_tt, transposition_table, zobrist_turn_black,
+)
+from minimax.profiler import AIProfiler
+
+# Trois dames crème contre un pion noir, sans prise possible : crème gagne largement
+WINNING = "b" + "." * 27 + "WWW."
+
+
+def board_from(squares):
+    return Board.from_string("".join(squares.get(square, ".") for square in SQUARES))
+
+
+def search(board, color, depth, history, moves_since_capture=0):
+    profiler = AIProfiler()
+    profiler.start_timer()
+    return NegaMax(board, depth, color, float("-inf"), float("inf"), profiler, history,
+                   moves_since_capture)[0]
+
+
+def child_keys(board, color):
+    keys = []
+    next_color = BLACK if color == CREAM else CREAM
+    for move in get_possible_moves(board, color):
+        undo = apply_move(board, move)
+        keys.append(board.zobrist_hash ^ (zobrist_turn_black if next_color == BLACK else 0))
+        revert_move(board, undo)
+    return keys
+
+
+@pytest.mark.parametrize("score", [WIN_SCORE - 3, WIN_SCORE - 40, LOSS_SCORE + 1, LOSS_SCORE + 57,
+                                   0, 12.5, -3.25, WIN_SCORE / 2, LOSS_SCORE / 2])
+def test_tt_score_round_trip(score):
+    for ply in range(MAX_PLY):
+        assert score_from_tt(score_to_tt(score, ply), ply) == score
+
+
+def test_tt_mate_score_is_relative_to_node():
+    # Mat en 5 vu de la racine, stocké au ply 2 : mat en 3 depuis ce nœud, relu au ply 4
+    stored = score_to_tt(WIN_SCORE - 5, 2)
+    assert stored == WIN_SCORE - 3
+    assert score_from_tt(stored, 4) == WIN_SCORE - 7
+
+
+def test_win_in_one_scored_by_distance():
+    # Le pion crème prend le dernier pion noir, qui n'a plus de coup
+    board = board_from({(4, 3): "w", (3, 2): "b"})
+    result = []
+    profiler = AIProfiler()
+    profiler.start_timer()
+    run_ai_calculation(board, CREAM, profiler, result, {}, 0, None, 6)
+    score, move, _, pv = result[0]
+    assert score == WIN_SCORE - 1
+    assert len(pv) == 1
+
+
+def test_draws_take_precedence_over_tt_entry():
+    board = Board.from_string(WINNING)
+    transposition_table.clear()
+    winning = search(board, CREAM, 3, {})
+    assert winning > 2
+    assert transposition_table          # l'entrée de la racine est dans la TT
+    # Même position, même profondeur : la nullité passe avant la sonde de la TT
+    assert search(board, CREAM, 3, {}, 40) == DRAW_SCORE
+    assert search(board, CREAM, 3, {12345: 3}) == DRAW_SCORE
+    assert search(board, CREAM, 3, {}) == winning
+
+
+def test_repetition_reached_in_search():
+    board = Board.from_string(WINNING)
+    # Chaque coup crème ramène une position déjà vue deux fois dans la partie
+    history = {key: 2 for key in child_keys(board, CREAM)}
+    expected_history = dict(history)
+    result = []
+    profiler = AIProfiler()
+    profiler.start_timer()
+    run_ai_calculation(board, CREAM, profiler, result, history, 0, None, 4)
+    assert result[0][0] == DRAW_SCORE
+    assert history == expected_history
+    assert board.to_string() == WINNING
+
+
+def test_forty_move_rule_reached_in_search():
+    board = Board.from_string(WINNING)
+    result = []
+    profiler = AIProfiler()
+    profiler.start_timer()
+    run_ai_calculation(board, CREAM, profiler, result, {}, 39, None, 4)
+    assert result[0][0] == DRAW_SCORE
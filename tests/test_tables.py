@@ -0,0 +1,58 @@
+# tests/test_tables.py
+from checkers.tables import (
+    COLS, DIRECTIONS, DOWN_CONE, DOWN_DIRECTIONS, DOWN_MASK, JUMPS, MIRROR, NEIGHBOUR_MASK,
+    NEIGHBOURS, NUM_SQUARES, RAYS, ROWS, SQUARE_INDEX, SQUARES, UP_CONE, UP_DIRECTIONS, UP_MASK,
+    is_dark,
+)
+
+
+def on_board(row, col):
+    return 0 <= row < ROWS and 0 <= col < COLS
+
+
+def test_square_index_is_inverse():
+    assert len(SQUARES) == NUM_SQUARES
+    for sq, (row, col) in enumerate(SQUARES):
+        assert is_dark(row, col)
+        assert SQUARE_INDEX[row][col] == sq
+        assert sq // 4 == row
+    assert sum(index < 0 for rank in SQUARE_INDEX for index in rank) == ROWS * COLS - NUM_SQUARES
+
+
+def test_mirror():
+    for sq, (row, col) in enumerate(SQUARES):
+        assert SQUARES[MIRROR[sq]] == (ROWS - 1 - row, COLS - 1 - col)
+
+
+def test_rays_neighbours_jumps():
+    for sq, (row, col) in enumerate(SQUARES):
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            ray = []
+            r, c = row + dr, col + dc
+            while on_board(r, c):
+                ray.append((r, c))
+                r, c = r + dr, c + dc
+            assert RAYS[sq][d] == tuple(ray)
+            assert NEIGHBOURS[sq][d] == (ray[0] if ray else None)
+            assert JUMPS[sq][d] == (tuple(ray[:2]) if len(ray) > 1 else None)
+
+
+def test_neighbour_masks():
+    for sq, (row, col) in enumerate(SQUARES):
+        up = {SQUARE_INDEX[row - 1][c] for c in (col - 1, col + 1) if on_board(row - 1, c)}
+        down = {SQUARE_INDEX[row + 1][c] for c in (col - 1, col + 1) if on_board(row + 1, c)}
+        assert UP_MASK[sq] == sum(1 << n for n in up)
+        assert DOWN_MASK[sq] == sum(1 << n for n in down)
+        assert NEIGHBOUR_MASK[sq] == UP_MASK[sq] | DOWN_MASK[sq]
+    assert [DIRECTIONS[d][0] for d in UP_DIRECTIONS] == [-1, -1]
+    assert [DIRECTIONS[d][0] for d in DOWN_DIRECTIONS] == [1, 1]
+
+
+def test_promotion_cones():
+    for sq, (row, col) in enumerate(SQUARES):
+        for other, (r, c) in enumerate(SQUARES):
+            inside = abs(c - col) <= abs(r - row)
+            assert bool(UP_CONE[sq] >> other & 1) == (r < row and inside)
+            assert bool(DOWN_CONE[sq] >> other & 1) == (r > row and inside)
+        # Les cônes sont symétriques l'un de l'autre
+        assert DOWN_CONE[MIRROR[sq]] == sum(1 << MIRROR[o] for o in range(NUM_SQUARES) if UP_CONE[sq] >> o & 1)
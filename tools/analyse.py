@@ -0,0 +1,72 @@
+# tools/analyse.py
+"""
+Analyse multi-PV d'une position : les N meilleurs coups, leur score exact et
+leur variation principale, pour la relecture des parties.
+
+Les coups sont notés comme dans l'interface (checkers/notation.py) :
+"c3-d4" pour un déplacement, "c3xe5" pour une prise.
+
+Usage :
+    python -m tools.analyse --position <32 cases> --side w --depth 8 --multipv 3
+    python -m tools.analyse --multipv 4 --time 5 --json
+"""
+import argparse
+import json
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.notation import format_move_key
+from minimax.algorithm import multipv_search, transposition_table
+from minimax.profiler import AIProfiler
+
+START_POSITION = "bbbbbbbbbbbb........wwwwwwwwwwww"
+
+
+def analyse(position, side, num_pv, depth, time_limit=None):
+    board = Board.from_string(position)
+    color = BLACK if side == "b" else CREAM
+    profiler = AIProfiler()
+    profiler.start_timer()
+    lines, completed_depth = multipv_search(board, color, num_pv, profiler, {}, 0,
+                                            time_limit, depth)
+    profiler.stop_timer()
+    profiler.set_tt_size(len(transposition_table))
+    return {
+        "depth": completed_depth,
+        "lines": [{"score": score, "pv": [format_move_key(key) for key in pv]}
+                  for score, _, pv in lines],
+        "stats": profiler.as_dict(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyse multi-PV d'une position.")
+    parser.add_argument("--position", default=START_POSITION, help="position sur 32 cases")
+    parser.add_argument("--side", choices=("b", "w"), default="w", help="trait")
+    parser.add_argument("--multipv", type=int, default=3, help="nombre de variations")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--time", type=float, default=None, help="budget en secondes")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = analyse(args.position, args.side, args.multipv, args.depth, args.time)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    stats = report["stats"]
+    print(f"profondeur {report['depth']}  nœuds {stats['nodes']:,}  "
+          f"{time.perf_counter() - start:.2f}s")
+    for rank, line in enumerate(report["lines"], 1):
+        print(f"{rank}. {line['score']:+8.2f}  {' '.join(line['pv'])}")
+    if len(stats["pv_nodes"]) > 1:
+        print(f"surcoût multi-PV : {stats['multipv_overhead']:.1f}% de nœuds "
+              f"(par variation : {', '.join(f'{n:,}' for n in stats['pv_nodes'])})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
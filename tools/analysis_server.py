@@ -0,0 +1,261 @@
+# tools/analysis_server.py
+"""
+Serveur d'analyse par lots sur un socket local (TCP ou Unix).
+
+Le client envoie des lignes JSON ; chaque ligne est une requête, une liste
+de requêtes (un lot) ou une commande :
+    {"id": "partie12-34", "position": "<32 cases> w", "depth": 8}
+    [{"id": 1, "position": "...", "time": 0.5}, {"id": 2, "position": "..."}]
+    {"cmd": "metrics"}
+    {"cmd": "wait"}
+
+La position est une FEN (checkers/pdn.py) ou la chaîne de 32 cases de
+Board.from_string ("b/B/w/W/.") suivie du trait ("b" ou "w"). "depth" et "time" (secondes) limitent la
+recherche de chaque position ; sans l'un ni l'autre, --depth s'applique.
+
+Les positions sont réparties sur les processus d'un AsyncEngine
+(minimax/async_engine.py) et les résultats
+reviennent dans l'ordre où ils sont prêts, une ligne JSON chacun :
+    {"id": ..., "score": 0.15, "best": "c3-d4", "pv": [...], "depth": 8,
+     "nodes": 12345, "time": 0.41, "latency": 0.52}
+("latency" : de la réception de la requête à l'envoi du résultat, attente
+comprise) ou {"id": ..., "error": "..."} pour une requête invalide.
+
+{"cmd": "metrics"} renvoie {"metrics": {...}} : requêtes en attente (queue
+depth), débit en positions/s, latence moyenne, médiane, p95 et max. Les
+mêmes mesures sont écrites sur stderr toutes les --stats-interval secondes.
+
+La fin de la connexion (fermeture, même seulement en écriture) annule les
+recherches du client, en cours ou en attente. Pour recevoir tous ses
+résultats avant de fermer, le client envoie {"cmd": "wait"} : le serveur
+rend les résultats attendus, puis {"done": <nombre>}.
+
+Usage :
+    python -m tools.analysis_server --port 8765 --workers 8
+    python -m tools.analysis_server --unix /tmp/dames.sock
+    printf '%s\n' '{"id": 1, "position": "bbbbbbbbbbbb........wwwwwwwwwwww w", "depth": 8}' \
+        '{"cmd": "wait"}' | nc -N localhost 8765
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+import sys
+import time
+from collections import deque
+
+from checkers.notation import format_move_key
+from checkers.pdn import parse_position
+from minimax.async_engine import AsyncEngine, SearchLimits
+
+DEFAULT_DEPTH = 8
+LATENCY_WINDOW = 10000      # latences conservées pour les percentiles
+THROUGHPUT_WINDOW = 60.0    # secondes prises en compte pour le débit récent
+
+
+def format_result(result):
+    return {
+        "score": result.score,
+        "best": format_move_key(result.move) if result.move is not None else None,
+        "pv": [format_move_key(key) for key in result.pv],
+        "depth": result.depth,
+        "nodes": result.nodes,
+        "time": result.time,
+    }
+
+
+class ServerMetrics:
+    """Compteurs du serveur : file d'attente, débit et latence par requête."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.finished_at = deque()  # instants de fin, pour le débit récent
+
+    @property
+    def queue_depth(self):
+        return self.submitted - self.completed - self.failed
+
+    def record(self, latency, ok=True):
+        now = time.perf_counter()
+        if ok:
+            self.completed += 1
+            self.latencies.append(latency)
+        else:
+            self.failed += 1
+        self.finished_at.append(now)
+        while self.finished_at and now - self.finished_at[0] > THROUGHPUT_WINDOW:
+            self.finished_at.popleft()
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.start
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            return latencies[min(int(len(latencies) * p), len(latencies) - 1)] if latencies else None
+
+        return {
+            "uptime": uptime,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_depth": self.queue_depth,
+            "throughput": self.completed / uptime if uptime > 0 else 0.0,
+            "throughput_recent": len(self.finished_at) / min(uptime, THROUGHPUT_WINDOW)
+            if uptime > 0 else 0.0,
+            "latency_mean": sum(latencies) / len(latencies) if latencies else None,
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "latency_max": latencies[-1] if latencies else None,
+        }
+
+
+class AnalysisServer:
+    def __init__(self, workers, default_depth=DEFAULT_DEPTH):
+        # Le nombre de recherches soumises est limité par la file du serveur, pas par le moteur
+        self.engine = AsyncEngine(workers, max_pending=4096)
+        self.default_depth = default_depth
+        self.metrics = ServerMetrics()
+        self.clients = set()
+
+    async def accept(self, reader, writer):
+        """
+        Rappel de start_server : chaque client est servi par une tâche du
+        serveur, que close_clients() annule et attend à l'arrêt (une tâche de
+        rappel annulée serait signalée comme erreur par asyncio).
+        """
+        task = asyncio.ensure_future(self.handle_client(reader, writer))
+        self.clients.add(task)
+        task.add_done_callback(self.clients.discard)
+
+    async def close_clients(self):
+        clients = list(self.clients)
+        for task in clients:
+            task.cancel()
+        await asyncio.gather(*clients, return_exceptions=True)
+
+    async def handle_client(self, reader, writer):
+        pending = set()
+
+        async def send(message):
+            writer.write((json.dumps(message) + "\n").encode())
+            await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError as error:
+                    await send({"error": f"invalid JSON: {error}"})
+                    continue
+                if isinstance(message, dict) and "cmd" in message:
+                    if message["cmd"] == "metrics":
+                        await send({"metrics": self.metrics.snapshot()})
+                    elif message["cmd"] == "wait":
+                        # Fin de lot : tous les résultats attendus sont rendus avant la suite
+                        waited = len(pending)
+                        if pending:
+                            await asyncio.gather(*pending)
+                        await send({"done": waited})
+                    else:
+                        await send({"error": f"unknown command: {message['cmd']}"})
+                    continue
+                received = time.perf_counter()
+                for request in message if isinstance(message, list) else [message]:
+                    self.metrics.submitted += 1
+                    task = asyncio.ensure_future(self.analyse(request, received, send))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+        except ConnectionError:
+            pass
+        finally:
+            # Fin de connexion ou arrêt du serveur (l'annulation est ensuite propagée) :
+            # les recherches du client, en cours ou en attente, sont annulées
+            for task in pending:
+                task.cancel()
+            writer.close()
+
+    async def analyse(self, request, received, send):
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or "position" not in request:
+                raise ValueError("request needs a \"position\"")
+            time_limit = request.get("time")
+            depth = request.get("depth") or (None if time_limit else self.default_depth)
+            result = await self.engine.search(parse_position(request["position"]),
+                                              SearchLimits(depth, time_limit))
+        except asyncio.CancelledError:
+            self.metrics.record(time.perf_counter() - received, ok=False)
+            raise
+        except (ValueError, TypeError) as error:
+            self.metrics.record(time.perf_counter() - received, ok=False)
+            await send({"id": request_id, "error": str(error)})
+            return
+        latency = time.perf_counter() - received
+        self.metrics.record(latency)
+        await send({"id": request_id, **format_result(result), "latency": latency})
+
+    async def report(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            m = self.metrics.snapshot()
+            latency = f"{m['latency_p50'] * 1e3:.0f}/{m['latency_p95'] * 1e3:.0f} ms" \
+                if m["latency_p50"] is not None else "-"
+            print(f"[{m['uptime']:.0f}s] file {m['queue_depth']}  terminées {m['completed']}  "
+                  f"erreurs {m['failed']}  débit {m['throughput_recent']:.1f} pos/s  "
+                  f"latence p50/p95 {latency}", file=sys.stderr, flush=True)
+
+
+async def serve(args):
+    server = AnalysisServer(args.workers, args.depth)
+    loop = asyncio.get_running_loop()
+    # Processus de travail lancés avant l'ouverture du socket, pour qu'ils
+    # n'en héritent pas et ne le gardent pas ouvert après l'arrêt du serveur
+    server.engine.start()
+    if args.unix:
+        listener = await asyncio.start_unix_server(server.accept, args.unix)
+        where = args.unix
+    else:
+        listener = await asyncio.start_server(server.accept, args.host, args.port)
+        where = f"{args.host}:{args.port}"
+    print(f"serveur d'analyse sur {where}, {args.workers} processus", file=sys.stderr, flush=True)
+    if args.stats_interval > 0:
+        asyncio.ensure_future(server.report(args.stats_interval))
+    loop.add_signal_handler(signal.SIGTERM, listener.close)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await server.close_clients()
+        server.engine.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur d'analyse de positions par lots.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="chemin d'un socket Unix (remplace --host/--port)")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH,
+                        help="profondeur des requêtes sans \"depth\" ni \"time\"")
+    parser.add_argument("--stats-interval", type=float, default=10.0,
+                        help="secondes entre deux lignes de mesures sur stderr (0 : aucune)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
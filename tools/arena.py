@@ -0,0 +1,257 @@
+# tools/arena.py
+"""
+Arène sans interface : matchs moteur contre moteur sur plusieurs processus.
+
+Chaque moteur est décrit par une chaîne "clé=valeur,..." :
+    depth=6          profondeur maximale de l'approfondissement itératif
+    time=0.5         budget par coup en secondes (absent = pas de limite)
+    weights=f.json   fichier de poids d'évaluation (défaut : minimax/weights.json)
+    nnue=f.npz       évaluation par réseau NNUE (minimax/nnue.py) au lieu des poids
+    name=...         nom affiché
+    <poids>=valeur   remplace un poids scalaire (ex. mobility=0 désactive le terme)
+
+Les ouvertures sont tirées au hasard (--random-plies coups légaux) et chaque
+ouverture est jouée deux fois, couleurs inversées. Le match s'arrête au
+nombre de parties demandé ou dès que le test séquentiel (SPRT) conclut.
+La vitesse de recherche (nœuds/s) de chaque moteur est donnée avec l'écart
+Elo : une évaluation plus coûteuse doit gagner plus qu'elle ne ralentit.
+
+Usage :
+    python -m tools.arena "depth=6" "depth=6,mobility=0" --games 2000 --sprt 0 10
+"""
+import argparse
+import math
+import multiprocessing
+import random
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax.algorithm import (
+    SEARCH_DEPTH, apply_move, get_possible_moves, run_ai_calculation,
+    zobrist_turn_black,
+)
+from minimax import nnue
+from minimax.evaluation import DEFAULT_WEIGHTS, WEIGHTS_PATH, load_weights, set_weights
+from minimax.profiler import AIProfiler
+
+MAX_PLIES = 300
+
+
+def parse_engine(spec, default_name):
+    """Transforme une chaîne de configuration en dictionnaire de moteur."""
+    engine = {"name": default_name, "depth": SEARCH_DEPTH, "time": None,
+              "weights": WEIGHTS_PATH, "nnue": None}
+    overrides = {}
+    for item in filter(None, spec.split(",")):
+        key, _, value = item.partition("=")
+        key = key.strip()
+        if key == "depth":
+            engine["depth"] = int(value)
+        elif key == "time":
+            engine["time"] = float(value)
+        elif key in ("weights", "name"):
+            engine[key] = value
+        elif key == "nnue":
+            try:
+                engine["nnue"] = nnue.load_network(value or nnue.NETWORK_PATH)
+            except RuntimeError as error:
+                raise ValueError(str(error))
+        elif key in DEFAULT_WEIGHTS and not isinstance(DEFAULT_WEIGHTS[key], list):
+            overrides[key] = float(value)
+        else:
+            raise ValueError(f"option de moteur inconnue : {key!r}")
+    weights = load_weights(engine["weights"])
+    weights.update(overrides)
+    engine["weights"] = weights
+    return engine
+
+
+def random_opening(rng, plies):
+    """Suite de coups légaux aléatoires, décrite par (start, end) pour être rejouée."""
+    board = Board()
+    color = CREAM
+    opening = []
+    for _ in range(plies):
+        moves = get_possible_moves(board, color)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        opening.append(((move[0].row, move[0].col), move[1]))
+        apply_move(board, move)
+        color = BLACK if color == CREAM else CREAM
+    return opening
+
+
+def _find_move(board, color, start, end):
+    for move in get_possible_moves(board, color):
+        if (move[0].row, move[0].col) == start and move[1] == end:
+            return move
+    raise ValueError(f"coup d'ouverture illégal : {start} -> {end}")
+
+
+def play_game(task):
+    """
+    Joue une partie (exécuté dans un processus de travail). Retourne
+    (score du premier moteur, nombre de demi-coups, [nœuds, secondes] de
+    chaque moteur).
+    """
+    opening, engines, first_is_cream = task
+    board = Board()
+    color = CREAM
+    history = {}
+    moves_since_capture = 0
+    profiler = AIProfiler()
+    search = [[0, 0.0], [0, 0.0]]
+
+    def play(move):
+        nonlocal color, moves_since_capture
+        capture = bool(apply_move(board, move)[4])
+        moves_since_capture = 0 if capture else moves_since_capture + 1
+        color = BLACK if color == CREAM else CREAM
+        key = board.zobrist_hash ^ (zobrist_turn_black if color == BLACK else 0)
+        history[key] = history.get(key, 0) + 1
+
+    for start, end in opening:
+        play(_find_move(board, color, start, end))
+
+    first_color = CREAM if first_is_cream else BLACK
+    plies = len(opening)
+    while plies < MAX_PLIES:
+        outcome = board.winner(color, history, moves_since_capture)
+        if outcome is not None:
+            if "draw" in outcome.lower():
+                return 0.5, plies, search
+            return (0.0 if color == first_color else 1.0), plies, search
+
+        index = 0 if color == first_color else 1
+        engine = engines[index]
+        set_weights(engine["weights"])
+        nnue.set_network(engine["nnue"])
+        profiler.reset()
+        profiler.start_timer()
+        result = []
+        run_ai_calculation(board, color, profiler, result, history,
+                           moves_since_capture, engine["time"], engine["depth"])
+        profiler.stop_timer()
+        search[index][0] += profiler.nodes_visited
+        search[index][1] += profiler.total_time
+        move = result[0][1] if result else None
+        if move is None:
+            move = get_possible_moves(board, color)[0]
+        play(move)
+        plies += 1
+    return 0.5, plies, search
+
+
+# === Statistiques ===
+def elo_from_score(score):
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def match_stats(wins, draws, losses):
+    """Retourne (elo, marge à 95 %, score moyen, variance par partie)."""
+    n = wins + draws + losses
+    score = (wins + 0.5 * draws) / n
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2
+                + losses * score ** 2) / n
+    margin = 1.96 * math.sqrt(variance / n)
+    elo = elo_from_score(score)
+    if score - margin <= 0 or score + margin >= 1:
+        return elo, float("inf"), score, variance
+    error = (elo_from_score(score + margin) - elo_from_score(score - margin)) / 2
+    return elo, error, score, variance
+
+
+def sprt_llr(wins, draws, losses, elo0, elo1):
+    """Log-rapport de vraisemblance (approximation normale) entre H1: elo1 et H0: elo0."""
+    n = wins + draws + losses
+    _, _, score, variance = match_stats(wins, draws, losses)
+    if variance <= 0:
+        return 0.0
+    s0 = 1.0 / (1.0 + 10 ** (-elo0 / 400.0))
+    s1 = 1.0 / (1.0 + 10 ** (-elo1 / 400.0))
+    return n * (s1 - s0) * (2 * score - s0 - s1) / (2 * variance)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Matchs moteur contre moteur.")
+    parser.add_argument("engine1", help="configuration du moteur testé")
+    parser.add_argument("engine2", help="configuration du moteur de référence")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--random-plies", type=int, default=4,
+                        help="demi-coups aléatoires en début de partie")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--sprt", nargs=2, type=float, metavar=("ELO0", "ELO1"),
+                        help="arrêt séquentiel entre H0: ELO0 et H1: ELO1")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--min-games", type=int, default=50,
+                        help="parties jouées avant d'appliquer le SPRT")
+    args = parser.parse_args(argv)
+
+    try:
+        engines = (parse_engine(args.engine1, "engine1"), parse_engine(args.engine2, "engine2"))
+    except (ValueError, OSError) as error:
+        parser.error(str(error))
+
+    rng = random.Random(args.seed)
+    tasks = []
+    while len(tasks) < args.games:
+        opening = random_opening(rng, args.random_plies)
+        tasks.append((opening, engines, True))
+        tasks.append((opening, engines, False))
+    tasks = tasks[:args.games]
+
+    lower = math.log(args.beta / (1 - args.alpha))
+    upper = math.log((1 - args.beta) / args.alpha)
+    wins = draws = losses = 0
+    search = [[0, 0.0], [0, 0.0]]
+    verdict = None
+    start = time.perf_counter()
+    print(f"{engines[0]['name']} vs {engines[1]['name']} : {len(tasks)} parties, "
+          f"{args.workers} processus")
+
+    with multiprocessing.Pool(args.workers) as pool:
+        for done, (score, _plies, game_search) in enumerate(pool.imap_unordered(play_game, tasks), 1):
+            for total, (nodes, seconds) in zip(search, game_search):
+                total[0] += nodes
+                total[1] += seconds
+            if score == 1.0:
+                wins += 1
+            elif score == 0.0:
+                losses += 1
+            else:
+                draws += 1
+            llr = sprt_llr(wins, draws, losses, *args.sprt) if args.sprt else None
+            if done % 10 == 0 or done == len(tasks):
+                elo, error, _, _ = match_stats(wins, draws, losses)
+                line = f"[{done}/{len(tasks)}] +{wins} ={draws} -{losses}  elo {elo:+.1f} ± {error:.1f}"
+                if llr is not None:
+                    line += f"  llr {llr:.2f} [{lower:.2f}, {upper:.2f}]"
+                print(line, flush=True)
+            if llr is not None and done >= args.min_games and (llr <= lower or llr >= upper):
+                verdict = "H1 acceptée" if llr >= upper else "H0 acceptée"
+                pool.terminate()
+                break
+
+    games = wins + draws + losses
+    elo, error, score, _ = match_stats(wins, draws, losses)
+    print(f"\nParties : {games}  (+{wins} ={draws} -{losses})  score {score:.3f}")
+    print(f"Elo {engines[0]['name']} - {engines[1]['name']} : {elo:+.1f} ± {error:.1f} (95 %)")
+    nps = [nodes / seconds if seconds > 0 else 0.0 for nodes, seconds in search]
+    for engine, speed in zip(engines, nps):
+        print(f"Vitesse {engine['name']} : {speed:,.0f} nœuds/s")
+    if nps[1] > 0:
+        print(f"Rapport de vitesse : {nps[0] / nps[1]:.2f}")
+    if args.sprt:
+        print(f"SPRT [{args.sprt[0]:g}, {args.sprt[1]:g}] : {verdict or 'non conclu'}")
+    print(f"Durée : {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
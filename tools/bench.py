@@ -0,0 +1,166 @@
+# tools/bench.py
+"""
+Banc d'essai de la recherche sur un jeu de positions fixes.
+
+Pour chaque position, NegaMax est lancé en approfondissement itératif
+jusqu'à une profondeur fixe (table de transposition vidée au départ). On
+relève les nœuds, les nœuds par seconde, le temps pour atteindre chaque
+profondeur, le taux de coupures, les succès de la table de transposition
+et du cache d'évaluation, et la part des coupures obtenues dès le premier
+coup.
+
+Usage :
+    python -m tools.bench --depth 8 --output bench.json
+    python -m tools.bench --depth 8 --eval-cache 0          # sans cache d'évaluation
+    python -m tools.bench --compare avant.json apres.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.notation import format_pv
+from minimax.algorithm import (
+    EVAL_CACHE_SIZE, clear_eval_cache, pv_seed, search_iteration, set_eval_cache_size,
+    transposition_table,
+)
+from minimax.profiler import AIProfiler
+
+# (nom, position sur 32 cases, trait)
+POSITIONS = [
+    ("opening", "bbbbbbbbbbbb........wwwwwwwwwwww", "w"),
+    ("opening_developed", "bbbbb...bbbb......www...ww..wwww", "w"),
+    ("middlegame", "..bbb...bb.b.b.....ww.wb...wwww.", "w"),
+    ("middlegame_open", "..bb..w..b.b.b....w.wbw.....w.w.", "w"),
+    ("king_endgame", "...B.....b.....W..w...........B.", "w"),
+    ("king_endgame_men", "......b.....b.b........w.W..w...", "w"),
+    ("multi_capture_king", "b.B..b...bb..b.......b.w..w.W..w", "w"),
+    ("multi_capture_man", ".b...b.b.....bb......b.bw.w...w.", "w"),
+]
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_position(position, side, depth):
+    """Recherche itérative jusqu'à `depth` ; retourne les statistiques de la position."""
+    board = Board.from_string(position)
+    color = BLACK if side == "b" else CREAM
+    profiler = AIProfiler()
+    transposition_table.clear()
+    clear_eval_cache()
+    pv_seed.clear()
+    profiler.start_timer()
+
+    iterations = []
+    score, best_move = None, None
+    for current_depth in range(1, depth + 1):
+        score, move, pv = search_iteration(board, current_depth, color, profiler, {}, 0)
+        if move is not None:
+            best_move = move
+        iterations.append({
+            "depth": current_depth,
+            "time": time.perf_counter() - profiler.start_time,
+            "nodes": profiler.nodes_visited,
+            "score": score,
+            "pv": format_pv(pv),
+        })
+
+    profiler.stop_timer()
+    profiler.set_tt_size(len(transposition_table))
+    result = profiler.as_dict()
+    result["score"] = score
+    result["best_move"] = None
+    if best_move is not None:
+        piece, end, _ = best_move
+        result["best_move"] = [[piece.row, piece.col], list(end)]
+    result["iterations"] = iterations
+    return result
+
+
+def run(depth, names=None, eval_cache=EVAL_CACHE_SIZE):
+    set_eval_cache_size(eval_cache)
+    results = {}
+    for name, position, side in POSITIONS:
+        if names and name not in names:
+            continue
+        results[name] = bench_position(position, side, depth)
+        r = results[name]
+        print(f"{name:<20} nodes {r['nodes']:>10,}  nps {r['nps']:>8,}  time {r['time']:7.2f}s"
+              f"  cut {r['cutoff_rate']:5.1f}%  1st {r['first_move_cutoff_rate']:5.1f}%"
+              f"  tt {r['tt_hits']:>8,}  eval cache {r['eval_cache_hit_rate']:5.1f}%", flush=True)
+
+    total_nodes = sum(r["nodes"] for r in results.values())
+    total_time = sum(r["time"] for r in results.values())
+    totals = {"nodes": total_nodes, "time": total_time,
+              "nps": int(total_nodes / total_time) if total_time > 0 else 0}
+    print(f"{'TOTAL':<20} nodes {total_nodes:>10,}  nps {totals['nps']:>8,}  time {total_time:7.2f}s")
+    return {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "depth": depth,
+        "eval_cache": eval_cache,
+        "positions": results,
+        "totals": totals,
+    }
+
+
+def compare(old_path, new_path):
+    """Affiche l'évolution (nœuds, nps, temps) entre deux fichiers de résultats."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+    print(f"{old.get('revision')} -> {new.get('revision')}  (profondeur {old['depth']} / {new['depth']})")
+
+    def delta(a, b):
+        return f"{(b - a) / a * 100:+7.1f}%" if a else "    n/a"
+
+    for name, after in new["positions"].items():
+        before = old["positions"].get(name)
+        if before is None:
+            continue
+        changed = "" if before["best_move"] == after["best_move"] else "  (coup différent)"
+        print(f"{name:<20} nodes {delta(before['nodes'], after['nodes'])}"
+              f"  nps {delta(before['nps'], after['nps'])}"
+              f"  time {delta(before['time'], after['time'])}{changed}")
+    print(f"{'TOTAL':<20} nodes {delta(old['totals']['nodes'], new['totals']['nodes'])}"
+          f"  nps {delta(old['totals']['nps'], new['totals']['nps'])}"
+          f"  time {delta(old['totals']['time'], new['totals']['time'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai de la recherche.")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--positions", nargs="*", help="sous-ensemble de positions")
+    parser.add_argument("--output", help="fichier JSON de résultats")
+    parser.add_argument("--eval-cache", type=int, default=EVAL_CACHE_SIZE,
+                        help="entrées du cache d'évaluation (0 : désactivé)")
+    parser.add_argument("--compare", nargs=2, metavar=("AVANT", "APRES"),
+                        help="compare deux fichiers de résultats")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    report = run(args.depth, args.positions, args.eval_cache)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Résultats écrits dans {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# tools/history_bench.py
+"""
+Mesure du coût de l'historique de partie sur une longue partie (200 demi-coups).
+
+Les coups viennent d'une partie du moteur contre lui-même à faible
+profondeur, après quelques demi-coups aléatoires (graine fixe) ; les règles
+de nullité ne sont pas appliquées pour que la partie dure. Pour chaque
+demi-coup on relève :
+    play     Game.play_move (coup joué + entrée du journal)
+    handoff  Game.get_position(), aller-retour pickle et Position.to_board() :
+             ce que coûte la transmission de la position à l'IA
+    deepcopy copy.deepcopy(board), l'ancienne copie, pour comparaison
+La partie est ensuite rejouée sous tracemalloc pour mesurer la mémoire
+retenue par le journal, puis entièrement annulée en vérifiant que l'on
+retrouve la position de départ.
+
+Usage :
+    python -m tools.history_bench --plies 200 --seed 1
+"""
+import argparse
+import copy
+import pickle
+import random
+import sys
+import time
+import tracemalloc
+
+from checkers.board import Board
+from checkers.game import Game
+from minimax.algorithm import get_possible_moves, run_ai_calculation
+from minimax.profiler import AIProfiler
+
+
+def choose_move(board, color, depth, rng, random_plies, ply):
+    """Coup aléatoire pendant l'ouverture, puis coup du moteur à `depth`."""
+    if ply < random_plies:
+        moves = get_possible_moves(board, color)
+        return rng.choice(moves) if moves else None
+    profiler = AIProfiler()
+    profiler.start_timer()
+    result = []
+    run_ai_calculation(board, color, profiler, result, {}, 0, None, depth)
+    return result[0][1] if result else None
+
+
+def _play(game, move):
+    piece, (row, col), details = move
+    skipped = details["skipped"] if isinstance(details, dict) else details
+    game.play_move(game.board.get_piece(piece.row, piece.col), row, col,
+                   [game.board.get_piece(p.row, p.col) for p in skipped])
+
+
+def _stats(samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    return mean * 1e6, samples[len(samples) // 2] * 1e6, samples[-1] * 1e6
+
+
+def run(plies, seed, depth, random_plies):
+    rng = random.Random(seed)
+    game = Game(None)
+    start_position = game.board.to_string()
+    timings = {"play": [], "handoff": [], "deepcopy": []}
+
+    # 1. Partie chronométrée
+    moves = []
+    for ply in range(plies):
+        move = choose_move(Board.from_snapshot(game.board.snapshot()), game.turn, depth,
+                           rng, random_plies, ply)
+        if move is None:
+            break
+        moves.append(move)
+        t0 = time.perf_counter()
+        _play(game, move)
+        t1 = time.perf_counter()
+        pickle.loads(pickle.dumps(game.get_position())).to_board()
+        t2 = time.perf_counter()
+        copy.deepcopy(game.board)
+        t3 = time.perf_counter()
+        timings["play"].append(t1 - t0)
+        timings["handoff"].append(t2 - t1)
+        timings["deepcopy"].append(t3 - t2)
+
+    # 2. Même partie rejouée sous tracemalloc : mémoire retenue par l'historique
+    game = Game(None)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for move in moves:
+        _play(game, move)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    # 3. Annulation complète
+    played = len(game.move_log)
+    t0 = time.perf_counter()
+    while game.move_log:
+        game._unplay_move()
+    undo_time = time.perf_counter() - t0
+    restored = game.board.to_string() == start_position and not game.position_history
+
+    print(f"demi-coups joués : {played}")
+    for name, samples in timings.items():
+        if samples:
+            mean, median, worst = _stats(samples)
+            print(f"{name:<10} moyenne {mean:8.1f} µs  médiane {median:8.1f} µs  max {worst:8.1f} µs")
+    print(f"mémoire retenue : {retained:,} octets ({retained / max(played, 1):,.0f} octets par demi-coup)")
+    print(f"annulation complète : {undo_time * 1e3:.2f} ms, position de départ retrouvée : "
+          f"{'oui' if restored else 'NON'}")
+    return restored
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Coût de l'historique de partie.")
+    parser.add_argument("--plies", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--depth", type=int, default=2, help="profondeur du moteur")
+    parser.add_argument("--random-plies", type=int, default=4,
+                        help="demi-coups aléatoires en début de partie")
+    args = parser.parse_args(argv)
+    return 0 if run(args.plies, args.seed, args.depth, args.random_plies) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
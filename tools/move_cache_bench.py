@@ -0,0 +1,135 @@
+# tools/move_cache_bench.py
+"""
+Banc d'essai du cache de coups (MoveCache de minimax/algorithm.py).
+
+Chaque position de tools/bench.py est cherchée deux fois à la même
+profondeur, sans puis avec le cache (vidé au départ). On relève le temps,
+le taux de succès et les évictions ; les nœuds doivent être identiques, le
+cache rendant les coups dans l'ordre de la génération.
+
+Le temps total d'une recherche varie de plusieurs pour cent d'un lancement
+à l'autre, plus que l'effet du cache. On mesure donc aussi, sur les
+positions rencontrées pendant la recherche, le coût moyen d'une génération,
+d'un encodage et d'un décodage (meilleur de plusieurs répétitions), d'où
+le bilan estimé : succès × (génération - décodage) - échecs × encodage.
+
+Le cache évite la génération (surtout la recherche récursive des rafles de
+dames) mais coûte un encodage à chaque échec et un décodage à chaque
+succès ; il ne paie que si succès / échecs > encodage / (génération -
+décodage). La table de transposition coupe déjà la plupart des nœuds
+transposés avant la génération, si bien que le taux de succès reste
+modeste ; les finales à plusieurs dames (KING_POSITIONS) ont la génération
+la plus chère mais aussi les listes les plus longues à décoder. Une
+taille trop petite (--size) se voit aux évictions.
+
+Usage :
+    python -m tools.move_cache_bench --depth 8 --size 100000
+"""
+import argparse
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax import algorithm
+from minimax.algorithm import (
+    _decode_moves, _encode_move, _generate_moves, clear_eval_cache, move_cache, pv_seed,
+    search_iteration, set_move_cache_size, transposition_table,
+)
+from minimax.profiler import AIProfiler
+from tools.bench import POSITIONS
+
+# Finales à plusieurs dames par camp, en plus des positions de tools/bench.py
+KING_POSITIONS = [
+    ("kings_4v3", "B..B......B.........W..W...B..W.", "w"),
+    ("kings_4v4", "..B..B...B....B.W.....W..W..W...", "w"),
+]
+
+
+def search(position, side, depth):
+    """Approfondissement itératif jusqu'à `depth` ; retourne (nœuds, secondes)."""
+    board = Board.from_string(position)
+    color = BLACK if side == "b" else CREAM
+    profiler = AIProfiler()
+    transposition_table.clear()
+    clear_eval_cache()
+    pv_seed.clear()
+    start = time.perf_counter()
+    for current_depth in range(1, depth + 1):
+        search_iteration(board, current_depth, color, profiler, {}, 0)
+    return profiler.nodes_visited, time.perf_counter() - start
+
+
+def record_positions(position, side, depth):
+    """Positions distinctes (instantané, trait) dont la recherche génère les coups."""
+    seen = {}
+    set_move_cache_size(0)
+
+    def recording(board, color):
+        seen[(board.snapshot(), color)] = None
+        return _generate_moves(board, color)
+
+    algorithm._generate_moves = recording
+    try:
+        search(position, side, depth)
+    finally:
+        algorithm._generate_moves = _generate_moves
+    return list(seen)
+
+
+def call_costs(positions, repeats=7):
+    """Coût moyen (µs) d'une génération, d'un encodage et d'un décodage sur `positions`."""
+    boards = [(Board.from_snapshot(snapshot), color) for snapshot, color in positions]
+    generated = [_generate_moves(board, color) for board, color in boards]
+    encoded = [tuple(_encode_move(move) for move in moves) for moves in generated]
+    costs = []
+    for run in (lambda: [_generate_moves(board, color) for board, color in boards],
+                lambda: [tuple(_encode_move(move) for move in moves) for moves in generated],
+                lambda: [_decode_moves(board, color, codes)
+                         for (board, color), codes in zip(boards, encoded)]):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        costs.append(best / len(boards) * 1e6)
+    return costs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai du cache de coups.")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--size", type=int, default=100_000, help="entrées du cache")
+    parser.add_argument("--positions", nargs="*", help="sous-ensemble de positions")
+    args = parser.parse_args(argv)
+
+    print(f"{'position':<20} {'sans':>8} {'avec':>8} {'gain':>7}  {'succès':>7} "
+          f"{'évictions':>10}  {'entrées':>8}  {'gén.':>6} {'enc.':>6} {'déc.':>6}  bilan estimé")
+    totals = [0.0, 0.0]
+    for name, position, side in POSITIONS + KING_POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        set_move_cache_size(0)
+        nodes, without = search(position, side, args.depth)
+        set_move_cache_size(args.size)
+        cached_nodes, with_cache = search(position, side, args.depth)
+        stats = move_cache.stats()
+        if cached_nodes != nodes:
+            print(f"{name} : {nodes} nœuds sans cache, {cached_nodes} avec", file=sys.stderr)
+            return 1
+        totals[0] += without
+        totals[1] += with_cache
+        generate, encode, decode = call_costs(record_positions(position, side, args.depth))
+        saved = (stats["hits"] * (generate - decode) - stats["misses"] * encode) / 1e6
+        print(f"{name:<20} {without:7.2f}s {with_cache:7.2f}s {(without / with_cache - 1) * 100:+6.1f}%"
+              f"  {stats['hit_rate']:6.1f}% {stats['evictions']:>10,}  {stats['entries']:>8,}"
+              f"  {generate:6.1f} {encode:6.1f} {decode:6.1f}  {saved:+.3f}s "
+              f"({saved / without * 100:+.1f}%)", flush=True)
+    set_move_cache_size(0)
+    print(f"{'TOTAL':<20} {totals[0]:7.2f}s {totals[1]:7.2f}s "
+          f"{(totals[0] / totals[1] - 1) * 100 if totals[1] else 0:+6.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+# tools/perft.py
+"""
+Perft : nombre de feuilles de l'arbre des coups légaux jusqu'à une profondeur.
+
+Sert à la fois de test de non-régression du générateur de coups
+(get_possible_moves, sauts des dames, prises des pions, règle de la prise
+maximale) et de mesure de son débit. Les feuilles sont comptées en bloc :
+à la profondeur 1 on compte les coups sans les jouer. L'option --hash
+mémorise les sous-arbres déjà comptés (clé Zobrist + trait + profondeur).
+
+Les règles de nullité (répétition, 40 coups) ne sont pas appliquées.
+
+Usage :
+    python -m tools.perft --depth 6                 # position de départ
+    python -m tools.perft --position <32 cases> --side b --depth 5 --divide
+    python -m tools.perft --check                   # comptes de référence
+    python -m tools.perft --check --hash --max-depth 0
+"""
+import argparse
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax.algorithm import apply_move, get_possible_moves, revert_move, zobrist_turn_black
+
+START_POSITION = "bbbbbbbbbbbb........wwwwwwwwwwww"
+
+# (nom, position, trait, [perft(1), perft(2), ...])
+# Ces comptes sont la sortie de ce générateur, relevés avec et sans --hash :
+# aucune source extérieure ne les confirme (les variantes à dames volantes
+# n'ont pas de perft publié sur 8x8). tests/test_movegen.py les recompte
+# jusqu'à la profondeur 5 avec un générateur de référence écrit à part ;
+# au-delà, ils détectent un changement de comportement, pas une erreur déjà
+# présente. Une correction voulue du générateur les fait régénérer.
+REFERENCE = [
+    ("start", START_POSITION, "w",
+     [7, 49, 302, 1469, 7361, 36473, 177532, 828777, 3860827]),
+    ("middlegame", "..bb..w..b.b.b....w.wbw.....w.w.", "w",
+     [8, 23, 98, 420, 1744, 8601, 38651, 206782, 1020378]),
+    ("king_endgame", "...B.....b.....W..w...........B.", "w",
+     [6, 70, 372, 3813, 19442, 188262, 1077061, 10595947]),
+    ("multi_capture_king", "b.B..b...bb..b.......b.w..w.W..w", "w",
+     [2, 14, 121, 930, 7223, 55792, 422178, 3196543, 23794038]),
+    ("multi_capture_man", ".b...b.b.....bb......b.bw.w...w.", "w",
+     [1, 6, 18, 93, 716, 3345, 27529, 130591, 1001931, 4978144, 36272723]),
+    # Deux prises de deux pièces différentes qui finissent sur la même case
+    ("equal_captures", "b......bb....bb......bb..w.ww..w", "w",
+     [2, 19, 79, 481, 2351, 15355, 76632, 490456]),
+]
+
+
+def perft(board, color, depth, cache=None):
+    """Nombre de feuilles à `depth` demi-coups ; `cache` (dict) active la table de hachage."""
+    if depth <= 1:
+        return len(get_possible_moves(board, color)) if depth == 1 else 1
+
+    key = None
+    if cache is not None:
+        key = (board.zobrist_hash ^ (zobrist_turn_black if color == BLACK else 0), depth)
+        count = cache.get(key)
+        if count is not None:
+            return count
+
+    next_color = CREAM if color == BLACK else BLACK
+    count = 0
+    for move in get_possible_moves(board, color):
+        undo = apply_move(board, move)
+        try:
+            count += perft(board, next_color, depth - 1, cache)
+        finally:
+            revert_move(board, undo)
+
+    if key is not None:
+        cache[key] = count
+    return count
+
+
+def divide(board, color, depth, cache=None):
+    """Perft détaillé par coup racine : liste de ((départ, arrivée), feuilles)."""
+    next_color = CREAM if color == BLACK else BLACK
+    results = []
+    for move in get_possible_moves(board, color):
+        start = (move[0].row, move[0].col)
+        undo = apply_move(board, move)
+        try:
+            results.append(((start, move[1]), perft(board, next_color, depth - 1, cache)))
+        finally:
+            revert_move(board, undo)
+    return results
+
+
+def check(max_depth=None, use_hash=False):
+    """Vérifie les comptes de référence ; retourne True si tout concorde."""
+    ok = True
+    for name, position, side, counts in REFERENCE:
+        board = Board.from_string(position)
+        color = BLACK if side == "b" else CREAM
+        for depth, expected in enumerate(counts, 1):
+            if max_depth is not None and depth > max_depth:
+                break
+            start = time.perf_counter()
+            count = perft(board, color, depth, {} if use_hash else None)
+            elapsed = time.perf_counter() - start
+            status = "ok" if count == expected else f"ERREUR (attendu {expected:,})"
+            ok = ok and count == expected
+            print(f"{name:<20} depth {depth}  {count:>12,}  {elapsed:7.3f}s  {status}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft du générateur de coups.")
+    parser.add_argument("--position", default=START_POSITION, help="position sur 32 cases")
+    parser.add_argument("--side", choices=("b", "w"), default="w", help="trait")
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--divide", action="store_true", help="détail par coup racine")
+    parser.add_argument("--hash", action="store_true", help="table de hachage des sous-arbres")
+    parser.add_argument("--check", action="store_true", help="vérifie les comptes de référence")
+    parser.add_argument("--max-depth", type=int, default=7,
+                        help="profondeur maximale vérifiée par --check (0 = toutes)")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return 0 if check(args.max_depth or None, args.hash) else 1
+
+    board = Board.from_string(args.position)
+    color = BLACK if args.side == "b" else CREAM
+    cache = {} if args.hash else None
+    start = time.perf_counter()
+    if args.divide:
+        results = divide(board, color, args.depth, cache)
+        for ((start_sq, end_sq), count) in results:
+            print(f"{start_sq} -> {end_sq}: {count:,}")
+        total = sum(count for _, count in results)
+    else:
+        total = perft(board, color, args.depth, cache)
+    elapsed = time.perf_counter() - start
+    rate = int(total / elapsed) if elapsed > 0 else 0
+    print(f"perft({args.depth}) = {total:,}  en {elapsed:.3f}s  ({rate:,} feuilles/s)")
+    if cache is not None:
+        print(f"entrées de la table de hachage : {len(cache):,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
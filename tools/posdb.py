@@ -0,0 +1,147 @@
+# tools/posdb.py
+"""
+Gestion des bases de positions binaires (checkers/database.py).
+
+    import   ajoute à une base les positions de parties PDN (.pdn : chaque
+             position jouée, avec le coup et le résultat) ou d'un corpus texte
+             (une position par ligne : FEN ou 32 cases + trait, puis résultat)
+    index    construit le fichier .idx (recherche par clé Zobrist)
+    info     nombre d'enregistrements, résultats, débit de lecture
+    export   réécrit la base en corpus texte (FEN résultat), sur la sortie standard
+    lookup   enregistrements d'une position donnée en FEN
+
+Usage :
+    python -m tools.posdb import parties.db partie1.pdn partie2.pdn corpus.txt
+    python -m tools.posdb index parties.db
+    python -m tools.posdb info parties.db
+    python -m tools.posdb lookup parties.db "W:W21-32:B1-12"
+"""
+import argparse
+import sys
+import time
+
+from checkers.database import (
+    RESULT_UNKNOWN, PositionDB, PositionDBWriter, build_index, decode_move, position_key,
+)
+from checkers.pdn import format_fen, parse_position, read_pdn, replay
+
+# Résultat vu de crème (Blanc)
+RESULTS = {"1-0": 1, "2-0": 1, "0-1": -1, "0-2": -1, "1/2-1/2": 0, "1-1": 0}
+RESULT_NAMES = {1: "1-0", -1: "0-1", 0: "1/2-1/2"}
+
+
+def import_pdn(writer, path):
+    games = errors = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for game in read_pdn(f):
+            result = RESULTS.get(game.result, RESULT_UNKNOWN)
+            try:
+                for position, move in replay(game):
+                    writer.append(position, result, move)
+            except ValueError as error:
+                errors += 1
+                print(f"{path} : partie {games + 1} ignorée à partir de l'erreur : {error}",
+                      file=sys.stderr)
+            games += 1
+    return games, errors
+
+
+def import_corpus(writer, path):
+    lines = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            text, result = line.rsplit(None, 1)
+            try:
+                writer.append(parse_position(text), RESULTS.get(result, RESULT_UNKNOWN))
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: ligne de corpus invalide : {line!r}")
+            lines += 1
+    return lines
+
+
+def cmd_import(args):
+    start = time.perf_counter()
+    with PositionDBWriter(args.db) as writer:
+        for path in args.inputs:
+            if path.lower().endswith(".pdn"):
+                games, errors = import_pdn(writer, path)
+                print(f"{path} : {games} parties ({errors} en erreur)")
+            else:
+                print(f"{path} : {import_corpus(writer, path):,} positions")
+        added = writer.count
+    elapsed = time.perf_counter() - start
+    print(f"{added:,} enregistrements ajoutés en {elapsed:.2f}s "
+          f"({added / elapsed if elapsed > 0 else 0:,.0f}/s)")
+    return 0
+
+
+def cmd_index(args):
+    start = time.perf_counter()
+    count = build_index(args.db)
+    print(f"{args.db}.idx : {count:,} entrées en {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+def cmd_info(args):
+    db = PositionDB(args.db)
+    results = {}
+    start = time.perf_counter()
+    for record in db:
+        results[record.result] = results.get(record.result, 0) + 1
+    elapsed = time.perf_counter() - start
+    print(f"{len(db):,} enregistrements, index {'à jour' if db.index is not None else 'absent'}")
+    for result, count in sorted(results.items(), reverse=True):
+        print(f"  {RESULT_NAMES.get(result, 'inconnu'):<8} {count:,}")
+    print(f"lecture : {elapsed:.2f}s ({len(db) / elapsed if elapsed > 0 else 0:,.0f} enregistrements/s)")
+    db.close()
+    return 0
+
+
+def cmd_export(args):
+    db = PositionDB(args.db)
+    out = sys.stdout
+    for record in db:
+        if record.result in RESULT_NAMES:
+            out.write(f"{format_fen(*record.snapshot, record.side)} {RESULT_NAMES[record.result]}\n")
+    db.close()
+    return 0
+
+
+def cmd_lookup(args):
+    db = PositionDB(args.db)
+    position = parse_position(args.position)
+    for i in db.lookup(position_key(*position[:5])):
+        record = db[i]
+        move = decode_move(record.move)
+        move_text = f"{move[0] + 1}{'x' if move[2] else '-'}{move[1] + 1}" if move else "-"
+        print(f"#{i}  coup {move_text}  résultat {RESULT_NAMES.get(record.result, 'inconnu')}")
+    db.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bases de positions binaires.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("import", help="ajoute des parties PDN ou un corpus texte")
+    command.add_argument("db")
+    command.add_argument("inputs", nargs="+")
+    command.set_defaults(run=cmd_import)
+    for name, run, help_text in (("index", cmd_index, "construit l'index par clé Zobrist"),
+                                 ("info", cmd_info, "statistiques de la base"),
+                                 ("export", cmd_export, "corpus texte sur la sortie standard")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("db")
+        command.set_defaults(run=run)
+    command = commands.add_parser("lookup", help="enregistrements d'une position")
+    command.add_argument("db")
+    command.add_argument("position", help="FEN ou 32 cases + trait")
+    command.set_defaults(run=cmd_lookup)
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# tools/render_bench.py
+"""
+Banc d'essai du dessin de l'interface (sans fenêtre : pilote SDL « dummy »).
+
+Compare, image par image, l'ancien dessin complet (fond, plateau, pièces,
+barre latérale et coordonnées redessinés, puis display.update() de toute
+la fenêtre) au dessin par rectangles modifiés de la boucle de main.py
+(BoardRenderer et barre latérale redessinée seulement si son contenu
+change, display.update() limité aux rectangles retournés).
+
+Deux scénarios : à l'arrêt (joueur au trait, une pièce sélectionnée et ses
+coups affichés) et pendant les animations de coups joués depuis la position
+de départ. On relève le temps CPU du processus par image (process_time) et
+les pixels envoyés à display.update() par image. Avec le pilote « dummy »,
+display.update() ne copie rien vers l'écran : sur un vrai affichage le gain
+est plus grand, en proportion des pixels évités.
+
+Enfin, le coût du dessin des 24 pièces de la position de départ (pions
+puis dames) : cercles et couronne redessinés (draw_piece_shapes) contre
+copie des sprites préparés (draw_piece_at).
+
+Usage :
+    python -m tools.render_bench --frames 600
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from checkers.constants import BROWN, CREAM, HEIGHT, WIDTH
+from checkers.render import (
+    draw_board, draw_coordinates, draw_move_marker, draw_piece_at, draw_piece_shapes,
+)
+from main import SIDEBAR_RECT, WIN, draw_sidebar, sidebar_state
+from checkers.game import Game
+
+
+class FullFrame:
+    """Dessin d'avant BoardRenderer : tout est redessiné à chaque image."""
+
+    def __call__(self, game):
+        if game.is_animating():
+            game._update_animation()
+        WIN.fill(BROWN)
+        draw_board(WIN, game.board, game.animation_data)
+        if not game.is_animating() and game.turn == game.player_color:
+            for row, col in game.valid_moves:
+                draw_move_marker(WIN, row, col)
+        draw_sidebar(WIN, game)
+        draw_coordinates(WIN)
+        pygame.display.update()
+        return WIDTH * HEIGHT
+
+
+class DirtyFrame:
+    """Dessin de main.py : rectangles modifiés seulement."""
+
+    def __init__(self):
+        self.sidebar = None
+
+    def __call__(self, game):
+        dirty = game.update()
+        state = sidebar_state(game)
+        if state != self.sidebar:
+            draw_sidebar(WIN, game)
+            self.sidebar = state
+            dirty.append(SIDEBAR_RECT)
+        pygame.display.update(dirty)
+        return sum(rect.width * rect.height for rect in dirty)
+
+
+def first_move(game):
+    """Sélectionne une pièce du joueur qui a un coup ; retourne sa première destination."""
+    for row, rank in enumerate(game.board.board):
+        for col, piece in enumerate(rank):
+            if piece and piece.color == game.player_color:
+                game.select(row, col)
+                if game.valid_moves:
+                    return next(iter(game.valid_moves))
+    return None
+
+
+def measure(frame, game, frames, animate):
+    """Temps CPU moyen (ms) et pixels mis à jour par image sur `frames` images."""
+    cpu = 0.0
+    pixels = 0
+    game.reset()
+    first_move(game)
+    for _ in range(frames):
+        if animate and not game.is_animating():
+            # Coup joué depuis la position de départ, rejoué à la fin de chaque animation
+            game.reset()
+            game.select(*first_move(game))
+        start = time.process_time()
+        pixels += frame(game)
+        cpu += time.process_time() - start
+    return cpu / frames * 1000, pixels / frames
+
+
+def piece_cost(draw, king, repeats=200, runs=5):
+    """Temps (ms, meilleur de `runs`) pour dessiner les 24 pièces de la position de départ."""
+    game = Game(WIN)
+    pieces = [(piece.color, piece.x, piece.y) for rank in game.board.board for piece in rank if piece]
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for color, x, y in pieces:
+                draw(WIN, color, king, x, y)
+        best = min(best, time.perf_counter() - start)
+    return best / repeats * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai du dessin de l'interface.")
+    parser.add_argument("--frames", type=int, default=600, help="images par mesure")
+    args = parser.parse_args(argv)
+
+    game = Game(WIN)
+    game.player_color = CREAM
+    print(f"{'scénario':<12} {'dessin':<10} {'CPU/image':>10} {'pixels/image':>13}")
+    for scenario, animate in (("arrêt", False), ("animation", True)):
+        results = []
+        for name, frame in (("complet", FullFrame()), ("modifié", DirtyFrame())):
+            game.invalidate()
+            frame(game)                     # première image : dessin complet dans les deux cas
+            cpu, pixels = measure(frame, game, args.frames, animate)
+            results.append(cpu)
+            print(f"{scenario:<12} {name:<10} {cpu:8.3f}ms {pixels:>13,.0f}", flush=True)
+        print(f"{'':<12} {'gain':<10} {results[0] / results[1] if results[1] else float('inf'):8.1f}x")
+
+    print(f"\n{'24 pièces':<12} {'cercles':>10} {'sprites':>10} {'gain':>7}")
+    for name, king in (("pions", False), ("dames", True)):
+        shapes, sprites = piece_cost(draw_piece_shapes, king), piece_cost(draw_piece_at, king)
+        print(f"{name:<12} {shapes:8.3f}ms {sprites:8.3f}ms {shapes / sprites:6.1f}x")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+# tools/selfplay.py
+"""
+Génération de positions annotées par parties du moteur contre lui-même.
+
+Chaque partie part de quelques demi-coups aléatoires puis est jouée par une
+recherche peu profonde ; les parties sont réparties sur tous les cœurs. On
+garde les positions calmes, celles où quiescenceSearch rend exactement
+l'évaluation statique (stand-pat) : aucune prise ne change l'évaluation, le
+résultat de la partie est donc une étiquette fiable pour le réglage. Chaque
+position est écrite avec le coup joué et le résultat de la partie dans une
+base binaire (checkers/database.py), que tools/tune.py lit directement.
+
+Reprise : l'état (parties terminées, nombre d'enregistrements) est écrit
+régulièrement dans <sortie>.progress ; relancer la même commande reprend
+là où elle s'était arrêtée, en tronquant les enregistrements écrits après
+le dernier point de reprise. Chaque partie a sa propre graine (--seed et
+numéro de partie) : l'ordre de fin des parties n'influe pas sur les données.
+
+Usage :
+    python -m tools.selfplay selfplay.db --games 10000 --depth 4
+    python -m tools.selfplay selfplay.db --games 20000 --depth 4   # reprend et complète
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.database import PositionDB, PositionDBWriter, truncate
+from minimax.algorithm import (
+    apply_move, get_possible_moves, move_to_key, quiescenceSearch, run_ai_calculation,
+    zobrist_turn_black,
+)
+from minimax.profiler import AIProfiler
+
+MAX_PLIES = 300         # au-delà, la partie est déclarée nulle
+CHECKPOINT_INTERVAL = 5.0
+# Paramètres qui doivent être identiques pour reprendre une génération
+RUN_PARAMETERS = ("seed", "depth", "random_plies", "sample")
+
+
+def _init_worker():
+    # Ctrl-C est traité par le processus principal, qui arrête le groupe
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def is_quiet(board, color, profiler):
+    """Vrai si la recherche de quiétude rend l'évaluation statique."""
+    stand_pat = board.evaluate(color)
+    return quiescenceSearch(board, float("-inf"), float("inf"), color, profiler) == stand_pat
+
+
+def play_game(task):
+    """
+    Joue une partie (exécuté dans un processus de travail). Retourne
+    (numéro, résultat vu de crème, [(position, coup)], demi-coups).
+    """
+    game_id, seed, depth, random_plies, sample = task
+    rng = random.Random(seed * 1_000_003 + game_id)
+    board = Board()
+    color = CREAM
+    history = {}
+    moves_since_capture = 0
+    profiler = AIProfiler()
+    samples = []
+
+    result = 0
+    ply = 0
+    while ply < MAX_PLIES:
+        outcome = board.winner(color, history, moves_since_capture)
+        if outcome is not None:
+            outcome = outcome.lower()
+            result = 1 if "cream wins" in outcome else -1 if "black wins" in outcome else 0
+            break
+
+        if ply < random_plies:
+            move = rng.choice(get_possible_moves(board, color))
+        else:
+            profiler.reset()
+            profiler.start_timer()
+            found = []
+            run_ai_calculation(board, color, profiler, found, history, moves_since_capture,
+                               None, depth)
+            move = found[0][1] or get_possible_moves(board, color)[0]
+            if rng.random() < sample and is_quiet(board, color, profiler):
+                samples.append((board.snapshot() + ('b' if color == BLACK else 'w',),
+                                move_to_key(move)))
+
+        capture = bool(apply_move(board, move)[4])
+        moves_since_capture = 0 if capture else moves_since_capture + 1
+        color = BLACK if color == CREAM else CREAM
+        key = board.zobrist_hash ^ (zobrist_turn_black if color == BLACK else 0)
+        history[key] = history.get(key, 0) + 1
+        ply += 1
+    return game_id, result, samples, ply
+
+
+# === Reprise ===
+def load_progress(path, parameters):
+    if not os.path.exists(path):
+        return {**parameters, "done": [], "records": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        progress = json.load(f)
+    for name in RUN_PARAMETERS:
+        if progress[name] != parameters[name]:
+            raise ValueError(f"{path} : {name} = {progress[name]!r} pour la génération en "
+                             f"cours, {parameters[name]!r} demandé")
+    return progress
+
+
+def save_progress(path, progress):
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(progress, f)
+    os.replace(temporary, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génération de positions par auto-jeu.")
+    parser.add_argument("output", help="base de positions (.db)")
+    parser.add_argument("--games", type=int, default=1000, help="nombre total de parties")
+    parser.add_argument("--depth", type=int, default=4, help="profondeur de recherche")
+    parser.add_argument("--random-plies", type=int, default=6,
+                        help="demi-coups aléatoires en début de partie")
+    parser.add_argument("--sample", type=float, default=1.0,
+                        help="probabilité de garder une position calme")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args(argv)
+
+    progress_path = args.output + ".progress"
+    parameters = {"seed": args.seed, "depth": args.depth, "random_plies": args.random_plies,
+                  "sample": args.sample}
+    try:
+        progress = load_progress(progress_path, parameters)
+    except ValueError as error:
+        parser.error(str(error))
+    if not os.path.exists(progress_path) and os.path.exists(args.output):
+        parser.error(f"{args.output} existe déjà sans {progress_path} : choisir une autre sortie")
+
+    # Les enregistrements écrits après le dernier point de reprise sont retirés
+    if os.path.exists(args.output):
+        db = PositionDB(args.output)
+        count = len(db)
+        db.close()
+        if count > progress["records"]:
+            truncate(args.output, progress["records"])
+            print(f"reprise : {count - progress['records']:,} enregistrements retirés")
+
+    done = set(progress["done"])
+    tasks = [(game_id, args.seed, args.depth, args.random_plies, args.sample)
+             for game_id in range(args.games) if game_id not in done]
+    print(f"{len(done)} parties déjà jouées, {len(tasks)} à jouer, {args.workers} processus")
+    if not tasks:
+        return 0
+
+    positions = plies = 0
+    records = progress["records"]
+    start = last_checkpoint = time.perf_counter()
+
+    def checkpoint():
+        writer.flush()
+        progress["done"] = sorted(done)
+        progress["records"] = records + writer.count
+        save_progress(progress_path, progress)
+        elapsed = time.perf_counter() - start
+        print(f"[{len(done)}/{args.games}] {positions:,} positions  "
+              f"{positions / elapsed:,.0f} pos/s  {plies / elapsed:,.0f} demi-coups/s", flush=True)
+
+    with PositionDBWriter(args.output) as writer, multiprocessing.Pool(args.workers, _init_worker) as pool:
+        try:
+            for game_id, result, samples, length in pool.imap_unordered(play_game, tasks):
+                for position, move in samples:
+                    writer.append(position, result, move)
+                positions += len(samples)
+                plies += length
+                done.add(game_id)
+                if time.perf_counter() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                    checkpoint()
+                    last_checkpoint = time.perf_counter()
+        except KeyboardInterrupt:
+            pool.terminate()
+            print("interrompu : relancer la même commande pour reprendre")
+        checkpoint()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
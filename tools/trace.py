@@ -0,0 +1,50 @@
+# tools/trace.py
+"""
+Recherche tracée sur une position : nœuds par ply et de quiétude, temps par
+phase (génération de coups, évaluation, TT, jouer/défaire) et facteur de
+branchement effectif de chaque itération (voir minimax/trace.py).
+
+Usage :
+    python -m tools.trace --depth 8 --json trace.json --folded trace.folded
+    flamegraph.pl trace.folded > trace.svg
+"""
+import argparse
+import sys
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from minimax import algorithm
+from minimax.profiler import AIProfiler
+from minimax.trace import SearchTracer
+
+START_POSITION = "bbbbbbbbbbbb........wwwwwwwwwwww"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recherche tracée sur une position.")
+    parser.add_argument("--position", default=START_POSITION, help="position sur 32 cases")
+    parser.add_argument("--side", choices=("b", "w"), default="w", help="trait")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--json", help="fichier JSON de résultats")
+    parser.add_argument("--folded", help="piles repliées pour flamegraph")
+    args = parser.parse_args(argv)
+
+    board = Board.from_string(args.position)
+    color = BLACK if args.side == "b" else CREAM
+    profiler = AIProfiler()
+    profiler.start_timer()
+    result = []
+    with SearchTracer() as tracer:
+        algorithm.run_ai_calculation(board, color, profiler, result, {}, 0, None, args.depth)
+    profiler.stop_timer()
+
+    tracer.display()
+    if args.json:
+        tracer.write_json(args.json)
+    if args.folded:
+        tracer.write_folded(args.folded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# tools/train_nnue.py
+"""
+Entraînement du réseau NNUE (minimax/nnue.py) sur des positions annotées.
+
+Le corpus est celui de tools/tune.py : de préférence une base binaire
+produite par tools/selfplay.py (positions calmes et résultat de la partie),
+ou un corpus texte. Comme pour le réglage de Texel, l'erreur minimisée est
+l'écart quadratique entre le résultat (score noir) et sigmoid(K * sortie),
+K étant ajusté une fois sur l'évaluation classique pour que le réseau
+garde la même échelle (en pions). Descente de gradient Adam par lots,
+avec NumPy ; une part du corpus est gardée pour la validation.
+
+Le réseau est ensuite quantifié en int16 ; l'erreur de validation est
+donnée avant et après quantification, et comparée à celle de l'évaluation
+classique.
+
+Usage :
+    python -m tools.selfplay selfplay.db --games 20000 --depth 4
+    python -m tools.train_nnue selfplay.db --epochs 30 --output minimax/nnue.npz
+    python -m tools.arena "depth=6,nnue=minimax/nnue.npz" "depth=6" --games 1000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from checkers.board import Board
+from checkers.constants import BLACK
+from minimax import nnue
+from tools.tune import fit_k, read_corpus
+
+
+def build_inputs(entries):
+    """Entrées binaires (une ligne par position, uint8) et résultats noirs."""
+    inputs = np.zeros((len(entries), nnue.INPUTS), dtype=np.uint8)
+    results = np.empty(len(entries), dtype=np.float32)
+    for i, (snapshot, color, result) in enumerate(entries):
+        inputs[i, nnue.snapshot_features(snapshot)] = 1
+        results[i] = result
+    return inputs, results
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -60.0, 60.0)))
+
+
+def forward(params, x):
+    w1, b1, w2, b2 = params
+    z = x @ w1 + b1
+    h = np.clip(z, 0.0, 1.0)
+    return z, h, h @ w2 + b2
+
+
+def error(output, results, k):
+    return float(np.mean((_sigmoid(k * output) - results) ** 2))
+
+
+def quantised_output(network, inputs):
+    values = inputs.astype(np.int32) @ network.w1.astype(np.int32) + network.b1
+    hidden = np.clip(values, 0, nnue.QA)
+    return (hidden @ network.w2 + network.b2) / (nnue.QA * nnue.QB)
+
+
+def train(inputs, results, k, hidden, epochs, batch_size, lr, seed, validation):
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(inputs))
+    split = int(len(inputs) * (1.0 - validation))
+    train_index, valid_index = order[:split], order[split:]
+    valid_x = inputs[valid_index].astype(np.float32)
+    valid_r = results[valid_index]
+
+    params = [rng.normal(0.0, 1.0 / np.sqrt(12), (nnue.INPUTS, hidden)).astype(np.float32),
+              np.full(hidden, 0.5, dtype=np.float32),
+              rng.normal(0.0, 1.0 / np.sqrt(hidden), hidden).astype(np.float32),
+              np.float32(0.0)]
+    m = [np.zeros_like(p) for p in params]
+    v = [np.zeros_like(p) for p in params]
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    step = 0
+
+    for epoch in range(1, epochs + 1):
+        start = time.perf_counter()
+        rng.shuffle(train_index)
+        total = 0.0
+        for first in range(0, len(train_index), batch_size):
+            batch = train_index[first:first + batch_size]
+            x = inputs[batch].astype(np.float32)
+            r = results[batch]
+            z, h, out = forward(params, x)
+            s = _sigmoid(k * out)
+            total += float(np.sum((s - r) ** 2))
+
+            d_out = 2.0 * (s - r) * s * (1.0 - s) * k / len(batch)
+            d_z = np.outer(d_out, params[2]) * ((z > 0.0) & (z < 1.0))
+            grads = [x.T @ d_z, d_z.sum(axis=0), h.T @ d_out, np.float32(d_out.sum())]
+
+            step += 1
+            for i, grad in enumerate(grads):
+                m[i] = beta1 * m[i] + (1 - beta1) * grad
+                v[i] = beta2 * v[i] + (1 - beta2) * grad ** 2
+                m_hat = m[i] / (1 - beta1 ** step)
+                v_hat = v[i] / (1 - beta2 ** step)
+                params[i] = (params[i] - lr * m_hat / (np.sqrt(v_hat) + eps)).astype(np.float32)
+
+        valid = error(forward(params, valid_x)[2], valid_r, k) if len(valid_index) else float("nan")
+        print(f"  epoch {epoch:3d}  error {total / len(train_index):.6f}  "
+              f"validation {valid:.6f}  ({time.perf_counter() - start:.1f}s)", flush=True)
+    return params, valid_index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Entraînement du réseau NNUE.")
+    parser.add_argument("corpus", help="base binaire (tools/selfplay.py) ou corpus texte")
+    parser.add_argument("--output", default=nnue.NETWORK_PATH, help="réseau produit (.npz)")
+    parser.add_argument("--hidden", type=int, default=nnue.HIDDEN, help="neurones cachés")
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--lr", type=float, default=0.001, help="pas d'Adam")
+    parser.add_argument("--k", type=float, default=None,
+                        help="K fixé (sinon ajusté sur l'évaluation classique)")
+    parser.add_argument("--validation", type=float, default=0.05,
+                        help="part du corpus gardée pour la validation")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    entries = read_corpus(args.corpus)
+    if not entries:
+        parser.error("corpus vide")
+    inputs, results = build_inputs(entries)
+    classic = np.array([Board.from_snapshot(snapshot).evaluate(BLACK)
+                        for snapshot, _, _ in entries], dtype=np.float32)
+    k = args.k if args.k is not None else fit_k(classic.tolist(), results.tolist())
+    print(f"{len(entries):,} positions, {args.hidden} neurones cachés, K = {k:.4f}")
+
+    params, valid_index = train(inputs, results, k, args.hidden, args.epochs,
+                                args.batch_size, args.lr, args.seed, args.validation)
+
+    network = nnue.Network.from_float(*params)
+    nnue.save_network(network, args.output)
+    if len(valid_index):
+        x, r = inputs[valid_index], results[valid_index]
+        print(f"validation : évaluation classique {error(classic[valid_index], r, k):.6f}  "
+              f"réseau {error(forward(params, x.astype(np.float32))[2], r, k):.6f}  "
+              f"quantifié {error(quantised_output(network, x), r, k):.6f}")
+    print(f"Réseau écrit dans {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+# tools/tune.py
+"""
+Réglage hors ligne des poids d'évaluation (méthode de Texel).
+
+Le corpus est un fichier texte, une position par ligne :
+
+    <position sur 32 cases> <trait : b|w> <résultat : 1-0 | 0-1 | 1/2-1/2>
+    <FEN> <résultat>
+
+La position suit Board.to_string() ou la FEN de checkers/pdn.py ; le
+résultat est celui de la partie, "1-0" signifiant une victoire crème (w).
+Les lignes vides ou commençant par '#' sont ignorées. Le corpus peut aussi
+être une base binaire (checkers/database.py, voir tools/posdb.py) : les
+positions de résultat connu y sont lues sans analyse de texte.
+
+Chaque tour de réglage :
+    1. résout chaque position jusqu'à sa feuille calme (recherche de
+       quiétude) avec les poids courants, en parallèle sur plusieurs processus ;
+    2. ajuste les poids sur ces feuilles, l'évaluation étant linéaire dans
+       les poids (voir minimax/evaluation.py), par descente de gradient (Adam)
+       ou par descente par coordonnées ;
+L'erreur minimisée est l'écart quadratique entre le résultat et
+sigmoid(K * évaluation), K étant ajusté une fois au départ.
+
+Usage :
+    python -m tools.tune corpus.txt --output minimax/weights.json
+"""
+import argparse
+import math
+import multiprocessing
+import sys
+import time
+
+from checkers.board import Board
+from checkers.constants import BLACK, CREAM
+from checkers.database import MAGIC, PositionDB
+from checkers.pdn import parse_position
+from minimax.algorithm import get_capture_moves
+from minimax.evaluation import (
+    PARAMETER_NAMES, WEIGHTS_PATH, extract_features, get_weights,
+    load_weights, save_weights, set_weights, vector_to_weights,
+    weights_to_vector,
+)
+
+RESULTS = {"1-0": 0.0, "0-1": 1.0, "1/2-1/2": 0.5}  # score du camp noir
+
+
+def read_corpus(path):
+    """Retourne la liste des (bitboards de la position, couleur au trait, résultat noir)."""
+    with open(path, "rb") as f:
+        binary = f.read(len(MAGIC)) == MAGIC
+    if binary:
+        db = PositionDB(path)
+        entries = [(record.snapshot, BLACK if record.black_to_move else CREAM,
+                    (1 - record.result) / 2)
+                   for record in db if -1 <= record.result <= 1]
+        db.close()
+        return entries
+
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                text, result = line.rsplit(None, 1)
+                position = parse_position(text)
+                entries.append((position[:4], position.turn, RESULTS[result]))
+            except (ValueError, KeyError):
+                raise ValueError(f"{path}:{line_number}: ligne de corpus invalide : {line!r}")
+    return entries
+
+
+# === Résolution des positions (processus de travail) ===
+def _quiet_leaf(board, alpha, beta, color):
+    """
+    Même recherche que quiescenceSearch, mais retourne aussi les
+    caractéristiques de la feuille calme qui justifie le score.
+    """
+    stand_pat = board.evaluate(color)
+    if stand_pat >= beta:
+        return beta, extract_features(board)
+    if alpha < stand_pat:
+        alpha = stand_pat
+
+    best_leaf = None
+    next_color = CREAM if color == BLACK else BLACK
+    for piece, moves in get_capture_moves(board, color).items():
+        for (end_row, end_col), details in moves:
+            skipped = details["skipped"] if isinstance(details, dict) else details
+            start_row, start_col = piece.row, piece.col
+            removed = board.remove_and_get_skipped(skipped)
+            was_promoted = board.make_move(piece, end_row, end_col)
+            try:
+                score, leaf = _quiet_leaf(board, -beta, -alpha, next_color)
+            finally:
+                board.undo_move(piece, start_row, start_col, was_promoted)
+                board.restore_skipped(removed)
+            score = -score
+            if score >= beta:
+                return beta, leaf
+            if score > alpha:
+                alpha = score
+                best_leaf = leaf
+
+    if best_leaf is None:
+        best_leaf = extract_features(board)
+    return alpha, best_leaf
+
+
+def _resolve_chunk(chunk):
+    leaves = []
+    for position, color, _ in chunk:
+        board = Board.from_snapshot(position)
+        leaves.append(_quiet_leaf(board, float("-inf"), float("inf"), color)[1])
+    return leaves
+
+
+def resolve_leaves(entries, weights, workers, chunk_size=256):
+    """Caractéristiques des feuilles calmes de toutes les positions, en parallèle."""
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    if workers <= 1:
+        set_weights(weights)
+        results = map(_resolve_chunk, chunks)
+        return [leaf for leaves in results for leaf in leaves]
+    with multiprocessing.Pool(workers, initializer=set_weights, initargs=(weights,)) as pool:
+        return [leaf for leaves in pool.imap(_resolve_chunk, chunks) for leaf in leaves]
+
+
+# === Erreur et optimisation ===
+def _sigmoid(x):
+    if x < -500:
+        return 0.0
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+def _evals(vector, leaves):
+    return [sum(w * f for w, f in zip(vector, leaf) if f) for leaf in leaves]
+
+
+def mean_error(evals, results, k):
+    return sum((r - _sigmoid(k * e)) ** 2 for e, r in zip(evals, results)) / len(results)
+
+
+def fit_k(evals, results, low=0.01, high=10.0, iterations=60):
+    """Ajuste K par recherche ternaire (l'erreur est unimodale en K)."""
+    for _ in range(iterations):
+        m1 = low + (high - low) / 3
+        m2 = high - (high - low) / 3
+        if mean_error(evals, results, m1) < mean_error(evals, results, m2):
+            high = m2
+        else:
+            low = m1
+    return (low + high) / 2
+
+
+def gradient_descent(vector, leaves, results, k, epochs, lr, frozen, log_every=20):
+    """Descente de gradient Adam sur l'erreur quadratique."""
+    n = len(leaves)
+    m = [0.0] * len(vector)
+    v = [0.0] * len(vector)
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    for epoch in range(1, epochs + 1):
+        grad = [0.0] * len(vector)
+        error = 0.0
+        for leaf, result in zip(leaves, results):
+            s = _sigmoid(k * sum(w * f for w, f in zip(vector, leaf) if f))
+            error += (result - s) ** 2
+            g = 2.0 * (s - result) * s * (1.0 - s) * k / n
+            for i, f in enumerate(leaf):
+                if f:
+                    grad[i] += g * f
+        for i in range(len(vector)):
+            if i in frozen:
+                continue
+            m[i] = beta1 * m[i] + (1 - beta1) * grad[i]
+            v[i] = beta2 * v[i] + (1 - beta2) * grad[i] ** 2
+            m_hat = m[i] / (1 - beta1 ** epoch)
+            v_hat = v[i] / (1 - beta2 ** epoch)
+            vector[i] -= lr * m_hat / (math.sqrt(v_hat) + eps)
+        if epoch % log_every == 0 or epoch == epochs:
+            print(f"  epoch {epoch:4d}  error {error / n:.6f}")
+    return vector
+
+
+def coordinate_descent(vector, leaves, results, k, epochs, step, frozen):
+    """Recherche locale de Texel : +/- step sur chaque poids tant que l'erreur baisse."""
+    evals = _evals(vector, leaves)
+    best = mean_error(evals, results, k)
+    columns = [[leaf[i] for leaf in leaves] for i in range(len(vector))]
+    for epoch in range(1, epochs + 1):
+        improved = False
+        for i in range(len(vector)):
+            if i in frozen or not any(columns[i]):
+                continue
+            for delta in (step, -step):
+                trial = [e + delta * f for e, f in zip(evals, columns[i])]
+                error = mean_error(trial, results, k)
+                if error < best:
+                    best, evals = error, trial
+                    vector[i] += delta
+                    improved = True
+                    break
+        print(f"  pass {epoch:4d}  error {best:.6f}")
+        if not improved:
+            break
+    return vector
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réglage des poids d'évaluation (Texel).")
+    parser.add_argument("corpus", help="fichier de positions annotées")
+    parser.add_argument("--weights", default=WEIGHTS_PATH, help="poids de départ")
+    parser.add_argument("--output", default=WEIGHTS_PATH, help="fichier de poids produit")
+    parser.add_argument("--method", choices=("gradient", "coordinate"), default="gradient")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="nombre de résolutions des feuilles calmes")
+    parser.add_argument("--epochs", type=int, default=200,
+                        help="itérations d'optimisation par tour")
+    parser.add_argument("--lr", type=float, default=0.01, help="pas d'Adam")
+    parser.add_argument("--step", type=float, default=0.01,
+                        help="pas de la descente par coordonnées")
+    parser.add_argument("--k", type=float, default=None, help="K fixé (sinon ajusté)")
+    parser.add_argument("--freeze", nargs="*", default=["man"],
+                        help="paramètres non réglés (voir PARAMETER_NAMES)")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args(argv)
+
+    unknown = set(args.freeze) - set(PARAMETER_NAMES)
+    if unknown:
+        parser.error(f"paramètres inconnus : {', '.join(sorted(unknown))}")
+    frozen = {PARAMETER_NAMES.index(name) for name in args.freeze}
+
+    entries = read_corpus(args.corpus)
+    if not entries:
+        parser.error("corpus vide")
+    results = [result for _, _, result in entries]
+    weights = load_weights(args.weights)
+    vector = weights_to_vector(weights)
+    print(f"{len(entries):,} positions, {len(vector)} paramètres, {args.workers} processus")
+
+    k = args.k
+    for round_number in range(1, args.rounds + 1):
+        start = time.perf_counter()
+        leaves = resolve_leaves(entries, vector_to_weights(vector), args.workers)
+        print(f"round {round_number}: feuilles résolues en {time.perf_counter() - start:.1f}s")
+        if k is None:
+            k = fit_k(_evals(vector, leaves), results)
+            print(f"K = {k:.4f}")
+        print(f"  erreur initiale {mean_error(_evals(vector, leaves), results, k):.6f}")
+        if args.method == "gradient":
+            vector = gradient_descent(vector, leaves, results, k, args.epochs, args.lr, frozen)
+        else:
+            vector = coordinate_descent(vector, leaves, results, k, args.epochs, args.step, frozen)
+
+    save_weights(vector_to_weights(vector), args.output)
+    set_weights(vector_to_weights(vector))
+    print(f"Poids écrits dans {args.output}")
+    for name, value in zip(PARAMETER_NAMES, weights_to_vector(get_weights())):
+        if not name.startswith("pst_"):
+            print(f"  {name:<14} {value: .4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())